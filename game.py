@@ -1,5 +1,20 @@
+import time
+
+start = time.perf_counter()
+
+import argparse
 import pygame
 from gameoflife.game import Game
+from gameoflife.startup import StartupProfile
+
+parser = argparse.ArgumentParser(description="Game of Life")
+parser.add_argument("--profile-startup", action="store_true", help="print the time spent in each startup phase")
+args = parser.parse_args()
+
+startup = None
+if args.profile_startup:
+    startup = StartupProfile(start)
+    startup.mark("imports")
 
-Game().loop()
+Game(startup).loop()
 pygame.quit()
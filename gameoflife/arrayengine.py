@@ -0,0 +1,179 @@
+"""Whole-board engine on NumPy arrays, with a compiled kernel when Numba is
+installed.
+
+Both are optional dependencies: ``gameoflife.engine.arrayBackend()`` tells
+whether this engine can be used without importing either of them, and
+``createEngine()`` only imports this module when it is asked for.
+
+With Numba the neighbor count and the rule lookup are fused into a single
+pass over the board that writes straight into the next-state buffer, split
+into row ranges across threads. Without it the same step is done with whole
+array NumPy operations writing into buffers allocated once per board size.
+"""
+
+import numpy
+
+from typing import List, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.engine import Engine, EngineName
+from gameoflife.rule import Rule
+from gameoflife.topology import Topology
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+_TOPOLOGIES = {Topology.DEAD: 0, Topology.TORUS: 1, Topology.KLEIN: 2}
+
+
+if numba is not None:
+
+    @numba.njit(nogil=True, cache=True, inline="always")
+    def _wrapped(cells, y, x, topology):  # pragma: no cover - compiled
+        """Live neighbors of a border cell, following the topology."""
+        (rows, cols) = cells.shape
+        n = 0
+        for dy in range(-1, 2):
+            ny = y + dy
+            mirror = False
+            if ny < 0 or ny >= rows:
+                if topology == 0:
+                    continue
+                mirror = topology == 2
+                ny %= rows
+            for dx in range(-1, 2):
+                if dx == 0 and dy == 0:
+                    continue
+                nx = x + dx
+                if mirror:
+                    nx = cols - 1 - nx
+                if nx < 0 or nx >= cols:
+                    if topology == 0:
+                        continue
+                    nx %= cols
+                if cells[ny, nx] == 1:
+                    n += 1
+        return n
+
+    @numba.njit(parallel=True, nogil=True, cache=True)
+    def _fusedStep(cells, out, table, topology):  # pragma: no cover - compiled
+        (rows, cols) = cells.shape
+        for y in numba.prange(rows):
+            if y == 0 or y == rows - 1 or cols < 3:
+                for x in range(cols):
+                    out[y, x] = table[cells[y, x] * 9 + _wrapped(cells, y, x, topology)]
+                continue
+            up = cells[y - 1]
+            here = cells[y]
+            down = cells[y + 1]
+            out[y, 0] = table[here[0] * 9 + _wrapped(cells, y, 0, topology)]
+            for x in range(1, cols - 1):
+                n = (
+                    (up[x - 1] == 1) + (up[x] == 1) + (up[x + 1] == 1)
+                    + (here[x - 1] == 1) + (here[x + 1] == 1)
+                    + (down[x - 1] == 1) + (down[x] == 1) + (down[x + 1] == 1)
+                )
+                out[y, x] = table[here[x] * 9 + n]
+            out[y, cols - 1] = table[here[cols - 1] * 9 + _wrapped(cells, y, cols - 1, topology)]
+
+    @numba.njit(nogil=True, cache=True)
+    def _commit(cells, out, births, deaths):  # pragma: no cover - compiled
+        """Copy ``out`` into ``cells`` and record the births and deaths on the way."""
+        nb = 0
+        nd = 0
+        for pos in range(cells.size):
+            before = cells[pos] == 1
+            after = out[pos] == 1
+            # Written unconditionally and kept by advancing the count, so
+            # the loop has no branches to mispredict on a noisy board.
+            births[nb] = pos
+            nb += after and not before
+            deaths[nd] = pos
+            nd += before and not after
+            cells[pos] = out[pos]
+        return (nb, nd)
+
+
+class ArrayEngine(Engine):
+    """Steps every cell of the board each generation; best for big busy boards.
+
+    ``useNumba=False`` forces the NumPy kernel even when Numba is installed.
+    """
+
+    NAME = EngineName.ARRAY
+
+    def __init__(self, useNumba: bool = True) -> None:
+        self._backend = "numba" if useNumba and numba is not None else "numpy"
+        self._shape: Union[Tuple[int, int], None] = None
+        self._tables = {}
+
+    def describe(self) -> str:
+        return self._backend
+
+    def getBackend(self) -> str:
+        return self._backend
+
+    def _allocate(self, cols: int, rows: int) -> None:
+        self._shape = (rows, cols)
+        self._next = numpy.zeros((rows, cols), dtype=numpy.uint8)
+        if self._backend == "numba":
+            self._births = numpy.empty(rows * cols, dtype=numpy.int64)
+            self._deaths = numpy.empty(rows * cols, dtype=numpy.int64)
+        else:
+            self._padded = numpy.zeros((rows + 2, cols + 2), dtype=numpy.uint8)
+            self._count = numpy.zeros((rows, cols), dtype=numpy.uint8)
+            self._index = numpy.zeros((rows, cols), dtype=numpy.uint16)
+
+    def _table(self, rule: Rule) -> numpy.ndarray:
+        table = self._tables.get(rule)
+        if table is None:
+            table = self._tables[rule] = numpy.frombuffer(rule.getTable(), dtype=numpy.uint8)
+        return table
+
+    def step(
+        self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str
+    ) -> Tuple[List[int], List[int]]:
+        if self._shape != (rows, cols):
+            self._allocate(cols, rows)
+        board = numpy.frombuffer(cells, dtype=numpy.uint8).reshape(rows, cols)
+        table = self._table(rule)
+        if self._backend == "numba":
+            _fusedStep(board, self._next, table, _TOPOLOGIES[topology])
+            (nb, nd) = _commit(board.reshape(-1), self._next.reshape(-1), self._births, self._deaths)
+            return (self._births[:nb].tolist(), self._deaths[:nd].tolist())
+
+        self._numpyStep(board, table, topology)
+        after = self._next
+        births = numpy.flatnonzero((after == CellState.ALIVE) & (board != CellState.ALIVE)).tolist()
+        deaths = numpy.flatnonzero((board == CellState.ALIVE) & (after != CellState.ALIVE)).tolist()
+        board[...] = after
+        return (births, deaths)
+
+    def _numpyStep(self, board: numpy.ndarray, table: numpy.ndarray, topology: str) -> None:
+        padded = self._padded
+        numpy.equal(board, CellState.ALIVE, out=padded[1:-1, 1:-1], casting="unsafe")
+        if topology != Topology.DEAD:
+            padded[1:-1, 0] = padded[1:-1, -2]
+            padded[1:-1, -1] = padded[1:-1, 1]
+            if topology == Topology.TORUS:
+                padded[0] = padded[-2]
+                padded[-1] = padded[1]
+            else:
+                padded[0] = padded[-2, ::-1]
+                padded[-1] = padded[1, ::-1]
+        else:
+            # The ring may still hold wrapped neighbors from another topology.
+            padded[0] = padded[-1] = 0
+            padded[:, 0] = padded[:, -1] = 0
+
+        count = self._count
+        numpy.add(padded[:-2, :-2], padded[:-2, 1:-1], out=count)
+        for (dy, dx) in ((0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)):
+            numpy.add(count, padded[dy:dy + count.shape[0], dx:dx + count.shape[1]], out=count)
+        index = self._index
+        numpy.multiply(board, 9, out=index, dtype=numpy.uint16)
+        numpy.add(index, count, out=index)
+        numpy.take(table, index, out=self._next)
@@ -0,0 +1,26 @@
+import pygame
+
+from pygame.freetype import Font, SysFont
+from pygame.surface import Surface
+from typing import Dict, Tuple
+
+
+_fonts: Dict[Tuple[str, int], Font] = {}
+_images: Dict[str, Surface] = {}
+
+
+def getFont(name: str, size: int) -> Font:
+    """Return the system font ``name`` at ``size``, matching it only once per process."""
+    key = (name.lower(), size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = SysFont(name, size)
+    return font
+
+
+def getImage(path: str) -> Surface:
+    """Return the image at ``path``, loading it only once per process."""
+    image = _images.get(path)
+    if image is None:
+        image = _images[path] = pygame.image.load(path)
+    return image
@@ -0,0 +1,139 @@
+import glob
+import os
+import queue
+import threading
+import time
+
+from typing import Union
+
+from gameoflife.save import BoardSnapshot, writeSnapshot
+
+
+class AutosaveStats:
+    def __init__(self) -> None:
+        self.saves: int = 0
+        self.skipped: int = 0
+        self.errors: int = 0
+        self.lastBytes: int = 0
+        self.lastSeconds: float = 0.0
+        self.lastPath: Union[str, None] = None
+        self.lastError: Union[str, None] = None
+        self.totalBytes: int = 0
+
+    def toDict(self) -> dict:
+        return {
+            "saves": self.saves,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "lastBytes": self.lastBytes,
+            "lastSeconds": self.lastSeconds,
+            "lastPath": self.lastPath,
+            "lastError": self.lastError,
+            "totalBytes": self.totalBytes,
+        }
+
+
+class Autosave:
+    """Periodically writes board snapshots from a background thread.
+
+    The game loop only ever calls ``submit()``, which hands an immutable
+    snapshot to the writer thread without blocking. Compression, disk I/O,
+    the atomic rename and pruning of old saves all happen on the writer.
+    If the writer is still busy with the previous save the new snapshot is
+    dropped and counted in ``stats()['skipped']`` rather than stalling the loop.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        interval: float = 300,
+        retention: int = 5,
+        prefix: str = "autosave",
+        compresslevel: int = 6,
+    ) -> None:
+        self._directory = directory
+        self._interval = interval
+        self._retention = retention
+        self._prefix = prefix
+        self._compresslevel = compresslevel
+        self._lastSubmit = time.monotonic()
+        self._lastCells: Union[bytes, None] = None
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=1)
+        self._stats = AutosaveStats()
+        self._thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+        self._thread.start()
+
+    def due(self) -> bool:
+        return time.monotonic() - self._lastSubmit >= self._interval
+
+    def submit(self, snapshot: BoardSnapshot) -> bool:
+        self._lastSubmit = time.monotonic()
+        cells = snapshot.getCells()
+        if cells == self._lastCells:
+            return False
+        try:
+            self._queue.put_nowait(snapshot)
+        except queue.Full:
+            with self._lock:
+                self._stats.skipped += 1
+            return False
+        self._lastCells = cells
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._stats.toDict()
+
+    def close(self, timeout: Union[float, None] = None) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def path(self, snapshot: BoardSnapshot) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        name = f"{self._prefix}-{stamp}-gen{snapshot.getGeneration()}.json.gz"
+        return os.path.join(self._directory, name)
+
+    def prune(self) -> None:
+        if self._retention <= 0:
+            return
+        saves = sorted(glob.glob(os.path.join(self._directory, f"{self._prefix}-*.json.gz")), key=os.path.getmtime)
+        for path in saves[:-self._retention]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _worker(self) -> None:
+        while True:
+            snapshot = self._queue.get()
+            if snapshot is None:
+                return
+            # Whatever goes wrong with one save, the writer stays up for the
+            # next; a dead writer would leave every later submit() skipped.
+            path = None
+            start = time.perf_counter()
+            try:
+                path = self.path(snapshot)
+                written = writeSnapshot(path, snapshot, self._compresslevel)
+            except Exception as e:
+                self._failed(f'write "{path}"', e)
+                continue
+            elapsed = time.perf_counter() - start
+            try:
+                self.prune()
+            except Exception as e:
+                self._failed("prune old saves", e)
+            with self._lock:
+                self._stats.saves += 1
+                self._stats.lastBytes = written
+                self._stats.lastSeconds = elapsed
+                self._stats.lastPath = path
+                self._stats.totalBytes += written
+            print(f'autosave wrote {written} bytes to "{path}" in {elapsed * 1000:.1f} ms')
+
+    def _failed(self, action: str, error: Exception) -> None:
+        with self._lock:
+            self._stats.errors += 1
+            self._stats.lastError = f"{type(error).__name__}: {error}"
+        print(f"autosave failed to {action}: {type(error).__name__}: {error}")
@@ -4,11 +4,11 @@ import pygame
 from pygame import Surface, draw
 from pygame.event import Event
 from pygame.font import Font
-from pygame.freetype import SysFont
 from pygame.locals import MOUSEBUTTONDOWN
 from pygame.rect import Rect
 from typing import Union, Tuple
 
+from gameoflife.assets import getFont, getImage
 from gameoflife.color import Color
 from gameoflife.draw import drawRectBorder
 from gameoflife.mouse import MOUSEBUTTON_LCLICK
@@ -20,6 +20,7 @@ class ButtonID:
     CLEAR = "Clear"
     EXIT = "Exit"
     NEXT = "Next"
+    PREV = "Prev"
     RESET = "Reset"
     START = "Start"
     STOP = "Stop"
@@ -53,8 +54,7 @@ class BaseButton:
         self._hoverTextColor = None
         self._border = border
         self._borderColor = Color.BLACK
-        self._cursor = pygame.SYSTEM_CURSOR_ARROW
-        self._font = SysFont('Sans', 12)
+        self._font = getFont('Sans', 12)
         self._tooltip = None
 
         if tooltip:
@@ -116,12 +116,24 @@ class BaseButton:
     def eventHandler(self, event:Event):
         raise NotImplementedError("button eventHandler() not implemented!")
 
+    def getCursor(self) -> int:
+        return pygame.SYSTEM_CURSOR_HAND
+
+    def hover(self, pos:Union[None, Tuple[int, int]]) -> None:
+        """Show the hover state while the pointer is at ``pos``; None when it leaves."""
+        if pos is None:
+            self._currBgColor = self._bgColor
+        else:
+            self._currBgColor = self._hoverBgColor
+        if self._tooltip:
+            if pos is None:
+                self._tooltip.disable()
+            else:
+                self._tooltip.enable()
+
     def hovered(self) -> None:
         raise NotImplementedError("button eventHandler() not implemented!")
 
-    def update(self) -> None:
-        raise NotImplementedError("button update() not implemented!")
-
 
 class CircleButton(BaseButton):
     def __init__(
@@ -153,7 +165,7 @@ class CircleButton(BaseButton):
         return False
 
     def draw(self, surface:Surface) -> None:
-        ftFont = SysFont('sans', 24)
+        ftFont = getFont('Sans', 24)
         draw.circle(surface, self._currBgColor, (self._x, self._y), self._radius, 0)
         if self._border:
             draw.circle(surface, self._borderColor, (self._x, self._y), self._radius, 1)
@@ -162,20 +174,13 @@ class CircleButton(BaseButton):
         textY = self._y - int(fontRect.height / 2) + 1
         ftFont.render_to(surface, (textX, textY), self._id)
 
-    def update(self) -> None:
-        (mX, mY) = pygame.mouse.get_pos()
-        sqMouseX = (mX - self._x) ** 2
-        sqMouseY = (mY - self._y) ** 2
-        if math.sqrt(sqMouseX + sqMouseY) < self._radius:
-            self._cursor = pygame.SYSTEM_CURSOR_HAND
-            pygame.mouse.set_cursor(self._cursor)
-            self._currBgColor = self._hoverBgColor
-        else:
-            if self._cursor != pygame.SYSTEM_CURSOR_ARROW:
-                self._cursor = pygame.SYSTEM_CURSOR_ARROW
-                pygame.mouse.set_cursor(self._cursor)
-            if self._currBgColor != self._bgColor:
-                self._currBgColor = self._bgColor
+    def getRect(self) -> Rect:
+        radius = math.ceil(self._radius)
+        return Rect(self._x - radius, self._y - radius, radius * 2, radius * 2)
+
+    def hovered(self, pos:Union[None, Tuple[int, int]]=None) -> bool:
+        (mX, mY) = pos or pygame.mouse.get_pos()
+        return math.sqrt((mX - self._x) ** 2 + (mY - self._y) ** 2) < self._radius
 
 
 class RectButton(BaseButton):
@@ -195,8 +200,7 @@ class RectButton(BaseButton):
         self._currBgColor = bgColor
         self._surface = None
         if imagePath:
-            image = pygame.image.load(imagePath)
-            self._surface = image
+            self._surface = getImage(imagePath)
             #self._surface = pygame.transform.scale(image, (rect.width, rect.height))
 
     def getRect(self) -> Rect:
@@ -224,7 +228,7 @@ class RectButton(BaseButton):
         self._rect.height = height
 
     def clicked(self, mouseX:Union[None, int]=None, mouseY:Union[None, int]=None) -> bool:
-        if not mouseX or not mouseY:
+        if mouseX is None or mouseY is None:
             (mouseX, mouseY) = pygame.mouse.get_pos()
         if self._rect.collidepoint((mouseX, mouseY)):
             return True
@@ -248,34 +252,16 @@ class RectButton(BaseButton):
         if self._tooltip:
             self._tooltip.draw(surface)
 
-    def eventHandler(self, event:Event):
+    def eventHandler(self, event:Event) -> bool:
         buttonCode = event.dict.get("button")
         if event.type == MOUSEBUTTONDOWN and buttonCode == MOUSEBUTTON_LCLICK:
-            if self.clicked():
+            if self.clicked(*event.dict.get("pos", (None, None))):
                 pygame.event.post(self._event)
+                return True
+        return False
 
-    def hovered(self) -> bool:
-        (mX, mY) = pygame.mouse.get_pos()
-        if self._rect.collidepoint(mX, mY):
-            return True
-
-    def update(self) -> None:
-        if self._tooltip:
-            if self.hovered():
-                self._tooltip.enable()
-            else:
-                self._tooltip.disable()
-
-        if self._rect.collidepoint(pygame.mouse.get_pos()):
-            self._cursor = pygame.SYSTEM_CURSOR_HAND
-            self._currBgColor = self._hoverBgColor
-            pygame.mouse.set_cursor(self._cursor)
-        else:
-            if self._cursor != pygame.SYSTEM_CURSOR_ARROW:
-                self._cursor = pygame.SYSTEM_CURSOR_ARROW
-                pygame.mouse.set_cursor(self._cursor)
-            if self._currBgColor != self._bgColor:
-                self._currBgColor = self._bgColor
+    def hovered(self, pos:Union[None, Tuple[int, int]]=None) -> bool:
+        return self._rect.collidepoint(pos or pygame.mouse.get_pos())
 
 
 class ToggleRectButton(RectButton):
@@ -297,11 +283,13 @@ class ToggleRectButton(RectButton):
         self._onEnable = onEnable
         self._enabled = False
 
-    def eventHandler(self, event:Event):
+    def eventHandler(self, event:Event) -> bool:
         buttonCode = event.dict.get("button")
         if event.type == MOUSEBUTTONDOWN and buttonCode == MOUSEBUTTON_LCLICK:
-            if self.clicked():
+            if self.clicked(*event.dict.get("pos", (None, None))):
                 self.toggle()
+                return True
+        return False
 
     def toggle(self):
         self._enabled = not self._enabled
@@ -0,0 +1,213 @@
+import glob
+import json
+import os
+
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.engine import EngineName
+from gameoflife.rule import CONWAY, Rule
+from gameoflife.simulation import Simulation
+from gameoflife.topology import Topology, wrap
+
+
+CENSUS_CATEGORIES = ("still-lifes", "oscillators", "spaceships")
+
+_SYMMETRIES = (
+    lambda x, y: (x, y),
+    lambda x, y: (-x, y),
+    lambda x, y: (x, -y),
+    lambda x, y: (-x, -y),
+    lambda x, y: (y, x),
+    lambda x, y: (-y, x),
+    lambda x, y: (y, -x),
+    lambda x, y: (-y, -x),
+)
+
+Point = Tuple[int, int]
+ShapeKey = Tuple[int, int, int]
+
+
+def shapeKey(points: Iterable[Point]) -> ShapeKey:
+    """Key a set of live cells by its bounding box size and cell bitmap.
+
+    The shape is moved to the origin first, so the key is the same wherever
+    the object sits on the board.
+    """
+    points = list(points)
+    minX = min(x for (x, _) in points)
+    minY = min(y for (_, y) in points)
+    width = max(x for (x, _) in points) - minX + 1
+    height = max(y for (_, y) in points) - minY + 1
+    bits = 0
+    for (x, y) in points:
+        bits |= 1 << ((y - minY) * width + (x - minX))
+    return (width, height, bits)
+
+
+def shapeRows(key: ShapeKey) -> List[str]:
+    """Render a shape key as pattern-style rows of "0" and "1"."""
+    (width, height, bits) = key
+    return ["".join("1" if bits >> (y * width + x) & 1 else "0" for x in range(width)) for y in range(height)]
+
+
+class CensusIndex:
+    """Precomputed lookup from object shape to pattern name.
+
+    Every phase of every pattern is stored under all eight rotations and
+    reflections, so identifying an object is one ``shapeKey()`` and a dict
+    lookup. Build it once with ``loadIndex()`` and keep it around.
+    """
+
+    def __init__(self, rule: str = CONWAY) -> None:
+        self._rule = Rule.parse(rule)
+        self._shapes: Dict[ShapeKey, str] = {}
+        self._categories: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._shapes)
+
+    def getRule(self) -> Rule:
+        return self._rule
+
+    def getCategory(self, name: str) -> Union[str, None]:
+        return self._categories.get(name)
+
+    def add(self, name: str, category: str, seed: Sequence[str], period: int = 1) -> None:
+        """Index ``seed`` and the phases it runs through over ``period`` generations."""
+        points = [(x, y) for (y, line) in enumerate(seed) for (x, char) in enumerate(line) if char == "1"]
+        if not points:
+            return
+        self._categories[name] = category
+        margin = period + 2
+        cols = max(len(line) for line in seed) + 2 * margin
+        rows = len(seed) + 2 * margin
+        # The boards are tiny, and the row engine never starts a thread pool
+        # that would be inherited by processes forked afterwards.
+        sim = Simulation(cols, rows, rule=self._rule, engine=EngineName.ROWS)
+        for (x, y) in points:
+            sim.setState(x + margin, y + margin, CellState.ALIVE)
+        for _ in range(max(1, period)):
+            phase = [(pos % cols, pos // cols) for pos in range(cols * rows) if sim.getCells()[pos] == CellState.ALIVE]
+            if not phase:
+                break
+            for transform in _SYMMETRIES:
+                self._shapes.setdefault(shapeKey(transform(x, y) for (x, y) in phase), name)
+            sim.step()
+
+    def addDirectory(self, directory: str = "patterns", categories: Sequence[str] = CENSUS_CATEGORIES) -> None:
+        for category in categories:
+            for path in sorted(glob.glob(os.path.join(directory, category, "*"))):
+                try:
+                    with open(path) as file:
+                        data = json.load(file)
+                    if Rule.parse(data.get("rule", CONWAY)) != self._rule:
+                        continue
+                    name = data.get("name", os.path.basename(path))
+                    self.add(name, category, data.get("seed", []), data.get("period") or 1)
+                except (OSError, ValueError) as e:
+                    print(f'failed to index "{path}": {e}')
+
+    def lookup(self, points: Iterable[Point]) -> Union[str, None]:
+        return self._shapes.get(shapeKey(points))
+
+
+_indexes: Dict[Tuple[str, str], CensusIndex] = {}
+
+
+def loadIndex(directory: str = "patterns", rule: str = CONWAY) -> CensusIndex:
+    """Return the census index for ``directory``, building it on first use."""
+    key = (os.path.abspath(directory), str(Rule.parse(rule)))
+    index = _indexes.get(key)
+    if index is None:
+        index = _indexes[key] = CensusIndex(rule)
+        index.addDirectory(directory)
+    return index
+
+
+def components(
+    cells: bytes, cols: int, rows: int, topology: str = Topology.DEAD, radius: int = 1
+) -> List[List[Point]]:
+    """Split the live cells into groups of cells within ``radius`` of each other.
+
+    Points are unwrapped across the edges of a torus or Klein bottle, so an
+    object straddling an edge keeps its shape.
+    """
+    steps = [(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1) if dx or dy]
+    seen = set()
+    groups = []
+    pos = cells.find(CellState.ALIVE)
+    while pos >= 0:
+        if pos not in seen:
+            seen.add(pos)
+            start = (pos % cols, pos // cols)
+            group = [start]
+            stack = [start]
+            while stack:
+                (x, y) = stack.pop()
+                for (dx, dy) in steps:
+                    point = wrap(topology, x + dx, y + dy, cols, rows)
+                    if point is None:
+                        continue
+                    other = point[1] * cols + point[0]
+                    if other not in seen and cells[other] == CellState.ALIVE:
+                        seen.add(other)
+                        group.append((x + dx, y + dy))
+                        stack.append((x + dx, y + dy))
+            groups.append(group)
+        pos = cells.find(CellState.ALIVE, pos + 1)
+    return groups
+
+
+class Census:
+    def __init__(self) -> None:
+        self._counts: Counter = Counter()
+        self._unknown: List[List[str]] = []
+
+    def add(self, name: str) -> None:
+        self._counts[name] += 1
+
+    def addUnknown(self, points: Sequence[Point]) -> None:
+        self._counts["unknown"] += 1
+        self._unknown.append(shapeRows(shapeKey(points)))
+
+    def getCounts(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    def getUnknown(self) -> List[List[str]]:
+        return self._unknown
+
+    def total(self) -> int:
+        return sum(self._counts.values())
+
+    def toDict(self) -> dict:
+        return dict(sorted(self._counts.items(), key=lambda item: (-item[1], item[0])))
+
+
+def census(
+    cells: bytes, cols: int, rows: int, index: CensusIndex, topology: str = Topology.DEAD
+) -> Census:
+    """Identify every object on the board against ``index``.
+
+    Cells up to two apart are grouped first, so objects whose parts do not
+    touch (such as the pulsar) are looked up whole. Groups that match nothing
+    are split into touching pieces and each piece is looked up on its own.
+    """
+    result = Census()
+    for group in components(cells, cols, rows, topology, radius=2):
+        name = index.lookup(group)
+        if name:
+            result.add(name)
+            continue
+        piece = bytearray(len(cells))
+        for point in group:
+            (x, y) = wrap(topology, point[0], point[1], cols, rows)
+            piece[y * cols + x] = CellState.ALIVE
+        for part in components(piece, cols, rows, topology):
+            name = index.lookup(part)
+            if name:
+                result.add(name)
+            else:
+                result.addUnknown(part)
+    return result
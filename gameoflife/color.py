@@ -1,4 +1,5 @@
 from pygame import Color as PygameColor
+from typing import List
 import pygame
 
 class Color:
@@ -12,4 +13,13 @@ class Color:
     GREY_LIGHT2 = PygameColor(237, 237, 237)
     RED = PygameColor(255, 0, 0)
     RED_LIGHT = PygameColor(255,114,118)
-    WHITE = PygameColor(255, 255, 255)
\ No newline at end of file
+    WHITE = PygameColor(255, 255, 255)
+
+def cellPalette(states: int) -> List[PygameColor]:
+    """Colors indexed by cell state: dead, alive, then dying states fading out."""
+    palette = [Color.WHITE, Color.BLACK]
+    dying = states - 2
+    for i in range(dying):
+        t = i / dying
+        palette.append(Color.RED.lerp(Color.GREY_LIGHT2, t))
+    return palette
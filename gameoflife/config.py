@@ -1,13 +1,15 @@
 import json
 import os
 
-from benedict import benedict
 from typing import Any
 
 
+_MISSING = object()
+
+
 class Config:
     def __init__(self, file : str = 'config.json') -> None:
-        self.cfg = benedict({})
+        self.cfg = {}
         self.file = file
         self.load()
 
@@ -20,11 +22,22 @@ class Config:
         return os.path.abspath(f"{root}/{self.file}")
 
     def load(self) -> None:
-        self.cfg = benedict(self.path(), format='json')
+        with open(self.path()) as file:
+            self.cfg = json.load(file)
+
+    def lookup(self, key:str) -> Any:
+        """Resolve a dotted key such as ``screen.width``, or return ``_MISSING``."""
+        value = self.cfg
+        for part in key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return _MISSING
+            value = value[part]
+        return value
 
     def get(self, key:str, default:Any=None) -> Any:
-        if key in self.cfg:
-            return self.cfg[key]
+        value = self.lookup(key)
+        if value is not _MISSING:
+            return value
         elif default is not None:
             return default
-        raise KeyError(f"Couldn't find key '{key}' in config")
\ No newline at end of file
+        raise KeyError(f"Couldn't find key '{key}' in config")
@@ -0,0 +1,280 @@
+from array import array
+from collections import deque
+from typing import Iterable, Tuple, Union
+
+from gameoflife.cell import CellState
+
+
+_MASK64 = (1 << 64) - 1
+_MERSENNE61 = (1 << 61) - 1
+
+
+def _mix64(value: int) -> int:
+    # splitmix64 finalizer, used to derive a Zobrist key per cell position on
+    # the fly instead of keeping a table the size of the board.
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class CycleType:
+    STILL: str = "still"
+    OSCILLATOR: str = "oscillator"
+    SPACESHIP: str = "spaceship"
+    EXTINCT: str = "extinct"
+
+
+class Cycle:
+    def __init__(
+        self, type: str, period: int, generation: int, displacement: Tuple[int, int] = (0, 0)
+    ) -> None:
+        self._type = type
+        self._period = period
+        self._generation = generation
+        self._displacement = displacement
+
+    def getType(self) -> str:
+        return self._type
+
+    def getPeriod(self) -> int:
+        return self._period
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def getDisplacement(self) -> Tuple[int, int]:
+        return self._displacement
+
+    def __repr__(self) -> str:
+        return f"Cycle({self._type}, period={self._period}, generation={self._generation}, displacement={self._displacement})"
+
+
+class BoardHash:
+    """Board hashes maintained from each generation's births and deaths.
+
+    ``value()`` is a Zobrist hash (XOR of a per-position key for every live
+    cell). ``normalized()`` is a polynomial hash of the live cells taken
+    relative to the bounding box origin, so a pattern hashes the same wherever
+    it sits on the board. Both are updated in O(1) per changed cell; the
+    bounding box is tracked with per-row and per-column population counts.
+
+    Under a rule with more than two ``states`` the dying cells are hashed
+    too. A dying cell can only age, so the cells in each dying state are
+    exactly the deaths of one of the last ``states - 2`` generations; every
+    generation's deaths are folded into one entry per age, salted by the age,
+    and aging the board just shifts those entries along.
+    """
+
+    def __init__(self, cols: int, rows: int, seed: int = 0x5EED) -> None:
+        self._cols = cols
+        self._rows = rows
+        self._seed = seed
+        self._baseX = _mix64(seed ^ 0xA5A5) % (_MERSENNE61 - 2) + 2
+        self._baseY = _mix64(seed ^ 0x5A5A) % (_MERSENNE61 - 2) + 2
+        self.reset()
+
+    def reset(self, cells: Union[bytes, None] = None, states: int = 2) -> None:
+        self._zobrist = 0
+        self._poly = 0
+        self._population = 0
+        self._colCounts = array("I", bytes(4 * self._cols))
+        self._rowCounts = array("I", bytes(4 * self._rows))
+        self._minX = self._cols
+        self._minY = self._rows
+        # One (zobrist, poly, count) entry per dying state, youngest first.
+        self._ages: deque = deque()
+        self._ageSalts = []
+        self._dyingZobrist = 0
+        self._dyingPoly = 0
+        self._dying = 0
+        if cells:
+            self.update((pos for pos in range(len(cells)) if cells[pos] == CellState.ALIVE), ())
+
+        self._ageSalts = [_mix64(self._seed ^ (age + 1) << 32) for age in range(states - 2)]
+        ages = [[0, 0, 0] for _ in self._ageSalts]
+        if cells and ages:
+            cols = self._cols
+            for pos in range(len(cells)):
+                state = cells[pos]
+                if 2 <= state < states:
+                    entry = ages[state - 2]
+                    entry[0] ^= _mix64(pos ^ self._seed)
+                    entry[1] = (entry[1] + self._term(pos % cols, pos // cols)) % _MERSENNE61
+                    entry[2] += 1
+        self._ages.extend(tuple(entry) for entry in ages)
+        self._foldAges()
+
+    def update(self, births: Iterable[int], deaths: Iterable[int]) -> None:
+        cols = self._cols
+        for pos in births:
+            x = pos % cols
+            y = pos // cols
+            self._zobrist ^= _mix64(pos ^ self._seed)
+            self._poly = (self._poly + self._term(x, y)) % _MERSENNE61
+            self._colCounts[x] += 1
+            self._rowCounts[y] += 1
+            self._population += 1
+            if x < self._minX:
+                self._minX = x
+            if y < self._minY:
+                self._minY = y
+
+        rescanX = rescanY = False
+        (deadZobrist, deadPoly, dead) = (0, 0, 0)
+        for pos in deaths:
+            x = pos % cols
+            y = pos // cols
+            key = _mix64(pos ^ self._seed)
+            term = self._term(x, y)
+            self._zobrist ^= key
+            self._poly = (self._poly - term) % _MERSENNE61
+            self._colCounts[x] -= 1
+            self._rowCounts[y] -= 1
+            self._population -= 1
+            rescanX = rescanX or (x == self._minX and not self._colCounts[x])
+            rescanY = rescanY or (y == self._minY and not self._rowCounts[y])
+            deadZobrist ^= key
+            deadPoly += term
+            dead += 1
+
+        if rescanX:
+            self._minX = self._firstNonZero(self._colCounts, self._minX)
+        if rescanY:
+            self._minY = self._firstNonZero(self._rowCounts, self._minY)
+
+        if self._ages:
+            # This generation's deaths are the youngest dying cells and the
+            # oldest ones have faded out.
+            self._ages.pop()
+            self._ages.appendleft((deadZobrist, deadPoly % _MERSENNE61, dead))
+            self._foldAges()
+
+    def value(self) -> int:
+        return self._zobrist ^ self._dyingZobrist
+
+    def normalized(self) -> int:
+        if not self._population and not self._dying:
+            return 0
+        shift = pow(self._baseX, -self._minX, _MERSENNE61) * pow(self._baseY, -self._minY, _MERSENNE61)
+        return ((self._poly + self._dyingPoly) * shift) % _MERSENNE61
+
+    def origin(self) -> Tuple[int, int]:
+        return (self._minX, self._minY)
+
+    def population(self) -> int:
+        return self._population
+
+    def dying(self) -> int:
+        """Number of dying cells; always 0 under a two-state rule."""
+        return self._dying
+
+    def _foldAges(self) -> None:
+        self._dyingZobrist = 0
+        self._dyingPoly = 0
+        self._dying = 0
+        for ((zobrist, poly, count), salt) in zip(self._ages, self._ageSalts):
+            if count:
+                self._dyingZobrist ^= _mix64(zobrist ^ salt)
+                self._dyingPoly += poly * (salt % (_MERSENNE61 - 2) + 2)
+                self._dying += count
+        self._dyingPoly %= _MERSENNE61
+
+    def _term(self, x: int, y: int) -> int:
+        return pow(self._baseX, x, _MERSENNE61) * pow(self._baseY, y, _MERSENNE61) % _MERSENNE61
+
+    @staticmethod
+    def _firstNonZero(counts: array, start: int) -> int:
+        for i in range(start, len(counts)):
+            if counts[i]:
+                return i
+        return len(counts)
+
+
+class CycleDetector:
+    """Detects still lifes, oscillators and spaceships from a bounded hash history.
+
+    Feed it each generation's change set with ``update()``. The board is never
+    rehashed; only ``reset()`` (after edits, loads or seeks) walks every cell.
+    """
+
+    def __init__(self, cols: int, rows: int, maxHistory: int = 4096) -> None:
+        self._hash = BoardHash(cols, rows)
+        self._maxHistory = maxHistory
+        self._history: deque = deque()
+        self._seen: dict = {}
+        self._seenNormalized: dict = {}
+        self._cycle: Union[Cycle, None] = None
+
+    def reset(self, generation: int, cells: Union[bytes, None] = None, states: int = 2) -> None:
+        """Start over from ``cells`` at ``generation``; ``states`` is the rule's state count."""
+        self._hash.reset(cells, states)
+        self._history.clear()
+        self._seen.clear()
+        self._seenNormalized.clear()
+        self._cycle = None
+        self._remember(generation)
+
+    def cycle(self) -> Union[Cycle, None]:
+        return self._cycle
+
+    def getHash(self) -> BoardHash:
+        return self._hash
+
+    def update(self, generation: int, births: Iterable[int], deaths: Iterable[int]) -> Union[Cycle, None]:
+        """Apply the change set that produced ``generation`` and return the cycle, if any."""
+        self._hash.update(births, deaths)
+        if not self._hash.population() and not self._hash.dying():
+            self._cycle = Cycle(CycleType.EXTINCT, 1, generation)
+            self._remember(generation)
+            return self._cycle
+
+        cycle = None
+        value = self._hash.value()
+        normalized = self._hash.normalized()
+        if value in self._seen:
+            period = generation - self._seen[value]
+            cycle = Cycle(CycleType.STILL if period == 1 else CycleType.OSCILLATOR, period, generation)
+        elif normalized in self._seenNormalized:
+            prevGeneration, prevOrigin = self._seenNormalized[normalized]
+            (x, y) = self._hash.origin()
+            cycle = Cycle(
+                CycleType.SPACESHIP,
+                generation - prevGeneration,
+                generation,
+                (x - prevOrigin[0], y - prevOrigin[1]),
+            )
+
+        self._cycle = cycle
+        self._remember(generation)
+        return cycle
+
+    def skip(self, generation: int, target: int) -> Union[int, None]:
+        """Return how many real generations must run to reach ``target``.
+
+        Only possible for still lifes and oscillators, whose board at
+        ``target`` repeats the board ``(target - generation) % period``
+        generations from now. Returns None when no such shortcut exists.
+        """
+        cycle = self._cycle
+        if cycle is None or target < generation:
+            return None
+        if cycle.getType() == CycleType.EXTINCT:
+            return 0
+        if cycle.getType() not in (CycleType.STILL, CycleType.OSCILLATOR):
+            return None
+        return (target - generation) % cycle.getPeriod()
+
+    def _remember(self, generation: int) -> None:
+        value = self._hash.value()
+        normalized = self._hash.normalized()
+        origin = self._hash.origin()
+        self._seen[value] = generation
+        self._seenNormalized[normalized] = (generation, origin)
+        self._history.append((generation, value, normalized))
+        while len(self._history) > self._maxHistory:
+            (oldGeneration, oldValue, oldNormalized) = self._history.popleft()
+            if self._seen.get(oldValue) == oldGeneration:
+                del self._seen[oldValue]
+            if self._seenNormalized.get(oldNormalized, (None,))[0] == oldGeneration:
+                del self._seenNormalized[oldNormalized]
@@ -0,0 +1,53 @@
+from array import array
+from typing import Iterable, Tuple
+
+
+class GenerationDelta:
+    """The cells that changed to produce ``generation``.
+
+    Births and deaths are board positions (``pos = y * cols + x``) packed in
+    ``array("I")``, taken straight from what the engine reported while
+    stepping. Under a multi-state rule deaths are cells that stopped being
+    alive; the rest of the dying cells just aged.
+
+    ``isEdited()`` tells that the board was edited, restored or seeked since
+    the previous delta of the same stream, so the deltas alone no longer
+    replay it and a consumer has to pick the board up again from the
+    simulation.
+    """
+
+    def __init__(
+        self, generation: int, cols: int, births: Iterable[int], deaths: Iterable[int], edited: bool = False
+    ) -> None:
+        self._generation = generation
+        self._cols = cols
+        self._births = array("I", births)
+        self._deaths = array("I", deaths)
+        self._edited = edited
+
+    def __repr__(self) -> str:
+        return f"GenerationDelta({self._generation}, births={len(self._births)}, deaths={len(self._deaths)})"
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def getBirths(self) -> array:
+        return self._births
+
+    def getDeaths(self) -> array:
+        return self._deaths
+
+    def isEdited(self) -> bool:
+        return self._edited
+
+    def birthCoordinates(self) -> Tuple[array, array]:
+        """``(xs, ys)`` of the births."""
+        return self._coordinates(self._births)
+
+    def deathCoordinates(self) -> Tuple[array, array]:
+        """``(xs, ys)`` of the deaths."""
+        return self._coordinates(self._deaths)
+
+    def _coordinates(self, positions: array) -> Tuple[array, array]:
+        cols = self._cols
+        return (array("I", [pos % cols for pos in positions]), array("I", [pos // cols for pos in positions]))
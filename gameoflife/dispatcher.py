@@ -0,0 +1,138 @@
+import pygame
+
+from pygame.event import Event
+from pygame.rect import Rect
+from typing import Any, Dict, List, Tuple, Union
+
+
+Point = Tuple[int, int]
+
+
+class SpatialIndex:
+    """Uniform grid of buckets mapping screen areas to the widgets over them.
+
+    A point lookup only scans the widgets whose rects overlap its bucket, so
+    its cost does not grow with the number of widgets on screen.
+    """
+
+    def __init__(self, cellSize: int = 64) -> None:
+        self._cellSize = cellSize
+        self._buckets: Dict[Tuple[int, int], List[Tuple[int, Rect, Any]]] = {}
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def insert(self, item: Any, rect: Rect, order: int) -> None:
+        size = self._cellSize
+        for by in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for bx in range(rect.left // size, (rect.right - 1) // size + 1):
+                self._buckets.setdefault((bx, by), []).append((order, Rect(rect), item))
+
+    def query(self, point: Point) -> List[Any]:
+        """Items whose rect contains ``point``, topmost (highest order) first."""
+        size = self._cellSize
+        bucket = self._buckets.get((point[0] // size, point[1] // size), ())
+        hits = [entry for entry in bucket if entry[1].collidepoint(point)]
+        hits.sort(key=lambda entry: entry[0], reverse=True)
+        return [item for (_, _, item) in hits]
+
+
+class InputDispatcher:
+    """Routes mouse input to widgets through a ``SpatialIndex``.
+
+    Widgets provide ``getRect()``, ``hover(pos)`` (``pos`` is None when the
+    pointer leaves), ``getCursor()`` and ``eventHandler(event)``, which
+    returns a truthy value when it consumed the event. Widgets with an
+    ``enabled()`` method are skipped while it returns False. Widgets added
+    later sit on top of earlier ones.
+
+    The mouse is sampled once per frame with ``sample()``, and the system
+    cursor and its visibility are only changed when they actually change.
+    """
+
+    def __init__(self, cellSize: int = 64) -> None:
+        self._index = SpatialIndex(cellSize)
+        self._widgets: List[Any] = []
+        self._pos: Point = (0, 0)
+        self._hoverPos: Union[Point, None] = None
+        self._hovered = None
+        # SDL starts with the arrow; visibility may have been changed by
+        # others, so the first setVisible() always applies.
+        self._cursor = pygame.SYSTEM_CURSOR_ARROW
+        self._visible: Union[bool, None] = None
+
+    def add(self, widget: Any) -> None:
+        self._widgets.append(widget)
+        self._index.insert(widget, widget.getRect(), len(self._widgets))
+
+    def remove(self, widget: Any) -> None:
+        if widget in self._widgets:
+            self._widgets.remove(widget)
+            if self._hovered is widget:
+                self._hovered = None
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Re-index every widget; call after a widget moves or resizes."""
+        self._index.clear()
+        for (order, widget) in enumerate(self._widgets, 1):
+            self._index.insert(widget, widget.getRect(), order)
+
+    def sample(self) -> Point:
+        self._pos = pygame.mouse.get_pos()
+        return self._pos
+
+    def getPos(self) -> Point:
+        return self._pos
+
+    def getHovered(self) -> Any:
+        return self._hovered
+
+    def hit(self, pos: Point) -> Any:
+        for widget in self._index.query(pos):
+            enabled = getattr(widget, "enabled", None)
+            if enabled is None or enabled():
+                return widget
+        return None
+
+    def dispatch(self, event: Event) -> Tuple[Any, Any]:
+        """Send a mouse event to the widget under it.
+
+        Returns ``(widget, result)``; ``widget`` is None when the event has no
+        position or nothing is under it, and the caller handles it itself.
+        """
+        pos = event.dict.get("pos")
+        if pos is None:
+            return (None, None)
+        widget = self.hit(pos)
+        if widget is None:
+            return (None, None)
+        return (widget, widget.eventHandler(event))
+
+    def update(self) -> None:
+        """Apply hover transitions and the cursor for the sampled mouse position."""
+        pos = self._pos
+        widget = self.hit(pos)
+        if widget is not self._hovered:
+            if self._hovered is not None:
+                self._hovered.hover(None)
+            self._hovered = widget
+            self._hoverPos = None
+        if widget is not None and pos != self._hoverPos:
+            widget.hover(pos)
+            self._hoverPos = pos
+        self.setCursor(widget.getCursor() if widget is not None else pygame.SYSTEM_CURSOR_ARROW)
+
+    def setCursor(self, cursor: int) -> None:
+        if cursor != self._cursor:
+            self._cursor = cursor
+            try:
+                pygame.mouse.set_cursor(cursor)
+            except pygame.error:
+                # Drivers without system cursors (e.g. SDL's dummy driver).
+                pass
+
+    def setVisible(self, visible: bool) -> None:
+        if visible != self._visible:
+            self._visible = visible
+            pygame.mouse.set_visible(visible)
@@ -0,0 +1,520 @@
+"""Stepping engines.
+
+An engine advances a board held as a ``bytearray`` (one byte per cell,
+``pos = y * cols + x``) by one generation in place and returns the positions
+of the cells that became alive (births) and stopped being alive (deaths).
+Engines may keep their own view of the board between steps; ``reset()``
+tells them the board was changed behind their back.
+"""
+
+import importlib.util
+import time
+
+from collections import Counter
+from typing import Callable, Dict, List, Set, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.rule import Rule
+from gameoflife.topology import ghostRows, padRow, wrap
+
+
+class EngineName:
+    ROWS: str = "rows"
+    SPARSE: str = "sparse"
+    COUNTS: str = "counts"
+    ARRAY: str = "array"
+    AUTO: str = "auto"
+
+    ALL = (ROWS, SPARSE, COUNTS, ARRAY, AUTO)
+
+
+class Engine:
+    NAME = ""
+
+    def describe(self) -> str:
+        """Short name of the engine (or kernel) doing the work, for stats."""
+        return self.NAME
+
+    def supports(self, rule: Rule) -> bool:
+        return True
+
+    def reset(self) -> None:
+        pass
+
+    def step(
+        self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str
+    ) -> Tuple[List[int], List[int]]:
+        raise NotImplementedError("engine step() not implemented!")
+
+
+class RowEngine(Engine):
+    """Steps whole rows at a time as big integers; best for busy boards.
+
+    Rows with no live cells around them are skipped, so the cost follows the
+    number of rows with activity times the board width.
+    """
+
+    NAME = EngineName.ROWS
+
+    def step(
+        self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str
+    ) -> Tuple[List[int], List[int]]:
+        kernel = rule.getKernel()
+        offsets = rule.getOffsets()
+        aliveMask = rule.getAliveMask()
+        decay = rule.getDecay()
+        quiet = not kernel[0]
+        full = (1 << (8 * cols)) - 1
+        births = []
+        deaths = []
+
+        # Every row is handled as one big integer holding a byte per cell,
+        # padded with a ghost cell on each side and preceded/followed by ghost
+        # rows, all filled in according to the topology. Live cell counts
+        # never exceed 9, so adding rows together or shifting them by a byte
+        # sums all columns at once without carries spilling into the
+        # neighboring cell, and bytes.translate() then looks the next state of
+        # the whole row up in the rule's kernel.
+        first = cells[0:cols].translate(aliveMask)
+        last = cells[(rows - 1) * cols:rows * cols].translate(aliveMask)
+        (top, bottom) = ghostRows(topology, first, last)
+        above = padRow(topology, top) if top else 0
+        here = padRow(topology, first)
+        for y in range(rows):
+            offset = y * cols
+            row = cells[offset:offset + cols]
+            if y + 1 < rows:
+                below = padRow(topology, cells[offset + cols:offset + 2 * cols].translate(aliveMask))
+            else:
+                below = padRow(topology, bottom) if bottom else 0
+            column = above + here + below
+            if not column and quiet and (decay is None or row.count(0) == cols):
+                above = here
+                here = below
+                continue
+
+            count = ((column + (column << 8) + (column >> 8)) >> 8) & full
+            index = count + int.from_bytes(row.translate(offsets), "big")
+            nextRow = index.to_bytes(cols, "big").translate(kernel)
+            if decay is not None:
+                nextRow = (int.from_bytes(nextRow, "big") | int.from_bytes(row.translate(decay), "big")).to_bytes(cols, "big")
+
+            if nextRow != row:
+                cells[offset:offset + cols] = nextRow
+                alive = int.from_bytes(nextRow.translate(aliveMask), "big")
+                before = (here >> 8) & full
+                self._collect(alive & ~before, cols, offset, births)
+                self._collect(before & ~alive, cols, offset, deaths)
+            above = here
+            here = below
+
+        return (births, deaths)
+
+    @staticmethod
+    def _collect(mask: int, cols: int, offset: int, out: List[int]) -> None:
+        """Append the positions of the 1 bytes in the row ``mask`` to ``out``."""
+        if not mask:
+            return
+        row = mask.to_bytes(cols, "big")
+        x = row.find(1)
+        while x >= 0:
+            out.append(offset + x)
+            x = row.find(1, x + 1)
+
+
+class SparseEngine(Engine):
+    """Steps only the live cells and their neighbors; best for thin boards.
+
+    Keeps the set of live cells (and the ages of dying cells for Generations
+    rules), so the cost follows the population rather than the board size.
+    Rules that give birth on zero neighbors would fill the empty space and
+    are left to the other engines.
+    """
+
+    NAME = EngineName.SPARSE
+
+    def __init__(self) -> None:
+        self._live: Set[int] = set()
+        self._dying: Dict[int, int] = {}
+        self._synced = False
+
+    def supports(self, rule: Rule) -> bool:
+        return rule.next(CellState.DEAD, 0) == CellState.DEAD
+
+    def reset(self) -> None:
+        self._synced = False
+
+    def _sync(self, cells: bytearray) -> None:
+        live = set()
+        pos = cells.find(CellState.ALIVE)
+        while pos >= 0:
+            live.add(pos)
+            pos = cells.find(CellState.ALIVE, pos + 1)
+        dying = {}
+        if cells.count(CellState.DEAD) + len(live) != len(cells):
+            dying = {pos: state for (pos, state) in enumerate(cells) if state > CellState.ALIVE}
+        self._live = live
+        self._dying = dying
+        self._synced = True
+
+    def _neighbors(self, cols: int, rows: int, topology: str) -> Counter:
+        """Number of live neighbors of every cell next to a live cell."""
+        live = self._live
+        edge = []
+        inner = []
+        last = (rows - 1) * cols
+        for pos in live:
+            x = pos % cols
+            if 0 < x < cols - 1 and cols <= pos < last:
+                inner.append(pos)
+            else:
+                edge.append(pos)
+        steps = (-cols - 1, -cols, -cols + 1, -1, 1, cols - 1, cols, cols + 1)
+        counts = Counter(pos + step for pos in inner for step in steps)
+        for pos in edge:
+            (x, y) = (pos % cols, pos // cols)
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    if dx or dy:
+                        point = wrap(topology, x + dx, y + dy, cols, rows)
+                        if point is not None:
+                            counts[point[1] * cols + point[0]] += 1
+        return counts
+
+    def step(
+        self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str
+    ) -> Tuple[List[int], List[int]]:
+        if not self.supports(rule):
+            raise ValueError(f"the sparse engine cannot run '{rule}', it gives birth on 0 neighbors")
+        if not self._synced:
+            self._sync(cells)
+        live = self._live
+        dying = self._dying
+        table = rule.getTable()
+        alive = CellState.ALIVE
+        counts = self._neighbors(cols, rows, topology)
+
+        births = sorted(
+            pos for (pos, n) in counts.items() if table[n] == alive and pos not in live and pos not in dying
+        )
+        deaths = sorted(pos for pos in live if table[9 + counts.get(pos, 0)] != alive)
+
+        aging = rule.getAging()
+        nextDying = {}
+        for (pos, state) in dying.items():
+            state = aging[state]
+            cells[pos] = state
+            if state:
+                nextDying[pos] = state
+        dyingState = rule.getDyingState()
+        for pos in deaths:
+            cells[pos] = dyingState
+            if dyingState:
+                nextDying[pos] = dyingState
+        for pos in births:
+            cells[pos] = alive
+
+        live.difference_update(deaths)
+        live.update(births)
+        self._dying = nextDying
+        return (births, deaths)
+
+
+class CountEngine(Engine):
+    """Keeps the live neighbor count of every cell between generations; best
+    for big boards where little is going on.
+
+    A cell can only change if it changed in the last generation or its count
+    did, so each step only looks at those cells, and every birth and death
+    then updates the eight counts around it. The cost follows the number of
+    changes rather than the population or the board size. After a
+    ``reset()`` the counts are rebuilt from the live cells.
+    """
+
+    NAME = EngineName.COUNTS
+
+    def __init__(self) -> None:
+        self._counts = bytearray()
+        self._candidates: Set[int] = set()
+        self._edges: Dict[int, Tuple[int, ...]] = {}
+        self._shape: Union[Tuple[int, int, str], None] = None
+        self._synced = False
+
+    def reset(self) -> None:
+        self._synced = False
+
+    def getCandidates(self) -> Set[int]:
+        """Positions the next step will look at."""
+        return self._candidates
+
+    def _edge(self, pos: int, cols: int, rows: int, topology: str) -> Tuple[int, ...]:
+        """Neighbors of a cell on the border of the board, following the topology."""
+        around = self._edges.get(pos)
+        if around is None:
+            (x, y) = (pos % cols, pos // cols)
+            around = []
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    if dx or dy:
+                        point = wrap(topology, x + dx, y + dy, cols, rows)
+                        if point is not None:
+                            around.append(point[1] * cols + point[0])
+            around = self._edges[pos] = tuple(around)
+        return around
+
+    def _sync(self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str) -> None:
+        if self._shape != (cols, rows, topology):
+            self._shape = (cols, rows, topology)
+            self._edges = {}
+        counts = bytearray(len(cells))
+        candidates = set()
+        steps = (-cols - 1, -cols, -cols + 1, -1, 1, cols - 1, cols, cols + 1)
+        last = (rows - 1) * cols
+        pos = cells.find(CellState.ALIVE)
+        while pos >= 0:
+            x = pos % cols
+            around = [pos + step for step in steps] if 0 < x < cols - 1 and cols <= pos < last else self._edge(pos, cols, rows, topology)
+            for other in around:
+                counts[other] += 1
+            candidates.add(pos)
+            candidates.update(around)
+            pos = cells.find(CellState.ALIVE, pos + 1)
+        if rule.next(CellState.DEAD, 0) != CellState.DEAD:
+            candidates = set(range(len(cells)))
+        elif cells.count(CellState.DEAD) + cells.count(CellState.ALIVE) != len(cells):
+            candidates.update(pos for (pos, state) in enumerate(cells) if state > CellState.ALIVE)
+        self._counts = counts
+        self._candidates = candidates
+        self._synced = True
+
+    def step(
+        self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str
+    ) -> Tuple[List[int], List[int]]:
+        if not self._synced or self._shape != (cols, rows, topology):
+            self._sync(cells, cols, rows, rule, topology)
+        table = rule.getTable()
+        counts = self._counts
+        changes = []
+        for pos in self._candidates:
+            state = cells[pos]
+            state2 = table[state * 9 + counts[pos]]
+            if state2 != state:
+                changes.append((pos, state2))
+
+        alive = CellState.ALIVE
+        steps = (-cols - 1, -cols, -cols + 1, -1, 1, cols - 1, cols, cols + 1)
+        last = (rows - 1) * cols
+        births = []
+        deaths = []
+        candidates = set()
+        for (pos, state) in changes:
+            if state == alive:
+                births.append(pos)
+                delta = 1
+            elif cells[pos] == alive:
+                deaths.append(pos)
+                delta = -1
+            else:
+                # A dying cell aging; no count changes around it.
+                delta = 0
+            cells[pos] = state
+            candidates.add(pos)
+            if delta:
+                x = pos % cols
+                around = [pos + step for step in steps] if 0 < x < cols - 1 and cols <= pos < last else self._edge(pos, cols, rows, topology)
+                for other in around:
+                    counts[other] += delta
+                candidates.update(around)
+
+        self._candidates = candidates
+        births.sort()
+        deaths.sort()
+        return (births, deaths)
+
+
+class EngineSwitch:
+    def __init__(self, step: int, old: str, new: str, density: float, cost: float) -> None:
+        self._step = step
+        self._old = old
+        self._new = new
+        self._density = density
+        self._cost = cost
+
+    def __str__(self) -> str:
+        return (
+            f"step {self._step}: {self._old} -> {self._new} engine"
+            f" (density {self._density:.4f}, {self._cost * 1000:.3f} ms/generation)"
+        )
+
+    def getStep(self) -> int:
+        """Number of steps the ``AutoEngine`` had taken before the switch."""
+        return self._step
+
+    def getOld(self) -> str:
+        return self._old
+
+    def getNew(self) -> str:
+        return self._new
+
+    def getDensity(self) -> float:
+        """Live cells per cell in the rows holding live cells."""
+        return self._density
+
+    def getCost(self) -> float:
+        """Average seconds per generation measured on the old engine."""
+        return self._cost
+
+
+def rowWorkload(cells: bytearray, cols: int) -> int:
+    """Cells in the rows holding live cells, which the row engine steps."""
+    alive = CellState.ALIVE
+    return cols * sum(1 for offset in range(0, len(cells), cols) if cells.find(alive, offset, offset + cols) >= 0)
+
+
+def boardWorkload(cells: bytearray, cols: int) -> int:
+    """Every cell, which the array engine steps."""
+    return len(cells)
+
+
+class AutoEngine(Engine):
+    """Moves the board between the sparse and a dense engine as it thins out
+    or fills up.
+
+    Every ``interval`` generations the density of the live cells within the
+    ``workload`` of the dense engine (the cells it would visit) is measured.
+    Below ``sparseBelow`` the sparse engine takes over, above ``denseAbove``
+    the dense one does; the gap between the two and the ``cooldown`` after
+    every switch keep a board near the crossover from bouncing between them.
+    The board itself is the shared state, so a switch only drops the caches
+    of the engine taking over. The dense engine is only created by ``dense``
+    when it is first needed.
+    """
+
+    NAME = EngineName.AUTO
+
+    def __init__(
+        self,
+        sparseBelow: float = 0.02,
+        denseAbove: float = 0.035,
+        interval: int = 16,
+        cooldown: int = 64,
+        log: Union[Callable[[str], None], None] = None,
+        dense: Callable[[], Engine] = RowEngine,
+        workload: Callable[[bytearray, int], int] = rowWorkload,
+    ) -> None:
+        self._createDense = dense
+        self._workload = workload
+        self._dense: Union[Engine, None] = None
+        self._sparse = SparseEngine()
+        self._engine: Union[Engine, None] = None
+        self._sparseBelow = sparseBelow
+        self._denseAbove = denseAbove
+        self._interval = interval
+        self._cooldown = cooldown
+        self._log = log
+        self._steps = 0
+        self._nextCheck = 0
+        self._cost = 0.0
+        self._switches: List[EngineSwitch] = []
+
+    def describe(self) -> str:
+        if self._engine is None:
+            return self.NAME
+        return f"{self.NAME}/{self._engine.describe()}"
+
+    def getEngine(self) -> Union[Engine, None]:
+        """Engine doing the stepping; None until the first step."""
+        return self._engine
+
+    def getSwitches(self) -> List[EngineSwitch]:
+        return self._switches
+
+    def reset(self) -> None:
+        if self._engine is not None:
+            self._engine.reset()
+        # Re-check right away; an edit may have changed the density a lot.
+        self._nextCheck = self._steps
+
+    def density(self, cells: bytearray, cols: int) -> float:
+        workload = self._workload(cells, cols)
+        if not workload:
+            return 0.0
+        return cells.count(CellState.ALIVE) / workload
+
+    def denseEngine(self) -> Engine:
+        if self._dense is None:
+            self._dense = self._createDense()
+        return self._dense
+
+    def choose(self, density: float, rule: Rule) -> Engine:
+        if not self._sparse.supports(rule):
+            return self.denseEngine()
+        if self._engine is None:
+            # The first pick has no side to stick to; split the difference.
+            sparse = density < (self._sparseBelow + self._denseAbove) / 2
+        elif self._engine is self._sparse:
+            sparse = density <= self._denseAbove
+        else:
+            sparse = density < self._sparseBelow
+        return self._sparse if sparse else self.denseEngine()
+
+    def step(
+        self, cells: bytearray, cols: int, rows: int, rule: Rule, topology: str
+    ) -> Tuple[List[int], List[int]]:
+        if self._steps >= self._nextCheck:
+            density = self.density(cells, cols)
+            engine = self.choose(density, rule)
+            self._nextCheck = self._steps + self._interval
+            if self._engine is None:
+                engine.reset()
+                self._engine = engine
+            elif engine is not self._engine:
+                switch = EngineSwitch(self._steps, self._engine.NAME, engine.NAME, density, self._cost)
+                self._switches.append(switch)
+                if self._log:
+                    self._log(str(switch))
+                engine.reset()
+                self._engine = engine
+                self._nextCheck = self._steps + self._cooldown
+                self._cost = 0.0
+
+        start = time.perf_counter()
+        result = self._engine.step(cells, cols, rows, rule, topology)
+        elapsed = time.perf_counter() - start
+        # Exponential moving average, seeded by the first step on an engine.
+        self._cost = elapsed if not self._cost else self._cost + (elapsed - self._cost) / 8
+        self._steps += 1
+        return result
+
+
+def _arrayEngine() -> Engine:
+    from gameoflife.arrayengine import ArrayEngine
+
+    return ArrayEngine()
+
+
+def arrayBackend() -> Union[str, None]:
+    """Kernel the array engine would use: "numba", "numpy" or None.
+
+    Only looks the packages up, so it is cheap to call at startup.
+    """
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    return "numba" if importlib.util.find_spec("numba") is not None else "numpy"
+
+
+def createEngine(name: str, log: Union[Callable[[str], None], None] = None) -> Engine:
+    if name == EngineName.ARRAY:
+        if arrayBackend() is None:
+            raise ValueError("the array engine needs NumPy, which is not installed")
+        return _arrayEngine()
+    if name == EngineName.AUTO:
+        if arrayBackend() is None:
+            return AutoEngine(log=log)
+        # The array engine steps the whole board at a few ns per cell, the
+        # sparse engine costs about 1.5 us per live cell.
+        return AutoEngine(sparseBelow=0.003, denseAbove=0.006, log=log, dense=_arrayEngine, workload=boardWorkload)
+    engines = {EngineName.ROWS: RowEngine, EngineName.SPARSE: SparseEngine, EngineName.COUNTS: CountEngine}
+    if name not in engines:
+        raise ValueError(f"unknown engine '{name}', expected one of {', '.join(EngineName.ALL)}")
+    return engines[name]()
@@ -9,4 +9,5 @@ EVENT_NEXT = Event(USEREVENT + 4)
 EVENT_PATTERNS = Event(USEREVENT + 5)
 EVENT_EXIT = Event(USEREVENT + 6)
 EVENT_INPUT_MODE_DRAW = Event(USEREVENT + 7)
-EVENT_INPUT_MODE_PAN = Event(USEREVENT + 8)
\ No newline at end of file
+EVENT_INPUT_MODE_PAN = Event(USEREVENT + 8)
+EVENT_PREV = Event(USEREVENT + 9)
@@ -1,85 +1,150 @@
 import concurrent.futures
 import glob
+import math
+import os
 import pygame
+import pygame.freetype
 import time
 
 from pygame.event import Event
-from pygame.freetype import SysFont
-from pygame.locals import KEYDOWN, MOUSEBUTTONUP, MOUSEBUTTONDOWN, K_g, K_a, K_d, K_s, K_w, K_ESCAPE, TEXTINPUT, MOUSEMOTION
+from pygame.freetype import Font
+from pygame.locals import KEYDOWN, KMOD_CTRL, MOUSEBUTTONUP, MOUSEBUTTONDOWN, K_g, K_a, K_d, K_j, K_s, K_w, K_BACKSPACE, K_ESCAPE, K_KP_ENTER, K_RETURN, K_F3, K_F5, K_F6, K_F7, MOUSEMOTION
 from pygame.surface import Surface
-from typing import List
+from typing import TYPE_CHECKING, List, Tuple, Union
 
+from gameoflife.assets import getFont, getImage
+from gameoflife.autosave import Autosave
 from gameoflife.bresenham import bresenham
 from gameoflife.button import BaseButton, ButtonID, RectButton, ToggleRectButton
-from gameoflife.cell import Cell, CellState, getAliveNeighbors, getCellAtPoint
-from gameoflife.color import Color
+from gameoflife.cell import CellState
+from gameoflife.color import Color, cellPalette
 from gameoflife.config import Config
+from gameoflife.cycle import Cycle, CycleDetector, CycleType
+from gameoflife.dispatcher import InputDispatcher
 from gameoflife.draw import drawRectBorder
+from gameoflife.engine import EngineName, arrayBackend
 from gameoflife.event import *
 from gameoflife.grid import Grid
 from gameoflife.input import InputMode, InputModeManager
+from gameoflife.journal import JournalWriter
+from gameoflife.jump import Jump
+from gameoflife.metrics import Metrics
 from gameoflife.mouse import MOUSEBUTTON_LCLICK, MOUSEBUTTON_RCLICK, MOUSEBUTTON_SCROLL_DOWN, MOUSEBUTTON_SCROLL_UP
 from gameoflife.pattern import Pattern, PatternMenu, PatternType
+from gameoflife.rule import CONWAY, Rule
+from gameoflife.save import BoardSnapshot, readSnapshot, writeSnapshot
+from gameoflife.simulation import Simulation
+from gameoflife.startup import StartupProfile
+from gameoflife.tiles import TiledBoard
+from gameoflife.timeline import Timeline
+from gameoflife.topology import Topology, parseTopology
+
+if TYPE_CHECKING:
+    from gameoflife.recorder import Recorder
 
 
 class Game:
-    def __init__(self) -> None:
-        pygame.init()
+    def __init__(self, startup: Union[StartupProfile, None] = None) -> None:
+        # Only the subsystems the game uses; pygame.init() also starts audio
+        # and joystick support, which can take a noticeable time to probe.
+        pygame.display.init()
+        pygame.freetype.init()
         pygame.display.set_caption("Game of Life")
 
-        iconImg = pygame.image.load("images/gameoflife.png")
+        iconImg = getImage("images/gameoflife.png")
         if iconImg:
             pygame.display.set_icon(iconImg)
 
+        self._startup = startup
+        self.startupPhase("init")
         self._buttons = []
         self._cfg = Config()
         self._clock = pygame.time.Clock()
         self._fontSize = self._cfg.get('font.size', default=12)
-        self._font = SysFont('Hack', self._fontSize)
+        self.startupPhase("config")
+        self._font = getFont('Hack', self._fontSize)
+        self.startupPhase("fonts")
         self._fps = self._cfg.get("fps", default=5)
         self._height = self._cfg.get("screen.height")
         self._width = self._cfg.get("screen.width")
         self._screen = pygame.display.set_mode([self._width, self._height])
+        self.startupPhase("display")
         self._cellH = self._cfg.get("cell.height", default=5)
         self._cellW = self._cfg.get("cell.width", default=5)
         self._actionBarHeight = 70
         self._actionBarX = 0
         self._actionBarY = self._height - self._actionBarHeight
-        self._cells = None
         self._cols = 200
         self._colsVisible = int(self._width / self._cellW)
         self._rows = 200
         self._rowsVisible = int(self._height / self._cellH)
         self._grid = Grid(self._colsVisible, self._rowsVisible, self._cellW, self._cellH)
-        self._cellsurf = Surface((self._cols * self._cellW, self._rows * self._cellH))
         self._cameraX = int((self._cols / 2) - (self._colsVisible / 2))
         self._cameraY = int((self._rows / 2) - (self._rowsVisible / 2))
-        self._cameraMoveDist = 5
+        self._cameraPx = [float(self._cameraX * self._cellW), float(self._cameraY * self._cellH)]
+        self._panSpeed = self._cfg.get("pan.speed", default=600)
+        self._panFriction = self._cfg.get("pan.friction", default=6.0)
+        self._panVelocity = [0.0, 0.0]
+        self._panDrag = False
+        self._panMotionTime = 0.0
+        self._panTime = time.perf_counter()
         self._clear = False
         self._next = False
         self._running = True
         self._stopped = True
         self._patternsMenu = PatternMenu(50, 50, maxHeight=400, font=self._font)
+        self._patternsLoaded = False
         self._pattern = None
-        self._generation = 0
-        self._cells = []
-        self._cellsAlive = 0
-        self._cellsBirthed = 0
-        self._cellsDied = 0
+        self._sim = None
+        self._palette = cellPalette(2)
+        self._viewSurf = None
+        self._scratchSurf = None
+        self._viewState = None
         self._mouseButtonHold = False
         self._mouseClickPos = None
         self._mouseClickPos2 = None
         self._inputModeMngr = InputModeManager(font=self._font)
+        self._input = InputDispatcher()
         self._lastMarkedCell = None
+        self._saveDir = self._cfg.get("save.dir", default="saves")
+        self._autosave = None
+        self._cycle = None
+        self._cycleAction = self._cfg.get("cycle.action", default="none")
+        self._profileCapture = None
+        self._profileDir = self._cfg.get("profiler.dir", default="profiles")
+        self._metrics = Metrics(
+            enabled=self._cfg.get("metrics.enabled", default=False),
+            window=self._cfg.get("metrics.window", default=240),
+            log=self._cfg.get("metrics.log", default="") or None,
+        )
+        self._metricsOverlay = self._cfg.get("metrics.overlay", default=False)
+        self._recorder = None
+        self._recordDir = self._cfg.get("recorder.dir", default="recordings")
+        self._idle = self._cfg.get("idle.enabled", default=True)
+        self._idleTimeout = self._cfg.get("idle.timeout", default=500)
+        self._dirty = True
+        self._jump = None
+        self._jumpEntry = None
+        self._jumpSample = self._cfg.get("jump.sample", default=0.5)
+        self._journal = None
+        self._deltas = None
+
+        if self._cfg.get("autosave.enabled", default=False):
+            self._autosave = Autosave(
+                self._cfg.get("autosave.dir", default=self._saveDir),
+                interval=self._cfg.get("autosave.interval", default=300),
+                retention=self._cfg.get("autosave.retention", default=5),
+            )
 
         self.zoom = 1
         self.zoomMax = 10
         self.zoomMin = 1
         self.zoomStep = 1
 
-        self.initPatterns()
         self.initButtons()
+        self.startupPhase("buttons")
         self.initCells()
+        self.startupPhase("cells")
 
     def initButtons(self) -> None:
         btnHeight = 30
@@ -90,6 +155,7 @@ class Game:
         self._buttons = [
             RectButton(ButtonID.CLEAR, EVENT_CLEAR),
             ToggleRectButton(ButtonID.START, onDisable=[ButtonID.START, EVENT_STOP], onEnable=[ButtonID.STOP, EVENT_START]),
+            RectButton(ButtonID.PREV, EVENT_PREV),
             RectButton(ButtonID.NEXT, EVENT_NEXT),
             RectButton(ButtonID.PATTERNS, EVENT_PATTERNS),
             RectButton(ButtonID.EXIT, EVENT_EXIT),
@@ -113,12 +179,115 @@ class Game:
         self._inputModeMngr.addMode(ButtonID.ZOOM_IN, EVENT_INPUT_MODE_PAN, imagePath="images/zoomin.png")
         self._inputModeMngr.addMode(ButtonID.ZOOM_OUT, EVENT_INPUT_MODE_PAN, imagePath="images/zoomout.png")
 
+        for button in self._buttons:
+            self._input.add(button)
+        self._input.add(self._inputModeMngr)
+
     def initCells(self) -> None:
-        self._cells = []
-        for i in range(self._cols * self._rows):
-            x = i % self._rows
-            y = int(i / self._rows)
-            self._cells.append(Cell(x, y, self._cellW, self._cellH, CellState.DEAD))
+        tilesPath = self._cfg.get("tiles.path", default="")
+        if tilesPath and self.initTiles(tilesPath):
+            return
+
+        timeline = None
+        cycleDetector = None
+
+        if self._cfg.get("timeline.enabled", default=False):
+            timeline = Timeline(
+                keyframeInterval=self._cfg.get("timeline.keyframeInterval", default=32),
+                maxBytes=self._cfg.get("timeline.maxBytes", default=16 * 1024 * 1024),
+            )
+
+        if self._cfg.get("cycle.enabled", default=False):
+            cycleDetector = CycleDetector(
+                self._cols, self._rows, maxHistory=self._cfg.get("cycle.history", default=4096)
+            )
+
+        rule = self._cfg.get("rule", default=CONWAY)
+        try:
+            rule = Rule.parse(rule)
+        except ValueError as e:
+            print(f"{e}, falling back to {CONWAY}")
+            rule = Rule.parse(CONWAY)
+
+        topology = self._cfg.get("topology", default=Topology.DEAD)
+        try:
+            topology = parseTopology(topology)
+        except ValueError as e:
+            print(f"{e}, falling back to {Topology.DEAD}")
+            topology = Topology.DEAD
+
+        engine = self._cfg.get("engine.name", default=EngineName.AUTO)
+        if engine not in EngineName.ALL:
+            print(f"unknown engine '{engine}', falling back to {EngineName.AUTO}")
+            engine = EngineName.AUTO
+        elif engine == EngineName.ARRAY and arrayBackend() is None:
+            print(f"the array engine needs NumPy, falling back to {EngineName.AUTO}")
+            engine = EngineName.AUTO
+        log = print if self._cfg.get("engine.log", default=False) else None
+
+        self._sim = Simulation(
+            self._cols,
+            self._rows,
+            timeline=timeline,
+            cycleDetector=cycleDetector,
+            rule=rule,
+            topology=topology,
+            engine=engine,
+            log=log,
+        )
+        self._deltas = self._sim.iterGenerations()
+        self.ruleChanged()
+
+        if self._cfg.get("journal.enabled", default=False):
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(self._cfg.get("journal.dir", default="journals"), f"journal-{stamp}.golj")
+            try:
+                self._journal = JournalWriter(
+                    path,
+                    self._cols,
+                    self._rows,
+                    keyframeInterval=self._cfg.get("journal.keyframeInterval", default=1024),
+                )
+            except OSError as e:
+                print(f'cannot write journal "{path}": {e}')
+
+    def initTiles(self, path: str) -> bool:
+        """Open the tiled board at ``path``, or create it, in place of the in-memory one.
+
+        A tiled board has no timeline, cycle detection, jumps, recording,
+        census or snapshots; saving flushes it to its own file instead.
+        """
+        try:
+            if os.path.exists(path + ".json"):
+                board = TiledBoard.open(path, maxResident=self._cfg.get("tiles.maxResident", default=256))
+            else:
+                board = TiledBoard(
+                    self._cfg.get("tiles.cols", default=200000),
+                    self._cfg.get("tiles.rows", default=200000),
+                    path,
+                    tileSize=self._cfg.get("tiles.tileSize", default=256),
+                    maxResident=self._cfg.get("tiles.maxResident", default=256),
+                    rule=Rule.parse(self._cfg.get("rule", default=CONWAY)),
+                )
+        except (OSError, ValueError, KeyError) as e:
+            print(f'cannot open tiled board "{path}": {e}, falling back to a {self._cols}x{self._rows} board')
+            return False
+
+        self._sim = board
+        self._cols = board.getCols()
+        self._rows = board.getRows()
+        self._cameraPx = [
+            float((self._cols // 2 - self._colsVisible // 2) * self._cellW),
+            float((self._rows // 2 - self._rowsVisible // 2) * self._cellH),
+        ]
+        if self._autosave:
+            self._autosave.close()
+            self._autosave = None
+        self.ruleChanged()
+        return True
+
+    def tiled(self) -> bool:
+        return isinstance(self._sim, TiledBoard)
 
     def initPatterns(self) -> None:
         patternTypes = {
@@ -138,63 +307,59 @@ class Game:
                     patterns.append(pattern)
 
         self._patternsMenu.setPatterns(patterns)
-
-    def eventLoop(self) -> None:
-        for event in pygame.event.get():
+        self._patternsLoaded = True
+        self._input.add(self._patternsMenu)
+
+    def eventLoop(self, events: Union[List[Event], None] = None) -> None:
+        if events is None:
+            events = pygame.event.get()
+        self._input.sample()
+        for event in events:
             buttonCode = event.dict.get("button")
             inputMode = self._inputModeMngr.mode()
-
-            (mX, mY) = pygame.mouse.get_pos()
-            cellX = int(mX / self._cellW) + self._cameraX
-            cellY = int(mY / self._cellH) + self._cameraY
-
-            if self._patternsMenu.enabled():
-                ret = self._patternsMenu.eventHandler(event)
-                if ret:
+            pos = event.dict.get("pos")
+            (mX, mY) = pos or self._input.getPos()
+
+            # Mouse events go only to the widget under them; the open pattern
+            # menu also gets the keyboard so escape closes it.
+            (widget, ret) = self._input.dispatch(event)
+            if widget is None and event.type == KEYDOWN and self._patternsMenu.enabled():
+                (widget, ret) = (self._patternsMenu, self._patternsMenu.eventHandler(event))
+            if ret:
+                if widget is self._patternsMenu:
                     self._mouseButtonHold = False
+                    self._panDrag = False
                     if isinstance(ret, Pattern):
                         self._pattern = ret
                         self._pattern.setCellHeight(self._cellH)
                         self._pattern.setCellWidth(self._cellW)
-                    continue
-            elif self._inputModeMngr.eventHandler(event):
+                        self.onPatternRule(self._pattern)
                 continue
             # -----------------------------------------------------
-            if inputMode == InputMode.DRAW:
+            if inputMode == InputMode.DRAW and pos is not None and self._jump is None:
+                (cellX, cellY) = self.cellAt(mX, mY)
                 if event.type == MOUSEBUTTONDOWN and buttonCode == MOUSEBUTTON_LCLICK and mY < self._actionBarY:
                     if self._pattern:
-                        selectedCells = self._pattern.getCells()
-                        for y in range(len(selectedCells)):
-                            for x in range(len(selectedCells[y])):
-                                selectedCell = selectedCells[y][x]
-                                nextCellX = cellX + x
-                                nextCellY = cellY + y
-                                if nextCellX >= self._cols or nextCellY >= self._rows:
-                                    break
-                                cell = getCellAtPoint(nextCellX, nextCellY, self._cells, self._rows)
-                                if selectedCell.getState() == CellState.ALIVE:
-                                    cell.setState(CellState.ALIVE)
+                        for (x, y) in self._pattern.getPoints():
+                            self._sim.setState(cellX + x, cellY + y, CellState.ALIVE)
                     else:
-                        cell = getCellAtPoint(cellX, cellY, self._cells, self._rows)
-                        cell.setState(CellState.ALIVE)
+                        self._sim.setState(cellX, cellY, CellState.ALIVE)
                 elif event.type == MOUSEMOTION:
                     if self._mouseButtonHold and mY < self._actionBarY:
-                        cell = getCellAtPoint(cellX, cellY, self._cells, self._rows)
-                        cell.setState(CellState.ALIVE)
+                        self._sim.setState(cellX, cellY, CellState.ALIVE)
                         if self._lastMarkedCell:
                             (prevX, prevY) = self._lastMarkedCell
                             if cellX - prevX != 0 or cellY - prevY != 0:
                                 for point in list(bresenham(prevX, prevY, cellX, cellY)):
                                     (x, y) = point
-                                    c = getCellAtPoint(x, y, self._cells, self._rows)
-                                    c.setState(CellState.ALIVE)
+                                    self._sim.setState(x, y, CellState.ALIVE)
                         self._lastMarkedCell = (cellX, cellY)
                 elif event.type == MOUSEBUTTONUP:
                     if buttonCode == MOUSEBUTTON_RCLICK:
-                        cell = getCellAtPoint(cellX, cellY, self._cells, self._rows)
-                        cell.setState(CellState.DEAD)
+                        self._sim.setState(cellX, cellY, CellState.DEAD)
             elif inputMode == InputMode.PAN:
-                pass
+                if event.type == MOUSEMOTION and self._panDrag:
+                    self.dragCamera(event.rel)
 
             elif inputMode == InputMode.SELECT:
                 pass
@@ -208,43 +373,41 @@ class Game:
             if event.type == pygame.QUIT:
                 self.quit()
 
+            elif event.type == KEYDOWN and self._jumpEntry is not None:
+                self.jumpKey(event)
+
             elif event.type == KEYDOWN:
-                if event.key == K_ESCAPE:
+                if event.key == K_ESCAPE and self._jump:
+                    self.cancelJump()
+                elif event.key == K_s and event.mod & KMOD_CTRL:
+                    try:
+                        print(f'saved board to "{self.save()}"')
+                    except OSError as e:
+                        print(f"failed to save board: {e}")
+                elif event.key == K_ESCAPE:
                     self._pattern = None
                     self._mouseClickPos = None
                     self._mouseClickPos2 = None
                 elif event.key == K_g:
                     self._grid.toggle()
-                elif event.key == K_a: # left
-                    if self._cameraX:
-                        self._cameraX -= self._cameraMoveDist
-                elif event.key == K_d: # right
-                    if self._cameraX < self._cols - self._colsVisible:
-                        self._cameraX += self._cameraMoveDist
-                elif event.key == K_s: # down
-                    if self._cameraY < self._rows - self._rowsVisible:
-                        self._cameraY += self._cameraMoveDist
-                elif event.key == K_w: # up
-                    if self._cameraY:
-                        self._cameraY -= self._cameraMoveDist
-
-            elif event.type == TEXTINPUT:
-                eventText = event.dict.get('text')
-                if eventText:
-                    eventText = eventText.lower()
-
-                if eventText == 'a':
-                    if self._cameraX:
-                        self._cameraX -= self._cameraMoveDist
-                elif eventText == 'd':
-                    if self._cameraX < self._cols - self._colsVisible:
-                        self._cameraX += self._cameraMoveDist
-                elif eventText == 's':
-                    if self._cameraY < self._rows - self._rowsVisible:
-                        self._cameraY += self._cameraMoveDist
-                elif eventText == 'w':
-                    if self._cameraY:
-                        self._cameraY -= self._cameraMoveDist
+                elif event.key == K_j and not self._jump:
+                    self._jumpEntry = ""
+                elif event.key == K_F3:
+                    self._metricsOverlay = not self._metricsOverlay
+                    if self._metricsOverlay and not self._metrics.enabled():
+                        self._metrics.enable()
+                elif event.key == K_F5:
+                    if self._profileCapture and self._profileCapture.active():
+                        self.stopProfile()
+                    else:
+                        self.profile()
+                elif event.key == K_F7:
+                    self.census()
+                elif event.key == K_F6:
+                    if self._recorder:
+                        self.stopRecording()
+                    else:
+                        self.record()
 
             elif event.type == MOUSEBUTTONDOWN and buttonCode == MOUSEBUTTON_LCLICK:
                 if mY < self._actionBarY:
@@ -258,8 +421,8 @@ class Game:
                             self._mouseClickPos = (mX, mY)
                             self._mouseClickPos2 = None
                     elif inputMode == InputMode.PAN:
-                        self._mouseClickPos = (mX, mY)
-                        print(f'self._mouseClickPos = ({mX}, {mY})')
+                        self._panDrag = True
+                        self._panVelocity = [0.0, 0.0]
 
                     if inputMode == InputMode.DRAW and not self.stopped():
                         self.stop()
@@ -279,6 +442,11 @@ class Game:
                 elif buttonCode == MOUSEBUTTON_LCLICK:
                     self._mouseButtonHold = False
                     self._lastMarkedCell = None
+                    if self._panDrag:
+                        self._panDrag = False
+                        # Only a drag still moving when released keeps its momentum.
+                        if time.perf_counter() - self._panMotionTime > 0.05:
+                            self._panVelocity = [0.0, 0.0]
 
             elif event == EVENT_START:
                 self.start()
@@ -288,135 +456,319 @@ class Game:
                 self.clear()
             elif event == EVENT_NEXT:
                 self._next = True
+            elif event == EVENT_PREV:
+                self.stepBack()
             elif event == EVENT_PATTERNS:
+                # The pattern files are parsed the first time the menu opens.
+                if not self._patternsLoaded:
+                    self.initPatterns()
                 self._patternsMenu.toggle()
             elif event == EVENT_EXIT:
                 self.quit()
 
-            for button in self._buttons:
-                button.eventHandler(event)
-
     def loop(self) -> None:
         while self.running():
-            self.eventLoop()
+            idle = self.idle()
+            events = self.waitEvents() if idle else pygame.event.get()
+            if events:
+                self._dirty = True
+            with self._metrics.timer("events"):
+                self.eventLoop(events)
             self.update()
-            self.draw()
-            self._clock.tick(self._fps)
+            if self._dirty:
+                self.draw()
+                self._dirty = False
+                self._metrics.endFrame()
+                if self._startup:
+                    self.startupPhase("first frame")
+                    print(self._startup.report())
+                    self._startup = None
+            # Every pass that did not block in waitEvents() is throttled,
+            # whether it drew or not, so a busy loop never spins a core.
+            if not idle:
+                self._clock.tick(self._fps)
+            if self._profileCapture and self._profileCapture.active():
+                if self._profileCapture.tick(self._sim.getGeneration()):
+                    print(f'profile written to "{self._profileCapture.getPath()}"')
+        if self._jump:
+            self.cancelJump()
+            self._jump.join(1.0)
+        if self._profileCapture and self._profileCapture.active():
+            self.stopProfile()
+        if self._recorder:
+            self.stopRecording()
+        if self._autosave:
+            self._autosave.close()
+        if self._journal:
+            stats = self._journal.close()
+            print(f'journal wrote {stats["generations"]} generations, {stats["bytes"]} bytes to "{self._journal.getPath()}"')
+        if self.tiled():
+            self._sim.close()
+        self._metrics.close()
         pygame.quit()
 
+    def idle(self) -> bool:
+        """True when nothing will change on screen until the next event.
+
+        The loop then blocks in ``waitEvents()`` instead of redrawing the
+        paused board every frame.
+        """
+        if not self._idle or self._dirty or not self.stopped() or self._next or self._clear or self._jump:
+            return False
+        if self.panning():
+            return False
+        return not (self._profileCapture and self._profileCapture.active())
+
+    def waitEvents(self) -> List[Event]:
+        """Block until an event arrives or the idle timeout passes."""
+        event = pygame.event.wait(self._idleTimeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def cellAt(self, x: int, y: int) -> Tuple[int, int]:
+        """Return the board cell under screen pixel ``(x, y)``."""
+        return (int(x + self._cameraPx[0]) // self._cellW, int(y + self._cameraPx[1]) // self._cellH)
+
+    def moveCamera(self, dx: float, dy: float) -> bool:
+        """Pan by ``(dx, dy)`` pixels, clamped to the board. Returns whether the view moved."""
+        maxX = max(0, self._cols * self._cellW - self._colsVisible * self._cellW)
+        maxY = max(0, self._rows * self._cellH - self._rowsVisible * self._cellH)
+        x = min(max(self._cameraPx[0] + dx, 0.0), maxX)
+        y = min(max(self._cameraPx[1] + dy, 0.0), maxY)
+        moved = int(x) != int(self._cameraPx[0]) or int(y) != int(self._cameraPx[1])
+        self._cameraPx = [x, y]
+        self._cameraX = int(x) // self._cellW
+        self._cameraY = int(y) // self._cellH
+        if moved:
+            self._dirty = True
+        return moved
+
+    def dragCamera(self, rel: Tuple[int, int]) -> None:
+        """Follow a mouse drag and track its speed for momentum on release."""
+        now = time.perf_counter()
+        dt = max(now - self._panMotionTime, 1 / 240)
+        (dx, dy) = (-rel[0], -rel[1])
+        self.moveCamera(dx, dy)
+        if now - self._panMotionTime > 0.1:
+            self._panVelocity = [dx / dt, dy / dt]
+        else:
+            self._panVelocity = [
+                0.5 * self._panVelocity[0] + 0.5 * dx / dt,
+                0.5 * self._panVelocity[1] + 0.5 * dy / dt,
+            ]
+        self._panMotionTime = now
+
+    def panKeys(self) -> Tuple[int, int]:
+        """Direction of the WASD keys currently held down."""
+        if pygame.key.get_mods() & KMOD_CTRL:
+            return (0, 0)
+        keys = pygame.key.get_pressed()
+        return (keys[K_d] - keys[K_a], keys[K_s] - keys[K_w])
+
+    def panning(self) -> bool:
+        return self._panVelocity != [0.0, 0.0] or self.panKeys() != (0, 0)
+
+    def updatePan(self) -> None:
+        """Pan at a constant speed while WASD is held, otherwise coast to a stop."""
+        now = time.perf_counter()
+        dt = min(now - self._panTime, 0.1)
+        self._panTime = now
+        if self._panDrag:
+            return
+        (dirX, dirY) = self.panKeys()
+        if dirX or dirY:
+            self._panVelocity = [dirX * self._panSpeed, dirY * self._panSpeed]
+        elif self._panVelocity != [0.0, 0.0]:
+            decay = math.exp(-self._panFriction * dt)
+            self._panVelocity = [self._panVelocity[0] * decay, self._panVelocity[1] * decay]
+            if abs(self._panVelocity[0]) < 5 and abs(self._panVelocity[1]) < 5:
+                self._panVelocity = [0.0, 0.0]
+        if self._panVelocity != [0.0, 0.0]:
+            before = list(self._cameraPx)
+            self.moveCamera(self._panVelocity[0] * dt, self._panVelocity[1] * dt)
+            # Drop the momentum along an axis the edge of the board stopped.
+            self._panVelocity = [
+                velocity if position != start else 0.0
+                for (velocity, position, start) in zip(self._panVelocity, self._cameraPx, before)
+            ]
+
     def update(self) -> None:
         if self.cleared():
-            self.initCells()
+            self._sim.clear()
+            self._cycle = None
+            self._dirty = True
             return
 
-        for button in self._buttons:
-            button.update()
-
-        self._inputModeMngr.update()
-
-        if self._patternsMenu.enabled():
-            self._patternsMenu.update()
-
-        if not self.stopped() or self.next():
-            self._generation += 1
-            self._cellsAlive = 0
-            self._cellsBirthed = 0
-            self._cellsDied = 0
-
-            changed = []
-            #loopOneStart = time.time()
-            for pos in range(self._rows * self._cols):
-                x = pos % self._rows
-                y = int(pos / self._rows)
-                alive = getAliveNeighbors(x, y, self._rows, self._cells)
-                cell = self._cells[pos]
-
-                # 1. Alive cells with < 2 alive neighbors die (under-population).
-                # 2. Alive cells with 2 or 3 neighbors survives to the next generation.
-                # 3. Alive cells with > 3 neighbors dies (over-population).
-                # 4. Dead cells with exactly 3 live neighbors becomes a live cell (reproduction).
-                cellState = cell.getState()
-                if cellState == CellState.ALIVE:
-                    if alive < 2 or alive > 3:
-                        cell.setNextState(CellState.DEAD)
-                        self._cellsDied += 1
-                        changed.append(cell)
-                    elif alive == 2 or alive == 3:
-                        cell.setNextState(CellState.ALIVE)
-                        self._cellsAlive += 1
-                        changed.append(cell)
-                elif cellState == CellState.DEAD:
-                    if alive == 3:
-                        cell.setNextState(CellState.ALIVE)
-                        self._cellsBirthed += 1
-                        self._cellsAlive += 1
-                        changed.append(cell)
-                    else:
-                        cell.setNextState(CellState.DEAD)
-                        changed.append(cell)
-            # loopOneElapsed = time.time() - loopOneStart
-            # loopTwoStart = time.time()
-            for cell in changed:
-                currState = cell.getState()
-                nextState = cell.getNextState()
-                cell.setState(nextState)
-            # loopTwoElapsed = time.time() - loopTwoStart
-            # print('update() loop 1 took {:.2} seconds'.format(loopOneElapsed))
-            # print('update() loop 2 took {:.2} seconds'.format(loopTwoElapsed))
-            if not self._cellsAlive:
+        self._input.update()
+        self.updatePan()
+
+        if self._jump:
+            self.updateJump()
+        elif not self.stopped() or self.next():
+            with self._metrics.timer("step"):
+                self.step()
+
+        if self._autosave and self._autosave.due():
+            self._autosave.submit(self.snapshot())
+
+    def step(self) -> None:
+        if self.tiled():
+            self._sim.step()
+            self._dirty = True
+            if not self._sim.getPopulation():
                 self.stop()
+            return
+
+        delta = next(self._deltas)
+        if self._journal:
+            self._journal.record(delta, self._sim)
+        self._dirty = True
+        if self._recorder:
+            self._recorder.capture(self._sim.getCells())
+        self.onCycle(self._sim.cycle())
+        if not self._sim.getPopulation():
+            self.stop()
 
     def draw(self) -> None:
         screen = self._screen
-        cameraX, cameraY = self._cameraX, self._cameraY
-        cellH, cellW = self._cellH, self._cellW
-        colsVis, rowsVis = self._colsVisible, self._rowsVisible
+        (cameraX, cameraY) = (int(self._cameraPx[0]), int(self._cameraPx[1]))
+        metrics = self._metrics
+
+        with metrics.timer("render"):
+            screen.fill(Color.WHITE)
+
+            # The cell buffer already holds one palette index per cell, so it
+            # is wrapped (not copied) as an 8-bit surface and only the visible
+            # part is scaled up into the viewport-sized render target. A tiled
+            # board is never held whole; just the cells under the viewport are
+            # read out of it, ``origin`` being where they sit on the board.
+            if self.tiled():
+                origin = (cameraX // self._cellW, cameraY // self._cellH)
+                size = (self._colsVisible + 2, self._rowsVisible + 2)
+                cells = self._sim.region(origin[0], origin[1], size[0], size[1])
+            else:
+                (origin, size) = ((0, 0), (self._cols, self._rows))
+                cells = self._sim.getCells()
+                if self._jump and self._jump.getSample():
+                    cells = self._jump.getSample()
+            cellsurf = pygame.image.frombuffer(cells, size, "P")
+            inputMode = self._inputModeMngr.mode()
 
-        screen.fill(Color.WHITE)
+            screen.blit(self.renderView(cellsurf, cameraX, cameraY, origin), (0, 0))
+            self._grid.draw(screen, (cameraX % self._cellW, cameraY % self._cellH))
 
-        for y in range(rowsVis):
-            for x in range(colsVis):
-                cell = getCellAtPoint(cameraX + x, cameraY + y, self._cells, self._rows)
-                cell.draw(self._cellsurf)
+        with metrics.timer("ui"):
+            (mX, mY) = self._input.getPos()
 
-        cellSurfRect = pygame.Rect(cameraX * cellW, cameraY * cellH, colsVis * cellW, rowsVis * cellH)
-        inputMode = self._inputModeMngr.mode()
+            if self._pattern and mY < self._actionBarY:
+                patternSurf = self._pattern.getSurface()
+                screen.blit(patternSurf, (mX, mY))
 
-        screen.blit(self._cellsurf, (0, 0), cellSurfRect)
-        self._grid.draw(screen)
+            if inputMode == InputMode.SELECT:
+                mcPos, mcPos2 = self._mouseClickPos, self._mouseClickPos2
+                if mcPos:
+                    if not mcPos2:
+                        selectRect = pygame.Rect(mX, mY, mcPos[0] - mX, mcPos[1] - mY)
+                    else:
+                        selectRect = pygame.Rect(mcPos[0], mcPos[1], mcPos2[0] - mcPos[0], mcPos2[1] - mcPos[1])
+                    drawRectBorder(screen, selectRect)
 
-        (mX, mY) = pygame.mouse.get_pos()
+            if self._patternsMenu.enabled():
+                self._patternsMenu.draw(screen)
 
-        if self._pattern and mY < self._actionBarY:
-            patternSurf = self._pattern.getSurface()
-            screen.blit(patternSurf, (mX, mY))
+            self.drawActionBar()
 
-        if inputMode == InputMode.SELECT:
-            mcPos, mcPos2 = self._mouseClickPos, self._mouseClickPos2
-            if mcPos:
-                if not mcPos2:
-                    selectRect = pygame.Rect(mX, mY, mcPos[0] - mX, mcPos[1] - mY)
+            if mY < self._actionBarY:
+                if self._input.getHovered() is self._patternsMenu:
+                    self._input.setVisible(True)
                 else:
-                    selectRect = pygame.Rect(mcPos[0], mcPos[1], mcPos2[0] - mcPos[0], mcPos2[1] - mcPos[1])
-                drawRectBorder(screen, selectRect)
-
-        if self._patternsMenu.enabled():
-            self._patternsMenu.draw(screen)
-
-        self.drawActionBar()
-
-        if mY < self._actionBarY:
-            if self._patternsMenu.hovered():
-                pygame.mouse.set_visible(True)
+                    cursorSurface = self._inputModeMngr.cursorSurface()
+                    if cursorSurface and not self._pattern:
+                        self._input.setVisible(False)
+                        screen.blit(cursorSurface, (mX, mY))
             else:
-                cursorSurface = self._inputModeMngr.cursorSurface()
-                if cursorSurface and not self._pattern:
-                    pygame.mouse.set_visible(False)
-                    screen.blit(cursorSurface, (mX, mY))
-        else:
-            pygame.mouse.set_visible(True)
+                self._input.setVisible(True)
+
+        with metrics.timer("flip"):
+            pygame.display.update()
+
+    def viewSurface(self) -> Surface:
+        """Return the 8-bit render target the visible cells are scaled into.
+
+        It is the size of the viewport, not the board, and is reallocated
+        only when the number of visible cells or the cell size changes.
+        """
+        size = (self._colsVisible * self._cellW, self._rowsVisible * self._cellH)
+        if self._viewSurf is None or self._viewSurf.get_size() != size:
+            self._viewSurf = Surface(size, depth=8)
+            self._viewSurf.set_palette(self._palette)
+            # Scaled cells that straddle the edge of a strip land here first.
+            self._scratchSurf = Surface(
+                ((self._colsVisible + 1) * self._cellW, (self._rowsVisible + 1) * self._cellH), depth=8
+            )
+            self._scratchSurf.set_palette(self._palette)
+            self._viewState = None
+        return self._viewSurf
+
+    def renderView(self, cellsurf: Surface, x: int, y: int, origin: Tuple[int, int] = (0, 0)) -> Surface:
+        """Bring the view up to date for a camera at board pixel ``(x, y)``.
+
+        ``cellsurf`` holds the cells from board cell ``origin`` on. When the
+        cells have not changed since the last frame and the camera only moved,
+        the previous frame is scrolled with one self-blit and just the newly
+        exposed strips are rasterized.
+        """
+        view = self.viewSurface()
+        (w, h) = view.get_size()
+        version = self._sim.getVersion()
+        state = self._viewState
+        self._viewState = (version, x, y)
+        if state is None or state[0] != version:
+            self.rasterize(cellsurf, pygame.Rect(0, 0, w, h), x, y, origin)
+            return view
+
+        (dx, dy) = (state[1] - x, state[2] - y)
+        if abs(dx) >= w or abs(dy) >= h:
+            self.rasterize(cellsurf, pygame.Rect(0, 0, w, h), x, y, origin)
+            return view
+        if dx or dy:
+            view.scroll(dx, dy)
+        if dx > 0:
+            self.rasterize(cellsurf, pygame.Rect(0, 0, dx, h), x, y, origin)
+        elif dx < 0:
+            self.rasterize(cellsurf, pygame.Rect(w + dx, 0, -dx, h), x, y, origin)
+        if dy > 0:
+            self.rasterize(cellsurf, pygame.Rect(0, 0, w, dy), x, y, origin)
+        elif dy < 0:
+            self.rasterize(cellsurf, pygame.Rect(0, h + dy, w, -dy), x, y, origin)
+        return view
+
+    def rasterize(
+        self, cellsurf: Surface, rect: pygame.Rect, x: int, y: int, origin: Tuple[int, int] = (0, 0)
+    ) -> None:
+        """Scale the cells under ``rect`` of the view into it, for a camera at ``(x, y)``."""
+        view = self._viewSurf
+        cellW, cellH = self._cellW, self._cellH
+        (originX, originY) = origin
+        col0 = max(originX, (x + rect.x) // cellW)
+        row0 = max(originY, (y + rect.y) // cellH)
+        col1 = min(originX + cellsurf.get_width(), -(-(x + rect.right) // cellW))
+        row1 = min(originY + cellsurf.get_height(), -(-(y + rect.bottom) // cellH))
+        view.fill(CellState.DEAD, rect)
+        if col1 <= col0 or row1 <= row0:
+            return
 
-        pygame.display.update()
+        cells = cellsurf.subsurface((col0 - originX, row0 - originY, col1 - col0, row1 - row0))
+        dest = pygame.Rect(col0 * cellW - x, row0 * cellH - y, (col1 - col0) * cellW, (row1 - row0) * cellH)
+        if view.get_rect().contains(dest):
+            pygame.transform.scale(cells, dest.size, view.subsurface(dest))
+            return
+        scratch = self._scratchSurf.subsurface(((0, 0), dest.size))
+        pygame.transform.scale(cells, dest.size, scratch)
+        view.set_clip(rect)
+        view.blit(scratch, dest)
+        view.set_clip(None)
 
     def drawActionBar(self) -> None:
         bg = pygame.Rect(
@@ -436,14 +788,14 @@ class Game:
         self._inputModeMngr.draw(self._screen)
 
         stats = [
-            f"Alive: {self._cellsAlive}",
-            f"Births: {self._cellsBirthed}",
-            f"Deaths: {self._cellsDied}",
-            f"Generation: {self._generation}",
+            f"Alive: {self._sim.getPopulation()}",
+            f"Births: {self._sim.getBirths()}",
+            f"Deaths: {self._sim.getDeaths()}",
+            f"Generation: {self._sim.getGeneration()}",
         ]
 
         statIdx = 0
-        statFont = SysFont('Sans', 15)
+        statFont = getFont('Sans', 15)
         for stat in stats:
             fontRect = statFont.get_rect(stat)
             statFont.render_to(self._screen, (5, (self._actionBarY + 5) + ((fontRect.height + 4) * statIdx)), stat)
@@ -451,19 +803,52 @@ class Game:
 
         statFont.render_to(self._screen, (125, self._actionBarY + 5), "FPS: {:.2f}".format(self._clock.get_fps()))
         statFont.render_to(self._screen, (125, self._actionBarY + 20), "Zoom: {:.2f}".format(self.zoom))
-        statFont.render_to(self._screen, (125, self._actionBarY + 35), f"Visible Cols: {self._colsVisible}")
-        statFont.render_to(self._screen, (125, self._actionBarY + 50), f"Visible Rows: {self._rowsVisible}")
+        statFont.render_to(self._screen, (125, self._actionBarY + 35), f"Visible: {self._colsVisible}x{self._rowsVisible}")
+        statFont.render_to(self._screen, (125, self._actionBarY + 50), f"Engine: {self._sim.getEngine().describe()}")
+
+        if self._jump or self._jumpEntry is not None:
+            self.drawJump(statFont)
+
+        if self._metricsOverlay and self._metrics.enabled():
+            self.drawMetricsOverlay(statFont)
+
+    def drawJump(self, font: Font) -> None:
+        """Jump progress (or the generation being typed) above the buttons."""
+        jump = self._jump
+        if jump:
+            width = int(self._width * jump.fraction())
+            pygame.draw.rect(self._screen, Color.GREY_DARK2, pygame.Rect(0, self._actionBarY, width, 3))
+            text = f"Generation {jump.getGeneration()} of {jump.getTarget()}, {jump.getRate():,.0f} gen/s - Esc to cancel"
+        else:
+            text = f"Go to generation: {self._jumpEntry}_  (+N advances by N, Enter jumps, Esc cancels)"
+        rect = font.get_rect(text)
+        font.render_to(self._screen, ((self._width - rect.width) // 2, self._actionBarY + 5), text)
+
+    def drawMetricsOverlay(self, font: Font) -> None:
+        lines = []
+        for name in self._metrics.names():
+            summary = self._metrics.summary(name)
+            lines.append("{:<7} p50 {:6.2f}  p90 {:6.2f}  p99 {:6.2f} ms".format(name, summary["p50"], summary["p90"], summary["p99"]))
+        if not lines:
+            return
+
+        padding = 5
+        lineHeight = font.get_sized_height() + 2
+        width = max(font.get_rect(line).width for line in lines) + (padding * 2)
+        height = (lineHeight * len(lines)) + (padding * 2)
+        rect = pygame.Rect(125, self._actionBarY - height, width, height)
+        pygame.draw.rect(self._screen, Color.GREY_LIGHT, rect)
+        drawRectBorder(self._screen, rect, Color.GREY)
+        for i, line in enumerate(lines):
+            font.render_to(self._screen, (rect.x + padding, rect.y + padding + (lineHeight * i)), line)
 
 
     def clear(self) -> None:
+        self.cancelJump()
         startStopBtn = self._buttons[self._startStopBtnIdx]
         if startStopBtn.getId() == ButtonID.STOP:
             startStopBtn.toggle()
         self._clear = True
-        self._cellsAlive = 0
-        self._cellsBirthed = 0
-        self._cellsDied = 0
-        self._generation = 0
 
     def cleared(self) -> bool:
         val = self._clear
@@ -478,11 +863,270 @@ class Game:
     def running(self) -> bool:
         return self._running
 
+    def seek(self, generation: int) -> bool:
+        self.cancelJump()
+        if self.tiled():
+            return False
+        timeline = self._sim.getTimeline()
+        if not timeline or not timeline.contains(generation):
+            return False
+        if not self.stopped():
+            self.stop()
+            self._buttons[self._startStopBtnIdx].toggle()
+        self._cycle = None
+        return self._sim.seek(generation)
+
+    def stepBack(self) -> bool:
+        return self.seek(self._sim.getGeneration() - 1)
+
+    def cycle(self) -> Union[Cycle, None]:
+        return self._cycle
+
+    def onCycle(self, cycle: Union[Cycle, None]) -> None:
+        prev = self._cycle
+        self._cycle = cycle
+        if cycle is None or cycle.getType() == CycleType.EXTINCT:
+            return
+        if prev is None or prev.getType() != cycle.getType() or prev.getPeriod() != cycle.getPeriod():
+            print(f"generation {cycle.getGeneration()}: board settled into a period {cycle.getPeriod()} {cycle.getType()}")
+        if self._cycleAction == "stop" and not self.stopped():
+            self.stop()
+            startStopBtn = self._buttons[self._startStopBtnIdx]
+            if startStopBtn.getId() == ButtonID.STOP:
+                startStopBtn.toggle()
+
+    def fastForward(self, target: int) -> bool:
+        if self.tiled():
+            return False
+        return self._sim.fastForward(target)
+
+    def jumpTo(self, generation: int) -> Union[Jump, None]:
+        """Run the board to ``generation`` in the background, keeping the UI live.
+
+        Earlier generations are seeked in the timeline instead.
+        """
+        if self._jump:
+            return None
+        if self.tiled():
+            print("jumps are not available on a tiled board")
+            return None
+        if generation <= self._sim.getGeneration():
+            if not self.seek(generation):
+                print(f"generation {generation} is no longer in the timeline")
+            return None
+        if not self.stopped():
+            self.stop()
+            self._buttons[self._startStopBtnIdx].toggle()
+        engine = self._cfg.get("engine.name", default=EngineName.AUTO)
+        self._jump = Jump(self.snapshot(), generation, engine=engine, sampleInterval=self._jumpSample)
+        self._jump.start()
+        return self._jump
+
+    def advance(self, generations: int) -> Union[Jump, None]:
+        return self.jumpTo(self._sim.getGeneration() + generations)
+
+    def cancelJump(self) -> None:
+        if self._jump:
+            self._jump.cancel()
+
+    def updateJump(self) -> None:
+        """Apply a finished jump; until then just keep its progress on screen."""
+        jump = self._jump
+        self._dirty = True
+        if not jump.done():
+            return
+        self._jump = None
+        if jump.getError():
+            print(f"jump to generation {jump.getTarget()} failed: {jump.getError()}")
+        elif jump.result() is None:
+            print(f"jump to generation {jump.getTarget()} cancelled at generation {jump.getGeneration()}")
+        else:
+            self.restore(jump.result())
+            print(
+                f"jumped to generation {jump.getGeneration()} in {jump.getElapsed():.2f} s"
+                f" ({jump.getRate():,.0f} gen/s)"
+            )
+
+    def jumpKey(self, event: Event) -> None:
+        """Edit the generation typed after pressing J."""
+        if event.key == K_ESCAPE:
+            self._jumpEntry = None
+        elif event.key in (K_RETURN, K_KP_ENTER):
+            entry = self._jumpEntry
+            self._jumpEntry = None
+            if entry.lstrip("+").isdigit():
+                if entry.startswith("+"):
+                    self.advance(int(entry[1:]))
+                else:
+                    self.jumpTo(int(entry))
+        elif event.key == K_BACKSPACE:
+            self._jumpEntry = self._jumpEntry[:-1]
+        elif event.unicode.isdigit() or (event.unicode == "+" and not self._jumpEntry):
+            self._jumpEntry += event.unicode
+
+    def profile(self, seconds: Union[float, None] = None, generations: Union[int, None] = None) -> None:
+        """Start a cProfile/tracemalloc capture of the running game."""
+        if self._profileCapture and self._profileCapture.active():
+            return
+        if seconds is None and generations is None:
+            seconds = self._cfg.get("profiler.seconds", default=10) or None
+            generations = self._cfg.get("profiler.generations", default=0) or None
+        from gameoflife.profiler import ProfileCapture
+
+        self._profileCapture = ProfileCapture(
+            self._profileDir,
+            seconds=seconds,
+            generations=generations,
+            focus=[Game.update, Game.draw, Game.drawActionBar, PatternMenu.draw, Simulation.step, TiledBoard.step],
+            label=lambda: f"engine: {self._sim.getEngine().describe()}",
+        )
+        self._profileCapture.start(self._sim.getGeneration())
+        print("profiling started")
+
+    def stopProfile(self) -> Union[str, None]:
+        if not self._profileCapture:
+            return None
+        path = self._profileCapture.stop(self._sim.getGeneration())
+        print(f'profile written to "{path}"')
+        return path
+
+    def record(self, format: Union[str, None] = None) -> Union["Recorder", None]:
+        """Start recording one frame per generation from the board state."""
+        from gameoflife.recorder import Recorder
+
+        if self._recorder:
+            return self._recorder
+        if self.tiled():
+            print("recording is not available on a tiled board")
+            return None
+        format = format or self._cfg.get("recorder.format", default="gif")
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self._recordDir, f"record-{stamp}")
+        if format != "png":
+            path += ".rgb" if format == "raw" else f".{format}"
+        self._recorder = Recorder(
+            path,
+            self._cols,
+            self._rows,
+            format=format,
+            palette=[(color.r, color.g, color.b) for color in self._palette],
+            scale=self._cfg.get("recorder.scale", default=2),
+            fps=self._cfg.get("recorder.fps", default=30),
+            maxQueue=self._cfg.get("recorder.queue", default=64),
+            command=self._cfg.get("recorder.command", default="") or None,
+        )
+        self._recorder.capture(self._sim.getCells())
+        print(f'recording to "{path}"')
+        return self._recorder
+
+    def stopRecording(self) -> Union[dict, None]:
+        if not self._recorder:
+            return None
+        recorder = self._recorder
+        self._recorder = None
+        stats = recorder.close()
+        print(f'recorded {stats["frames"]} frames to "{recorder.getPath()}" ({stats["dropped"]} dropped)')
+        return stats
+
+    def census(self) -> dict:
+        """Identify the objects on the board and print the counts."""
+        from gameoflife.census import census, loadIndex
+
+        if self.tiled():
+            print("the census is not available on a tiled board")
+            return {}
+        sim = self._sim
+        index = loadIndex("patterns", str(sim.getRule()))
+        counts = census(sim.getCells(), self._cols, self._rows, index, sim.getTopology()).toDict()
+        summary = ", ".join(f"{name} {count}" for (name, count) in counts.items())
+        print(f"generation {sim.getGeneration()}: {summary or 'empty board'}")
+        return counts
+
     def quit(self) -> None:
         self._running = False
 
-    def save(self) -> None:
-        pass
+    def startupPhase(self, name: str) -> None:
+        if self._startup:
+            self._startup.mark(name)
+
+    def load(self, path: str) -> None:
+        self.restore(readSnapshot(path))
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        if self.tiled():
+            raise ValueError("snapshots cannot be restored onto a tiled board")
+        self._sim.restore(snapshot)
+        self._cycle = None
+        self._dirty = True
+        self.ruleChanged()
+
+    def getRule(self) -> Rule:
+        return self._sim.getRule()
+
+    def setRule(self, rule: Union[Rule, str]) -> None:
+        if isinstance(rule, str):
+            rule = Rule.parse(rule)
+        try:
+            self._sim.setRule(rule)
+        except ValueError as e:
+            print(f"cannot switch to {rule}: {e}")
+            return
+        self._cycle = None
+        self.ruleChanged()
+
+    def getTopology(self) -> str:
+        return self._sim.getTopology()
+
+    def setTopology(self, topology: str) -> None:
+        if self.tiled():
+            print(f"a tiled board always has {Topology.DEAD} edges")
+            return
+        self._sim.setTopology(topology)
+        self._cycle = None
+        self.ruleChanged()
+
+    def onPatternRule(self, pattern: Pattern) -> None:
+        """Adopt the rule of a pattern placed on an empty board, warn otherwise."""
+        try:
+            rule = Rule.parse(pattern.getRule())
+        except ValueError as e:
+            print(f'pattern "{pattern.getName()}": {e}')
+            return
+        if rule == self.getRule():
+            return
+        if self._sim.getPopulation():
+            print(f'pattern "{pattern.getName()}" is for {rule} but the board runs {self.getRule()}')
+        else:
+            self.setRule(rule)
+            print(f'switched to {rule} for "{pattern.getName()}"')
+
+    def ruleChanged(self) -> None:
+        rule = self._sim.getRule()
+        self._palette = cellPalette(rule.getStates())
+        if self._viewSurf:
+            self._viewSurf.set_palette(self._palette)
+            self._scratchSurf.set_palette(self._palette)
+            # Cells blitted through the scratch surface were mapped with the
+            # old palette, so nothing of the last frame can be scrolled.
+            self._viewState = None
+        self._dirty = True
+        pygame.display.set_caption(f"Game of Life - {rule}, {self._sim.getTopology()}")
+
+    def save(self, path: Union[str, None] = None) -> str:
+        if self.tiled():
+            # The board lives in its own file; saving writes back what changed.
+            self._sim.flush()
+            return self._sim.getPath()
+        if path is None:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            path = os.path.join(self._saveDir, f"save-{stamp}-gen{self._sim.getGeneration()}.json.gz")
+        writeSnapshot(path, self.snapshot())
+        return path
+
+    def snapshot(self) -> BoardSnapshot:
+        if self.tiled():
+            raise ValueError("a tiled board is too big to snapshot")
+        return self._sim.snapshot()
 
     def start(self) -> None:
         self._stopped = False
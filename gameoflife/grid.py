@@ -1,4 +1,7 @@
 import pygame
+
+from typing import Tuple
+
 from gameoflife.color import Color
 
 
@@ -22,12 +25,14 @@ class Grid:
     def setEnabled(self, enabled) -> None:
         self.enabled = enabled
 
-    def draw(self, screen: pygame.Surface):
+    def draw(self, screen: pygame.Surface, offset: Tuple[int, int] = (0, 0)):
+        """Draw the grid lines shifted left/up by ``offset`` pixels (0 to one cell)."""
         if self.enabled:
-            for x in range(1, self.cols):
-                line_start_x = x * self.colWidth
+            (offsetX, offsetY) = offset
+            for x in range(1, self.cols + (1 if offsetX else 0)):
+                line_start_x = x * self.colWidth - offsetX
                 line_start_y = 0
-                line_end_x = x * self.colWidth
+                line_end_x = x * self.colWidth - offsetX
                 line_end_y = self.rows * self.rowHeight
                 pygame.draw.line(
                     screen,
@@ -37,11 +42,11 @@ class Grid:
                     1,
                 )
 
-            for y in range(1, self.rows):
+            for y in range(1, self.rows + (1 if offsetY else 0)):
                 line_start_x = 0
-                line_start_y = y * self.rowHeight
+                line_start_y = y * self.rowHeight - offsetY
                 line_end_x = self.cols * self.colWidth
-                line_end_y = y * self.rowHeight
+                line_end_y = y * self.rowHeight - offsetY
                 pygame.draw.line(
                     screen,
                     Color.GREY_LIGHT,
@@ -7,6 +7,7 @@ from pygame.surface import Surface
 from typing import Dict, List, Tuple, Union
 import pygame
 
+from gameoflife.assets import getImage
 from gameoflife.button import BaseButton, ButtonID, RectButton
 from gameoflife.color import Color
 from gameoflife.draw import drawRectBorder
@@ -31,13 +32,14 @@ class InputModeManager:
         self._mode:Union[str, None] = None
         self._cursors:Dict = {}
         self._font:Font = font
+        self._hovered:Union[RectButton, None] = None
 
     def addMode(self, mode:str, event:Event, imagePath:str=None, active:bool=False) -> None:
         btnX = (len(self._buttons) * self._btnWidth + self._btnMargin) + self._btnStartX
         rect = Rect(btnX, self._btnStartY, self._btnWidth, self._btnHeight)
         button = RectButton(mode, event, rect, imagePath=imagePath, border=False, bgColor=None, tooltip=True)
         button.setFont(self._font)
-        image = pygame.image.load(imagePath)
+        image = getImage(imagePath)
         self._buttons.append(button)
         self._cursors[mode] = Cursor((15, 5), image)
         if active:
@@ -53,11 +55,33 @@ class InputModeManager:
         eventButton = event.dict.get("button")
         if event.type == MOUSEBUTTONDOWN and eventButton == MOUSEBUTTON_LCLICK:
             for btn in self._buttons:
-                if btn.clicked():
+                if btn.clicked(*event.dict.get("pos", (None, None))):
                     self._mode = btn.getId()
                     return True
         return False
 
+    def getRect(self) -> Rect:
+        if not self._buttons:
+            return Rect(self._btnStartX, self._btnStartY, 0, 0)
+        return self._buttons[0].getRect().unionall([btn.getRect() for btn in self._buttons[1:]])
+
+    def getCursor(self) -> int:
+        return pygame.SYSTEM_CURSOR_HAND if self._hovered else pygame.SYSTEM_CURSOR_ARROW
+
+    def hover(self, pos:Union[None, Tuple[int, int]]) -> None:
+        hovered = None
+        if pos is not None:
+            for btn in self._buttons:
+                if btn.hovered(pos):
+                    hovered = btn
+                    break
+        if hovered is not self._hovered:
+            if self._hovered:
+                self._hovered.hover(None)
+            self._hovered = hovered
+        if hovered:
+            hovered.hover(pos)
+
     def draw(self, surface:Surface) -> None:
         modeRect = None
         for btn in self._buttons:
@@ -71,10 +95,6 @@ class InputModeManager:
     def mode(self) -> str:
         return self._mode
 
-    def update(self) -> None:
-        for btn in self._buttons:
-            btn.update()
-
     def setBtnWidth(self, width:int):
         self._btnWidth = width
 
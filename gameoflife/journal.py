@@ -0,0 +1,470 @@
+"""Append-only journal of a long run: keyframes and per-generation deltas.
+
+Layout, all integers little-endian:
+
+- header: ``b"GOLJ"``, format version (u16), cols (u32), rows (u32)
+- chunks: kind (u8), first generation (u64), count (u32), size (u32) and
+  CRC-32 (u32) of the ``size`` bytes of zlib data that follow
+
+  - ``KEYFRAME``/``EDIT``: the board at generation ``first``, as a u16
+    length, JSON with the rule and topology and then the cells. ``EDIT``
+    marks a board that does not follow from the deltas before it (the first
+    one, or after an edit, restore or seek).
+  - ``DELTAS``: ``count`` generations from ``first`` on, as 2 * ``count``
+    u32 birth and death counts followed by all the positions.
+  - ``INDEX``: ``count`` entries of kind (u8), first generation (u64),
+    count (u32) and file offset (u64) of every chunk before it.
+
+- trailer: file offset of the index chunk (u64) and ``b"GOLX"``
+
+The index and trailer are only written by ``close()``. When they are missing
+(the process was killed) the reader finds the chunks by walking their
+headers instead, dropping a torn chunk at the end.
+"""
+
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+
+from array import array
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Iterator, List, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.delta import GenerationDelta
+from gameoflife.rule import Rule
+from gameoflife.save import BoardSnapshot
+
+if TYPE_CHECKING:
+    from gameoflife.simulation import Simulation
+
+
+JOURNAL_FORMAT_VERSION = 1
+
+_MAGIC = b"GOLJ"
+_TRAILER_MAGIC = b"GOLX"
+_HEADER = struct.Struct("<4sHII")
+_CHUNK = struct.Struct("<BQIII")
+_ENTRY = struct.Struct("<BQIQ")
+_TRAILER = struct.Struct("<Q4s")
+_META = struct.Struct("<H")
+
+
+class ChunkKind:
+    KEYFRAME: int = 1
+    EDIT: int = 2
+    DELTAS: int = 3
+    INDEX: int = 4
+
+
+def _pack(positions: array) -> bytes:
+    if sys.byteorder == "big":
+        positions = array("I", positions)
+        positions.byteswap()
+    return positions.tobytes()
+
+
+def _unpack(data: bytes) -> array:
+    positions = array("I")
+    positions.frombytes(data)
+    if sys.byteorder == "big":
+        positions.byteswap()
+    return positions
+
+
+class JournalWriter:
+    """Appends every generation of a run to ``path`` from a background thread.
+
+    Feed it the deltas of ``Simulation.iterGenerations()`` through
+    ``record()``. Deltas are only collected on the calling thread; once
+    ``chunkGenerations`` of them are pending they are handed to the writer
+    thread, which compresses and appends them, so stepping never waits on
+    zlib or the disk. A keyframe of the whole board is written every
+    ``keyframeInterval`` generations, and whenever the rule or topology
+    changes or the board was edited, so reading any generation back replays
+    at most ``keyframeInterval`` deltas.
+
+    With ``append=True`` an existing journal is continued: its index is
+    dropped and rewritten by ``close()``, and deltas carry on from its last
+    generation once the board is restored from it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cols: int,
+        rows: int,
+        keyframeInterval: int = 1024,
+        chunkGenerations: int = 256,
+        compresslevel: int = 1,
+        append: bool = False,
+    ) -> None:
+        if keyframeInterval < 1 or chunkGenerations < 1:
+            raise ValueError("keyframe interval and chunk size must be at least 1")
+        self._path = path
+        self._cols = cols
+        self._rows = rows
+        self._keyframeInterval = keyframeInterval
+        self._chunkGenerations = chunkGenerations
+        self._compresslevel = compresslevel
+        self._index: List[Tuple[int, int, int, int]] = []
+        self._lastGeneration: Union[int, None] = None
+        self._keyGeneration = 0
+        self._rule: Union[Rule, None] = None
+        self._topology: Union[str, None] = None
+        self._first = 0
+        self._births: List[array] = []
+        self._deaths: List[array] = []
+        self._open(append)
+
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._chunks = 0
+        self._keyframes = 0
+        self._generations = 0
+        self._bytes = 0
+        self._writeSeconds = 0.0
+        self._error: Union[str, None] = None
+        self._thread = threading.Thread(target=self._worker, name="journal", daemon=True)
+        self._thread.start()
+
+    def _open(self, append: bool) -> None:
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        if not append or not os.path.exists(self._path):
+            self._file = open(self._path, "wb")
+            self._file.write(_HEADER.pack(_MAGIC, JOURNAL_FORMAT_VERSION, self._cols, self._rows))
+            return
+
+        with JournalReader(self._path) as reader:
+            if (reader.getCols(), reader.getRows()) != (self._cols, self._rows):
+                raise ValueError(
+                    f"journal is {reader.getCols()}x{reader.getRows()} but the board is {self._cols}x{self._rows}"
+                )
+            self._index = reader.getIndex()
+            end = reader.getDataEnd()
+            if self._index:
+                last = reader.lastKeyframe()
+                self._lastGeneration = reader.lastGeneration()
+                self._keyGeneration = last.getGeneration()
+                self._rule = Rule.parse(last.getRule())
+                self._topology = last.getTopology()
+        self._file = open(self._path, "r+b")
+        self._file.truncate(end)
+        self._file.seek(end)
+
+    def getPath(self) -> str:
+        return self._path
+
+    def record(self, delta: GenerationDelta, sim: "Simulation") -> None:
+        """Journal ``delta``, the generation ``sim`` just stepped to."""
+        if self._error:
+            return
+        generation = delta.getGeneration()
+        if delta.isEdited() or self._lastGeneration is None or generation != self._lastGeneration + 1:
+            self._keyframe(sim.snapshot(), sim.getRule(), ChunkKind.EDIT)
+            return
+
+        if not self._births:
+            self._first = generation
+        self._births.append(delta.getBirths())
+        self._deaths.append(delta.getDeaths())
+        self._lastGeneration = generation
+        if len(self._births) >= self._chunkGenerations:
+            self.flush()
+        if (
+            generation - self._keyGeneration >= self._keyframeInterval
+            or sim.getRule() != self._rule
+            or sim.getTopology() != self._topology
+        ):
+            self._keyframe(sim.snapshot(), sim.getRule(), ChunkKind.KEYFRAME)
+
+    def keyframe(self, snapshot: BoardSnapshot) -> None:
+        """Start the journal, or a new stretch of it, from ``snapshot``."""
+        self._keyframe(snapshot, Rule.parse(snapshot.getRule()), ChunkKind.EDIT)
+
+    def _keyframe(self, snapshot: BoardSnapshot, rule: Rule, kind: int) -> None:
+        self.flush()
+        self._lastGeneration = self._keyGeneration = snapshot.getGeneration()
+        self._rule = rule
+        self._topology = snapshot.getTopology()
+        self._queue.put((kind, snapshot))
+
+    def flush(self) -> None:
+        """Hand the pending deltas to the writer thread."""
+        if self._births:
+            self._queue.put((ChunkKind.DELTAS, (self._first, self._births, self._deaths)))
+            self._births = []
+            self._deaths = []
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "chunks": self._chunks,
+                "keyframes": self._keyframes,
+                "generations": self._generations,
+                "queued": self._queue.qsize(),
+                "bytes": self._bytes,
+                "writeSeconds": self._writeSeconds,
+                "error": self._error,
+            }
+
+    def close(self, timeout: Union[float, None] = None) -> dict:
+        """Write out everything pending plus the index and return the final stats."""
+        self.flush()
+        self._queue.put(None)
+        self._thread.join(timeout)
+        return self.stats()
+
+    def _encode(self, kind: int, item) -> Tuple[int, int, bytes]:
+        if kind == ChunkKind.DELTAS:
+            (first, births, deaths) = item
+            counts = array("I")
+            for i in range(len(births)):
+                counts.append(len(births[i]))
+                counts.append(len(deaths[i]))
+            parts = [_pack(counts)]
+            for i in range(len(births)):
+                parts.append(_pack(births[i]))
+                parts.append(_pack(deaths[i]))
+            return (first, len(births), b"".join(parts))
+
+        meta = json.dumps({"rule": item.getRule(), "topology": item.getTopology()}).encode("utf-8")
+        return (item.getGeneration(), 1, _META.pack(len(meta)) + meta + item.getCells())
+
+    def _write(self, kind: int, first: int, count: int, payload: bytes) -> int:
+        data = zlib.compress(payload, self._compresslevel)
+        self._file.write(_CHUNK.pack(kind, first, count, len(data), zlib.crc32(data)))
+        self._file.write(data)
+        return _CHUNK.size + len(data)
+
+    def _worker(self) -> None:
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                start = time.perf_counter()
+                (kind, body) = item
+                (first, count, payload) = self._encode(kind, body)
+                self._index.append((kind, first, count, self._file.tell()))
+                written = self._write(kind, first, count, payload)
+                self._file.flush()
+                with self._lock:
+                    self._chunks += 1
+                    self._bytes += written
+                    self._writeSeconds += time.perf_counter() - start
+                    if kind == ChunkKind.DELTAS:
+                        self._generations += count
+                    else:
+                        self._keyframes += 1
+            offset = self._file.tell()
+            entries = b"".join(_ENTRY.pack(*entry) for entry in self._index)
+            self._write(ChunkKind.INDEX, 0, len(self._index), entries)
+            self._file.write(_TRAILER.pack(offset, _TRAILER_MAGIC))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except OSError as e:
+            with self._lock:
+                self._error = str(e)
+            print(f'journal "{self._path}" failed: {e}')
+        finally:
+            self._file.close()
+
+
+class _Stretch:
+    """Chunks that follow on from one ``EDIT`` keyframe, up to the next one."""
+
+    def __init__(self, first: int) -> None:
+        self.first = first
+        self.last = first
+        self.keyframes: List[int] = []
+        self.positions: List[int] = []
+
+
+class JournalReader:
+    """Random access to a journal written by ``JournalWriter``."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        self._file = open(path, "rb")
+        try:
+            header = self._file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f'"{path}" is not a journal')
+            (magic, version, self._cols, self._rows) = _HEADER.unpack(header)
+            if magic != _MAGIC:
+                raise ValueError(f'"{path}" is not a journal')
+            if version > JOURNAL_FORMAT_VERSION:
+                raise ValueError(f'journal "{path}" has format version {version}, expected {JOURNAL_FORMAT_VERSION}')
+            (self._index, self._dataEnd) = self._readIndex() or self._scan()
+        except BaseException:
+            self._file.close()
+            raise
+        self._stretches = self._link()
+
+    def __enter__(self) -> "JournalReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def getCols(self) -> int:
+        return self._cols
+
+    def getRows(self) -> int:
+        return self._rows
+
+    def getIndex(self) -> List[Tuple[int, int, int, int]]:
+        """``(kind, first generation, count, offset)`` of every chunk, in file order."""
+        return list(self._index)
+
+    def getDataEnd(self) -> int:
+        """File offset just past the last chunk."""
+        return self._dataEnd
+
+    def firstGeneration(self) -> Union[int, None]:
+        return min((stretch.first for stretch in self._stretches), default=None)
+
+    def lastGeneration(self) -> Union[int, None]:
+        """Last generation written, which is where a resumed run carries on."""
+        return self._stretches[-1].last if self._stretches else None
+
+    def contains(self, generation: int) -> bool:
+        return self._find(generation) is not None
+
+    def lastKeyframe(self) -> BoardSnapshot:
+        for pos in range(len(self._index) - 1, -1, -1):
+            if self._index[pos][0] in (ChunkKind.KEYFRAME, ChunkKind.EDIT):
+                return self._readKeyframe(pos)
+        raise ValueError(f'journal "{self._path}" has no keyframe')
+
+    def snapshotAt(self, generation: int) -> BoardSnapshot:
+        """The board at ``generation``, replayed from the keyframe before it.
+
+        When a run was edited back to an earlier generation, the latest
+        recorded board for ``generation`` wins.
+        """
+        found = self._find(generation)
+        if found is None:
+            raise ValueError(f'journal "{self._path}" does not contain generation {generation}')
+        (stretch, slot) = found
+        pos = stretch.positions[slot]
+        key = self._readKeyframe(pos)
+        rule = Rule.parse(key.getRule())
+        multiState = rule.getStates() > 2
+        dying = rule.getDyingState()
+        cells = bytearray(key.getCells())
+        for delta in self._deltas(pos + 1):
+            if delta.getGeneration() > generation or delta.isEdited():
+                break
+            if delta.getGeneration() <= key.getGeneration():
+                continue
+            if multiState:
+                cells = bytearray(cells.translate(rule.getAging()))
+            for cell in delta.getBirths():
+                cells[cell] = CellState.ALIVE
+            for cell in delta.getDeaths():
+                cells[cell] = dying
+        return BoardSnapshot(self._cols, self._rows, generation, cells, key.getRule(), key.getTopology())
+
+    def iterDeltas(self) -> Iterator[GenerationDelta]:
+        """Every journaled generation in the order it was written.
+
+        After an edit the delta is empty and ``isEdited()``; pick the board
+        up again with ``snapshotAt()``.
+        """
+        return self._deltas(0)
+
+    def _deltas(self, start: int) -> Iterator[GenerationDelta]:
+        for pos in range(start, len(self._index)):
+            (kind, first, count, offset) = self._index[pos]
+            if kind == ChunkKind.EDIT:
+                yield GenerationDelta(first, self._cols, (), (), edited=True)
+            elif kind == ChunkKind.DELTAS:
+                data = self._readChunk(pos)
+                counts = _unpack(data[:8 * count])
+                at = 8 * count
+                for i in range(count):
+                    (nb, nd) = (counts[2 * i], counts[2 * i + 1])
+                    births = _unpack(data[at:at + 4 * nb])
+                    deaths = _unpack(data[at + 4 * nb:at + 4 * (nb + nd)])
+                    at += 4 * (nb + nd)
+                    yield GenerationDelta(first + i, self._cols, births, deaths)
+
+    def _find(self, generation: int) -> Union[Tuple[_Stretch, int], None]:
+        for stretch in reversed(self._stretches):
+            if stretch.first <= generation <= stretch.last:
+                return (stretch, bisect_right(stretch.keyframes, generation) - 1)
+        return None
+
+    def _link(self) -> List[_Stretch]:
+        stretches: List[_Stretch] = []
+        for (pos, (kind, first, count, offset)) in enumerate(self._index):
+            if kind == ChunkKind.EDIT:
+                stretches.append(_Stretch(first))
+            if not stretches:
+                continue
+            stretch = stretches[-1]
+            if kind in (ChunkKind.KEYFRAME, ChunkKind.EDIT):
+                stretch.keyframes.append(first)
+                stretch.positions.append(pos)
+            stretch.last = max(stretch.last, first + count - 1)
+        return stretches
+
+    def _readChunk(self, pos: int) -> bytes:
+        offset = self._index[pos][3]
+        self._file.seek(offset)
+        (kind, first, count, size, crc) = _CHUNK.unpack(self._file.read(_CHUNK.size))
+        data = self._file.read(size)
+        if len(data) != size or zlib.crc32(data) != crc:
+            raise ValueError(f'journal "{self._path}" is corrupt at offset {offset}')
+        return zlib.decompress(data)
+
+    def _readKeyframe(self, pos: int) -> BoardSnapshot:
+        data = self._readChunk(pos)
+        (length,) = _META.unpack_from(data)
+        meta = json.loads(data[_META.size:_META.size + length])
+        cells = data[_META.size + length:]
+        return BoardSnapshot(self._cols, self._rows, self._index[pos][1], cells, meta["rule"], meta["topology"])
+
+    def _readIndex(self) -> Union[Tuple[list, int], None]:
+        size = self._file.seek(0, os.SEEK_END)
+        if size < _HEADER.size + _TRAILER.size:
+            return None
+        self._file.seek(size - _TRAILER.size)
+        (offset, magic) = _TRAILER.unpack(self._file.read(_TRAILER.size))
+        if magic != _TRAILER_MAGIC or offset < _HEADER.size or offset + _CHUNK.size > size:
+            return None
+        self._file.seek(offset)
+        (kind, first, count, length, crc) = _CHUNK.unpack(self._file.read(_CHUNK.size))
+        data = self._file.read(length)
+        if kind != ChunkKind.INDEX or len(data) != length or zlib.crc32(data) != crc:
+            return None
+        entries = zlib.decompress(data)
+        return ([_ENTRY.unpack_from(entries, i * _ENTRY.size) for i in range(count)], offset)
+
+    def _scan(self) -> Tuple[list, int]:
+        index = []
+        offset = self._file.seek(_HEADER.size)
+        while True:
+            header = self._file.read(_CHUNK.size)
+            if len(header) < _CHUNK.size:
+                break
+            (kind, first, count, size, crc) = _CHUNK.unpack(header)
+            if kind == ChunkKind.INDEX:
+                break
+            data = self._file.read(size)
+            if len(data) != size or zlib.crc32(data) != crc:
+                break
+            index.append((kind, first, count, offset))
+            offset += _CHUNK.size + size
+        return (index, offset)
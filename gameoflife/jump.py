@@ -0,0 +1,135 @@
+import threading
+import time
+
+from typing import Callable, Union
+
+from gameoflife.cycle import CycleDetector
+from gameoflife.engine import EngineName
+from gameoflife.rule import Rule
+from gameoflife.save import BoardSnapshot
+from gameoflife.simulation import Simulation
+
+
+class Jump:
+    """Runs a copy of the board to generation ``target`` on a background thread.
+
+    The game keeps handling events and drawing while it runs: ``getGeneration()``
+    and ``getRate()`` report how far it got and how fast, ``getSample()``
+    holds the board as it was at most ``sampleInterval`` seconds ago (never
+    set when it is 0) and ``cancel()`` stops it at the next generation. Once
+    the board settles into a still life or an oscillator the rest of the way
+    is skipped. When ``done()``, ``result()`` is the board at ``target``, or
+    None if the jump was cancelled or failed.
+    """
+
+    def __init__(
+        self,
+        snapshot: BoardSnapshot,
+        target: int,
+        engine: str = EngineName.AUTO,
+        sampleInterval: float = 0.0,
+        log: Union[Callable[[str], None], None] = None,
+    ) -> None:
+        if target < snapshot.getGeneration():
+            raise ValueError(f"cannot jump back from generation {snapshot.getGeneration()} to {target}")
+        self._snapshot = snapshot
+        self._target = target
+        self._engine = engine
+        self._sampleInterval = sampleInterval
+        self._log = log
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._generation = snapshot.getGeneration()
+        self._startTime = 0.0
+        self._elapsed = 0.0
+        self._sample: Union[bytes, None] = None
+        self._result: Union[BoardSnapshot, None] = None
+        self._error: Union[Exception, None] = None
+        self._thread = threading.Thread(target=self._worker, name="jump", daemon=True)
+
+    def start(self) -> None:
+        self._startTime = time.perf_counter()
+        self._thread.start()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def join(self, timeout: Union[float, None] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def getStart(self) -> int:
+        return self._snapshot.getGeneration()
+
+    def getTarget(self) -> int:
+        return self._target
+
+    def getGeneration(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def getElapsed(self) -> float:
+        if self.done():
+            return self._elapsed
+        return time.perf_counter() - self._startTime if self._startTime else 0.0
+
+    def getRate(self) -> float:
+        """Generations per second so far."""
+        elapsed = self.getElapsed()
+        return (self.getGeneration() - self.getStart()) / elapsed if elapsed else 0.0
+
+    def fraction(self) -> float:
+        total = self._target - self.getStart()
+        return (self.getGeneration() - self.getStart()) / total if total else 1.0
+
+    def getSample(self) -> Union[bytes, None]:
+        with self._lock:
+            return self._sample
+
+    def getError(self) -> Union[Exception, None]:
+        return self._error
+
+    def result(self) -> Union[BoardSnapshot, None]:
+        if not self.done() or self.cancelled():
+            return None
+        return self._result
+
+    def _worker(self) -> None:
+        snapshot = self._snapshot
+        try:
+            sim = Simulation(
+                snapshot.getCols(),
+                snapshot.getRows(),
+                cycleDetector=CycleDetector(snapshot.getCols(), snapshot.getRows()),
+                rule=Rule.parse(snapshot.getRule()),
+                topology=snapshot.getTopology(),
+                engine=self._engine,
+                log=self._log,
+            )
+            sim.restore(snapshot)
+            lastSample = time.perf_counter()
+            while sim.getGeneration() < self._target and not self._cancel.is_set():
+                sim.step()
+                if sim.cycle() and sim.fastForward(self._target):
+                    break
+                with self._lock:
+                    self._generation = sim.getGeneration()
+                if self._sampleInterval and time.perf_counter() - lastSample >= self._sampleInterval:
+                    lastSample = time.perf_counter()
+                    with self._lock:
+                        self._sample = bytes(sim.getCells())
+            self._result = sim.snapshot()
+            with self._lock:
+                self._generation = sim.getGeneration()
+        except Exception as e:
+            self._error = e
+            self._cancel.set()
+        finally:
+            self._elapsed = time.perf_counter() - self._startTime
+            self._done.set()
@@ -0,0 +1,140 @@
+import json
+import time
+
+from collections import deque
+from typing import Dict, IO, List, Union
+
+
+class _NullTimer:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *args) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics: "Metrics", name: str) -> None:
+        self._metrics = metrics
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *args) -> None:
+        self._metrics.record(self._name, time.perf_counter() - self._start)
+
+
+def percentile(sortedSamples: List[float], pct: float) -> float:
+    if not sortedSamples:
+        return 0.0
+    idx = min(len(sortedSamples) - 1, max(0, int(round(pct / 100 * (len(sortedSamples) - 1)))))
+    return sortedSamples[idx]
+
+
+class Metrics:
+    """Per-phase frame timers kept as rolling windows of samples.
+
+    Wrap a phase with ``with metrics.timer("step"):``. While disabled
+    ``timer()`` hands back a shared no-op context manager, so instrumented
+    code costs one attribute check and an empty ``with`` block.
+    """
+
+    PHASES = ("events", "step", "render", "ui", "flip")
+
+    def __init__(self, enabled: bool = False, window: int = 240, log: Union[str, None] = None) -> None:
+        self._enabled = enabled
+        self._window = window
+        self._samples: Dict[str, deque] = {}
+        self._frame: Dict[str, float] = {}
+        self._frames = 0
+        self._logPath = log
+        self._logFile: Union[IO, None] = None
+        self._timers: Dict[str, _Timer] = {}
+
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def disable(self) -> None:
+        self._enabled = False
+        self._frame.clear()
+
+    def toggle(self) -> bool:
+        if self._enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self._enabled
+
+    def timer(self, name: str):
+        if not self._enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _Timer(self, name)
+        return timer
+
+    def record(self, name: str, seconds: float) -> None:
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self._window)
+        samples.append(seconds)
+        self._frame[name] = self._frame.get(name, 0.0) + seconds
+
+    def endFrame(self) -> None:
+        """Close the current frame and append it to the JSON lines log, if any."""
+        if not self._enabled:
+            return
+        self._frames += 1
+        if self._logPath and self._frame:
+            if self._logFile is None:
+                self._logFile = open(self._logPath, "a")
+            line = {"frame": self._frames, "time": time.time()}
+            line.update({name: round(seconds * 1000, 4) for name, seconds in self._frame.items()})
+            self._logFile.write(json.dumps(line) + "\n")
+        self._frame.clear()
+
+    def summary(self, name: str) -> Dict[str, float]:
+        """Rolling statistics for ``name`` in milliseconds."""
+        samples = sorted(self._samples.get(name, ()))
+        if not samples:
+            return {"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0}
+        return {
+            "count": len(samples),
+            "mean": sum(samples) / len(samples) * 1000,
+            "p50": percentile(samples, 50) * 1000,
+            "p90": percentile(samples, 90) * 1000,
+            "p99": percentile(samples, 99) * 1000,
+            "max": samples[-1] * 1000,
+        }
+
+    def names(self) -> List[str]:
+        ordered = [name for name in self.PHASES if name in self._samples]
+        return ordered + sorted(name for name in self._samples if name not in self.PHASES)
+
+    def exportJsonLines(self, file: IO) -> None:
+        """Write one JSON object per phase with its rolling percentiles."""
+        now = time.time()
+        for name in self.names():
+            line = {"phase": name, "time": now, "frames": self._frames}
+            line.update(self.summary(name))
+            file.write(json.dumps(line) + "\n")
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._frame.clear()
+        self._frames = 0
+
+    def close(self) -> None:
+        if self._logFile:
+            self._logFile.close()
+            self._logFile = None
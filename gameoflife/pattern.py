@@ -1,17 +1,19 @@
+import bisect
 import json
 import pygame
 
 from pygame import Surface, draw, Rect, Color
 from pygame.font import Font
 from pygame.locals import MOUSEBUTTONUP, KEYDOWN, K_ESCAPE
-from typing import Union, List
+from typing import List, Tuple, Union
 
 from gameoflife.button import RectButton
-from gameoflife.cell import Cell, CellState
+from gameoflife.cell import CellState
 from gameoflife.color import Color
 from gameoflife.draw import drawRectBorder
 from gameoflife.event import EVENT_PATTERNS
 from gameoflife.mouse import MOUSEBUTTON_LCLICK, MOUSEBUTTON_SCROLL_DOWN, MOUSEBUTTON_SCROLL_UP
+from gameoflife.rule import CONWAY
 
 
 class PatternType:
@@ -22,45 +24,62 @@ class PatternType:
     Methuselah: int = 5
 
 class Pattern:
+    """A pattern from the library, kept as a packed bitmap.
+
+    Bit ``y * cols + x`` of ``getBitmap()`` is set when the cell at
+    ``(x, y)`` is alive. The rendered surface is cached and only rebuilt when
+    the cell size or background color changes.
+    """
+
     def __init__(self, name: str, path: str, type: PatternType) -> None:
         self._rows: int = 0
         self._cols: int = 0
         self._name: str = name
         self._path: str = path
         self._type: PatternType = type
-        self._cells: List[List] = []
+        self._rule: str = CONWAY
+        self._bitmap: int = 0
+        self._points: Union[List[Tuple[int, int]], None] = None
         self._cellW = 10
         self._cellH = 10
         self._bgColor = Color.GREY_LIGHT
+        self._surface: Union[Surface, None] = None
+        self._surfaceKey = None
         self._load()
 
     def _load(self):
         try:
             with open(self._path) as file:
                 data = json.load(file)
-                seed = data.get("seed", [])
-
-                self._rows = len(seed)
-                y = 0
-                longestRow = 0
-                for line in seed:
-                    if len(line) > longestRow:
-                        longestRow = len(line)
-                    row = []
-                    x = 0
-                    for char in line:
-                        cellState = CellState.DEAD if char == "0" else CellState.ALIVE
-                        c = Cell(x, y, self._cellW, self._cellH, cellState)
-                        row.append(c)
-                        x += 1
-                    self._cells.append(row)
-                    y += 1
-                self._cols = longestRow
+            seed = data.get("seed", [])
+            self._rule = data.get("rule", CONWAY)
+            self._rows = len(seed)
+            self._cols = max((len(line) for line in seed), default=0)
+            bitmap = 0
+            for (y, line) in enumerate(seed):
+                for (x, char) in enumerate(line):
+                    if char != "0":
+                        bitmap |= 1 << (y * self._cols + x)
+            self._bitmap = bitmap
         except Exception as e:
             print(f'failed to load "{self._name}": {e}')
 
-    def getCells(self) -> List[List]:
-        return self._cells
+    def getBitmap(self) -> int:
+        return self._bitmap
+
+    def getPoints(self) -> List[Tuple[int, int]]:
+        """Offsets of the live cells from the top left corner of the pattern."""
+        if self._points is None:
+            cols = self._cols
+            self._points = [
+                (pos % cols, pos // cols) for pos in range(self._rows * cols) if self._bitmap >> pos & 1
+            ]
+        return self._points
+
+    def getState(self, x: int, y: int) -> int:
+        if 0 <= x < self._cols and 0 <= y < self._rows:
+            return self._bitmap >> (y * self._cols + x) & 1
+        return CellState.DEAD
 
     def getCols(self) -> int:
         return self._cols
@@ -69,21 +88,29 @@ class Pattern:
         return self._rows
 
     def getHeight(self) -> int:
-        return self._cellH * len(self._cells)
+        return self._cellH * self._rows
 
     def getName(self) -> str:
         return self._name
 
+    def getRule(self) -> str:
+        return self._rule
+
     def getSurface(self) -> Surface:
-        width = self._cols * self._cellW
-        height = len(self._cells) * self._cellH
-        surf = Surface((width, height))#.convert_alpha()
-        surf.fill(self._bgColor)
-        for y in range(len(self._cells)):
-            for x in range(len(self._cells[y])):
-                cell = self._cells[y][x]
-                cell.draw(surf)
-        return surf
+        key = (self._cellW, self._cellH, tuple(self._bgColor))
+        if self._surface is None or self._surfaceKey != key:
+            self._surface = self._render()
+            self._surfaceKey = key
+        return self._surface
+
+    def _render(self) -> Surface:
+        (cols, rows) = (self._cols, self._rows)
+        if not cols or not rows:
+            return Surface((0, 0))
+        cells = bytes(self._bitmap >> pos & 1 for pos in range(cols * rows))
+        small = pygame.image.frombuffer(cells, (cols, rows), "P")
+        small.set_palette([self._bgColor, Color.BLACK])
+        return pygame.transform.scale(small, (cols * self._cellW, rows * self._cellH))
 
     def getWidth(self) -> int:
         return self._cellW * self._cols
@@ -93,23 +120,12 @@ class Pattern:
 
     def setBgColor(self, color) -> None:
         self._bgColor = color
-        for y in range(len(self._cells)):
-            for x in range(len(self._cells[y])):
-                cell = self._cells[y][x]
-                cell.setStateColor(CellState.DEAD, color)
 
     def setCellHeight(self, height: int) -> None:
         self._cellH = height
-        for y in range(len(self._cells)):
-            for x in range(len(self._cells[y])):
-                cell = self._cells[y][x]
-                cell.setHeight(height)
 
     def setCellWidth(self, width: int) -> None:
         self._cellW = width
-        for y in range(len(self._cells)):
-            for x in range(len(self._cells[y])):
-                cell = self._cells[y][x]
 
 
 class PatternMenuRow:
@@ -126,7 +142,6 @@ class PatternMenuRow:
         self._absX: int = absX
         self._absY: int = absY
         self._bgColor = bgColor
-        self._cursor = pygame.SYSTEM_CURSOR_ARROW
         self._hoveredBgColor = Color.GREY_LIGHT2
         self._inactiveBgColor = bgColor
         self._menuH: int = 0
@@ -136,16 +151,8 @@ class PatternMenuRow:
         self._rect = Rect(x, y, 0, self._pattern.getHeight() + (self._padding * 2))
         self._scrollY: int = 0
 
-    def update(self) -> None:
-        if self.hovered():
-            self._bgColor = self._hoveredBgColor
-            self._cursor = pygame.SYSTEM_CURSOR_HAND
-            pygame.mouse.set_cursor(self._cursor)
-        else:
-            if self._cursor != pygame.SYSTEM_CURSOR_ARROW:
-                self._cursor = pygame.SYSTEM_CURSOR_ARROW
-                pygame.mouse.set_cursor(self._cursor)
-            self._bgColor = self._inactiveBgColor
+    def setHovered(self, hovered: bool) -> None:
+        self._bgColor = self._hoveredBgColor if hovered else self._inactiveBgColor
         self._pattern.setBgColor(self._bgColor)
 
     def draw(self, screen: Surface) -> None:
@@ -167,8 +174,11 @@ class PatternMenuRow:
     def setWidth(self, width:int) -> None:
         self._rect.width = width + (self._padding * 2)
 
-    def hovered(self) -> bool:
-        (mX, mY) = pygame.mouse.get_pos()
+    def getY(self) -> int:
+        return self._rect.y
+
+    def hovered(self, pos: Union[None, Tuple[int, int]] = None) -> bool:
+        (mX, mY) = pos or pygame.mouse.get_pos()
         if mY >= self._absY and mY <= self._absY + self._menuH:
             if (mX >= self._absX + self._rect.x and mX <= self._absX + self._rect.x + self._rect.width) and (
                 mY >= self._absY + self._rect.y - self._scrollY and mY <= self._absY + self._rect.y + self._rect.height - self._scrollY
@@ -177,7 +187,7 @@ class PatternMenuRow:
         return False
 
     def clicked(self, event) -> bool:
-        if event.type == MOUSEBUTTONUP and self.hovered():
+        if event.type == MOUSEBUTTONUP and self.hovered(event.dict.get("pos")):
             return True
         return False
 
@@ -201,6 +211,9 @@ class PatternMenu:
         self._enabled = False
         self._rect = Rect(x, y, 0, 0)
         self._rows = []
+        self._rowTops: List[int] = []
+        self._hoveredRow: Union[PatternMenuRow, None] = None
+        self._closeHovered = False
         self._rowsSurface = None
         self._scrollBarEnabled = True
         self._scrollBarWidth = 12
@@ -233,6 +246,7 @@ class PatternMenu:
     def setPatterns(self, patterns: List[Pattern]) -> None:
         self._patterns = patterns
         self._rows.clear()
+        self._hoveredRow = None
 
         yOffset = self._padding
         widest = None
@@ -262,6 +276,7 @@ class PatternMenu:
         for row in self._rows:
             row.setWidth(widest)
             row.setMenuHeight(outerHeight)
+        self._rowTops = [row.getY() for row in self._rows]
 
         if self._scrollBarEnabled:
             self._rect.w += self._scrollBarWidth
@@ -286,16 +301,40 @@ class PatternMenu:
             return self._maxHeight
         return height
 
-    def update(self) -> None:
-        self._closeBtn.update()
-        for row in self._rows:
-            row.update()
+    def getRect(self) -> Rect:
+        return self._rect.union(self._closeBtn.getRect())
+
+    def getCursor(self) -> int:
+        if self._hoveredRow or self._closeHovered:
+            return pygame.SYSTEM_CURSOR_HAND
+        return pygame.SYSTEM_CURSOR_ARROW
+
+    def rowAt(self, pos: Tuple[int, int]) -> Union[PatternMenuRow, None]:
+        """Return the row under ``pos`` with a binary search over the row offsets."""
+        if not self._rows:
+            return None
+        contentY = pos[1] - self._rect.y + self._rows[0]._scrollY
+        idx = bisect.bisect_right(self._rowTops, contentY) - 1
+        if idx >= 0 and self._rows[idx].hovered(pos):
+            return self._rows[idx]
+        return None
+
+    def hover(self, pos: Union[None, Tuple[int, int]]) -> None:
+        self._closeHovered = pos is not None and self._closeBtn.hovered(pos)
+        self._closeBtn.hover(pos if self._closeHovered else None)
+        row = self.rowAt(pos) if pos is not None else None
+        if row is not self._hoveredRow:
+            if self._hoveredRow:
+                self._hoveredRow.setHovered(False)
+            if row:
+                row.setHovered(True)
+            self._hoveredRow = row
 
     def eventHandler(self, event) -> bool:
         sbHalfHeight = self._scrollBarRect.height / 2
         menuHeight = self.getHeight()
         button = event.dict.get("button")
-        (mX, mY) = pygame.mouse.get_pos()
+        (mX, mY) = event.dict.get("pos") or pygame.mouse.get_pos()
         (x, y, w, h) = (self._rect.x, self._rect.y, self._rect.width, self._rect.height)
         if button == MOUSEBUTTON_LCLICK:
             # Close button
@@ -320,9 +359,9 @@ class PatternMenu:
                     self._scrollBarRect.y = mY - self._scrollBarRect.height
                 return True
             else:
-                for row in self._rows:
-                    if row.clicked(event):
-                        return row.getPattern()
+                row = self.rowAt((mX, mY))
+                if row and row.clicked(event):
+                    return row.getPattern()
             if (mX >= x and mX <= x + w) and (mY >= y and mY <= y + h):
                 return True
         # Scrollbar mouse scrolling
@@ -346,6 +385,8 @@ class PatternMenu:
                         row._scrollY -= scrollStep * self._scrollBarRatio
                 elif self._scrollBarRect.y > y:
                     self._scrollBarRect.y = y
+            # Rows moved under a still pointer.
+            self.hover((mX, mY))
             return True
         elif event.type == KEYDOWN:
             if event.key == K_ESCAPE:
@@ -373,8 +414,8 @@ class PatternMenu:
 
         self._closeBtn.draw(screen)
 
-    def hovered(self) -> bool:
-        (mX, mY) = pygame.mouse.get_pos()
-        if self._rect.collidepoint(mX, mY) or self._closeBtn.hovered():
+    def hovered(self, pos: Union[None, Tuple[int, int]] = None) -> bool:
+        pos = pos or pygame.mouse.get_pos()
+        if self._rect.collidepoint(pos) or self._closeBtn.hovered(pos):
             return True
         return False
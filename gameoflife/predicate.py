@@ -0,0 +1,189 @@
+"""Stopping conditions for ``Simulation.runUntil()``.
+
+A predicate is told about the simulation once with ``begin()`` and then,
+after every generation, gets the positions born and died in it through
+``check()``, so it can keep its own running state instead of looking at the
+whole board each time.
+"""
+
+from typing import TYPE_CHECKING, Sequence, Union
+
+from gameoflife.cell import CellState
+
+if TYPE_CHECKING:
+    from gameoflife.simulation import Simulation
+
+
+class Predicate:
+    def describe(self) -> str:
+        """Reason reported when this predicate stops a run."""
+        raise NotImplementedError("predicate describe() not implemented!")
+
+    def begin(self, sim: "Simulation") -> None:
+        pass
+
+    def check(self, sim: "Simulation", births: Sequence[int], deaths: Sequence[int]) -> bool:
+        raise NotImplementedError("predicate check() not implemented!")
+
+
+class PopulationBelow(Predicate):
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    def describe(self) -> str:
+        return f"population below {self._count}"
+
+    def check(self, sim: "Simulation", births: Sequence[int], deaths: Sequence[int]) -> bool:
+        return sim.getPopulation() < self._count
+
+
+class PopulationAbove(Predicate):
+    def __init__(self, count: int) -> None:
+        self._count = count
+
+    def describe(self) -> str:
+        return f"population above {self._count}"
+
+    def check(self, sim: "Simulation", births: Sequence[int], deaths: Sequence[int]) -> bool:
+        return sim.getPopulation() > self._count
+
+
+class GenerationReached(Predicate):
+    def __init__(self, generation: int) -> None:
+        self._generation = generation
+
+    def describe(self) -> str:
+        return f"generation {self._generation}"
+
+    def check(self, sim: "Simulation", births: Sequence[int], deaths: Sequence[int]) -> bool:
+        return sim.getGeneration() >= self._generation
+
+
+class Stable(Predicate):
+    """The board died out or settled into a still life, oscillator or spaceship."""
+
+    def describe(self) -> str:
+        return "stable"
+
+    def begin(self, sim: "Simulation") -> None:
+        if sim.getCycleDetector() is None:
+            raise ValueError("stopping when stable needs a simulation with a cycle detector")
+
+    def check(self, sim: "Simulation", births: Sequence[int], deaths: Sequence[int]) -> bool:
+        return sim.cycle() is not None
+
+
+class BoundsExceed(Predicate):
+    """The live cells no longer fit in a ``width`` x ``height`` box.
+
+    Only births can grow the bounding box, so it keeps the box around every
+    cell born since the last full scan and only rescans the board when that
+    box gets too big.
+    """
+
+    def __init__(self, width: int, height: Union[int, None] = None) -> None:
+        self._width = width
+        self._height = width if height is None else height
+        self._box = None
+
+    def describe(self) -> str:
+        return f"bounding box over {self._width}x{self._height}"
+
+    def begin(self, sim: "Simulation") -> None:
+        self._box = self._scan(sim)
+
+    def check(self, sim: "Simulation", births: Sequence[int], deaths: Sequence[int]) -> bool:
+        if not births:
+            return not self._fits(self._box)
+        cols = sim.getCols()
+        top = min(births) // cols
+        bottom = max(births) // cols
+        left = min(pos % cols for pos in births)
+        right = max(pos % cols for pos in births)
+        if self._box is not None:
+            (boxLeft, boxTop, boxRight, boxBottom) = self._box
+            (left, top, right, bottom) = (min(left, boxLeft), min(top, boxTop), max(right, boxRight), max(bottom, boxBottom))
+        self._box = (left, top, right, bottom)
+        if self._fits(self._box):
+            return False
+        self._box = self._scan(sim)
+        return not self._fits(self._box)
+
+    def _fits(self, box) -> bool:
+        if box is None:
+            return True
+        (left, top, right, bottom) = box
+        return right - left < self._width and bottom - top < self._height
+
+    @staticmethod
+    def _scan(sim: "Simulation"):
+        cells = sim.getCells()
+        cols = sim.getCols()
+        first = cells.find(CellState.ALIVE)
+        if first < 0:
+            return None
+        last = cells.rfind(CellState.ALIVE)
+        (left, right) = (cols, -1)
+        for offset in range(first - first % cols, last + 1, cols):
+            row = cells[offset:offset + cols]
+            x = row.find(CellState.ALIVE)
+            if x >= 0:
+                left = min(left, x)
+                right = max(right, row.rfind(CellState.ALIVE))
+        return (left, first // cols, right, last // cols)
+
+
+class RunResult:
+    MAX_GENERATIONS: str = "max generations"
+
+    def __init__(
+        self,
+        reason: str,
+        generation: int,
+        generations: int,
+        seconds: float,
+        population: int,
+        peakPopulation: int,
+    ) -> None:
+        self._reason = reason
+        self._generation = generation
+        self._generations = generations
+        self._seconds = seconds
+        self._population = population
+        self._peakPopulation = peakPopulation
+
+    def __repr__(self) -> str:
+        return f"RunResult({self._reason!r}, generation={self._generation}, generations={self._generations})"
+
+    def getReason(self) -> str:
+        """``describe()`` of the predicate that stopped the run, or ``MAX_GENERATIONS``."""
+        return self._reason
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def getGenerations(self) -> int:
+        """Generations stepped by this run."""
+        return self._generations
+
+    def getSeconds(self) -> float:
+        return self._seconds
+
+    def getRate(self) -> float:
+        return self._generations / self._seconds if self._seconds else 0.0
+
+    def getPopulation(self) -> int:
+        return self._population
+
+    def getPeakPopulation(self) -> int:
+        return self._peakPopulation
+
+    def toDict(self) -> dict:
+        return {
+            "reason": self._reason,
+            "generation": self._generation,
+            "generations": self._generations,
+            "seconds": self._seconds,
+            "population": self._population,
+            "peakPopulation": self._peakPopulation,
+        }
@@ -0,0 +1,137 @@
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+
+from typing import Callable, List, Union
+
+
+class ProfileCapture:
+    """Records a bounded window of execution with cProfile and tracemalloc.
+
+    The capture runs for ``seconds`` of wall time or ``generations``
+    generations, whichever is given (both may be set; the first one reached
+    ends it). Call ``tick()`` once per frame or generation; when the window is
+    over the reports are written to a timestamped directory under
+    ``directory``:
+
+    - ``profile.prof``: raw cProfile stats, loadable with ``pstats`` or snakeviz
+    - ``summary.txt``: time attributed to each of the ``focus`` functions,
+      followed by the top functions by cumulative time; ``label()``, when
+      given, adds a line about what was measured (e.g. the engine in use)
+    - ``memory.txt``: the largest allocation sites seen by tracemalloc
+    """
+
+    def __init__(
+        self,
+        directory: str = "profiles",
+        seconds: Union[float, None] = None,
+        generations: Union[int, None] = None,
+        focus: Union[List[Callable], None] = None,
+        memoryTop: int = 25,
+        label: Union[Callable[[], str], None] = None,
+    ) -> None:
+        if seconds is None and generations is None:
+            seconds = 10
+        self._directory = directory
+        self._seconds = seconds
+        self._generations = generations
+        self._focus = focus or []
+        self._memoryTop = memoryTop
+        self._label = label
+        self._profile: Union[cProfile.Profile, None] = None
+        self._path: Union[str, None] = None
+        self._startTime = 0.0
+        self._startGeneration = 0
+        self._stopTime = 0.0
+        self._stopGeneration = 0
+        self._ownsTracemalloc = False
+        self._traced = (0, 0)
+
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def getPath(self) -> Union[str, None]:
+        return self._path
+
+    def start(self, generation: int = 0) -> None:
+        if self._profile is not None:
+            return
+        self._startTime = time.perf_counter()
+        self._startGeneration = generation
+        self._ownsTracemalloc = not tracemalloc.is_tracing()
+        if self._ownsTracemalloc:
+            tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def tick(self, generation: int = 0) -> bool:
+        """Return True (after writing the reports) once the capture window is over."""
+        if self._profile is None:
+            return self._path is not None
+        if self._seconds is not None and time.perf_counter() - self._startTime >= self._seconds:
+            self.stop(generation)
+            return True
+        if self._generations is not None and generation - self._startGeneration >= self._generations:
+            self.stop(generation)
+            return True
+        return False
+
+    def stop(self, generation: int = 0) -> str:
+        profile = self._profile
+        if profile is None:
+            return self._path
+        profile.disable()
+        self._profile = None
+        self._stopTime = time.perf_counter()
+        self._stopGeneration = generation
+        memory = tracemalloc.take_snapshot()
+        self._traced = tracemalloc.get_traced_memory()
+        if self._ownsTracemalloc:
+            tracemalloc.stop()
+
+        self._path = os.path.join(self._directory, time.strftime("%Y%m%d-%H%M%S"))
+        os.makedirs(self._path, exist_ok=True)
+        profile.dump_stats(os.path.join(self._path, "profile.prof"))
+        with open(os.path.join(self._path, "summary.txt"), "w") as file:
+            file.write(self._summary(profile))
+        with open(os.path.join(self._path, "memory.txt"), "w") as file:
+            file.write(self._memory(memory))
+        return self._path
+
+    def _summary(self, profile: cProfile.Profile) -> str:
+        out = io.StringIO()
+        elapsed = self._stopTime - self._startTime
+        generations = self._stopGeneration - self._startGeneration
+        out.write(f"captured {elapsed:.3f} s, {generations} generations\n")
+        if self._label:
+            out.write(f"{self._label()}\n")
+        out.write("\n")
+
+        stats = pstats.Stats(profile, stream=out)
+        if self._focus:
+            out.write(f"{'function':<40} {'calls':>8} {'total s':>10} {'own s':>10} {'per call ms':>12}\n")
+            for func in self._focus:
+                code = func.__code__
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                (cc, nc, tt, ct, callers) = stats.stats.get(key, (0, 0, 0.0, 0.0, {}))
+                perCall = (ct / nc * 1000) if nc else 0.0
+                out.write(f"{func.__qualname__:<40} {nc:>8} {ct:>10.4f} {tt:>10.4f} {perCall:>12.3f}\n")
+            out.write("\n")
+
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(40)
+        return out.getvalue()
+
+    def _memory(self, snapshot: tracemalloc.Snapshot) -> str:
+        out = io.StringIO()
+        (current, peak) = self._traced
+        stats = snapshot.statistics("lineno")
+        total = sum(stat.size for stat in stats)
+        out.write(f"traced {total / 1024:.1f} KiB in {len(stats)} allocation sites\n")
+        out.write(f"current {current / 1024:.1f} KiB, peak {peak / 1024:.1f} KiB\n")
+        out.write("\n")
+        for stat in stats[:self._memoryTop]:
+            out.write(f"{stat}\n")
+        return out.getvalue()
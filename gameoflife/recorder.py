@@ -0,0 +1,285 @@
+import os
+import queue
+import shlex
+import struct
+import subprocess
+import threading
+import time
+import zlib
+
+from typing import IO, List, Sequence, Tuple, Union
+
+
+class RecordFormat:
+    PNG: str = "png"
+    GIF: str = "gif"
+    RAW: str = "raw"
+
+
+def scaleCells(cells: bytes, cols: int, rows: int, scale: int) -> bytes:
+    """Blow each cell up into a ``scale`` x ``scale`` block of pixels."""
+    if scale == 1:
+        return bytes(cells)
+    out = bytearray()
+    line = bytearray(cols * scale)
+    for y in range(rows):
+        row = cells[y * cols:(y + 1) * cols]
+        for i in range(scale):
+            line[i::scale] = row
+        out += bytes(line) * scale
+    return bytes(out)
+
+
+def encodePng(pixels: bytes, width: int, height: int, palette: Sequence[Tuple[int, int, int]]) -> bytes:
+    """Encode palette-indexed pixels (one byte each) as an 8-bit PNG."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    raw = b"".join(b"\x00" + pixels[y * width:(y + 1) * width] for y in range(height))
+    return b"".join([
+        b"\x89PNG\r\n\x1a\n",
+        chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)),
+        chunk(b"PLTE", b"".join(bytes(color[:3]) for color in palette)),
+        chunk(b"IDAT", zlib.compress(raw, 6)),
+        chunk(b"IEND", b""),
+    ])
+
+
+def _lzwEncode(pixels: bytes, minCodeSize: int) -> bytes:
+    clearCode = 1 << minCodeSize
+    endCode = clearCode + 1
+    codeSize = minCodeSize + 1
+    nextCode = endCode + 1
+    table = {}
+    out = bytearray()
+    bitBuffer = 0
+    bitCount = 0
+
+    def emit(code: int) -> None:
+        nonlocal bitBuffer, bitCount
+        bitBuffer |= code << bitCount
+        bitCount += codeSize
+        while bitCount >= 8:
+            out.append(bitBuffer & 0xFF)
+            bitBuffer >>= 8
+            bitCount -= 8
+
+    emit(clearCode)
+    if pixels:
+        prefix = pixels[0]
+        for pixel in pixels[1:]:
+            key = (prefix << 8) | pixel
+            code = table.get(key)
+            if code is not None:
+                prefix = code
+                continue
+            emit(prefix)
+            if nextCode < 4096:
+                table[key] = nextCode
+                nextCode += 1
+                if nextCode > (1 << codeSize) and codeSize < 12:
+                    codeSize += 1
+            else:
+                emit(clearCode)
+                table.clear()
+                codeSize = minCodeSize + 1
+                nextCode = endCode + 1
+            prefix = pixel
+        emit(prefix)
+    emit(endCode)
+    if bitCount:
+        out.append(bitBuffer & 0xFF)
+    return bytes(out)
+
+
+def _subBlocks(data: bytes) -> bytes:
+    blocks = [bytes([len(data[i:i + 255])]) + data[i:i + 255] for i in range(0, len(data), 255)]
+    return b"".join(blocks) + b"\x00"
+
+
+class GifWriter:
+    """Streams frames into an animated GIF so only one frame is in memory at a time."""
+
+    def __init__(self, file: IO, width: int, height: int, palette: Sequence[Tuple[int, int, int]], fps: int = 30) -> None:
+        self._file = file
+        self._width = width
+        self._height = height
+        self._delay = max(2, round(100 / max(1, fps)))
+        bits = max(1, (len(palette) - 1).bit_length())
+        self._minCodeSize = max(2, bits)
+        table = [bytes(color[:3]) for color in palette]
+        table += [b"\x00\x00\x00"] * ((1 << bits) - len(table))
+        header = b"GIF89a" + struct.pack("<HHBBB", width, height, 0x80 | (bits - 1), 0, 0) + b"".join(table)
+        loop = b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00"
+        self._file.write(header + loop)
+
+    def write(self, pixels: bytes) -> int:
+        control = b"\x21\xF9\x04\x00" + struct.pack("<H", self._delay) + b"\x00\x00"
+        descriptor = b"\x2C" + struct.pack("<HHHHB", 0, 0, self._width, self._height, 0)
+        data = bytes([self._minCodeSize]) + _subBlocks(_lzwEncode(pixels, self._minCodeSize))
+        frame = control + descriptor + data
+        self._file.write(frame)
+        return len(frame)
+
+    def close(self) -> None:
+        self._file.write(b"\x3B")
+        self._file.close()
+
+
+class Recorder:
+    """Records board frames on a background encoder thread.
+
+    ``capture()`` copies the raw cell buffer (one byte per cell, which doubles
+    as the palette index) and queues it without blocking; scaling, encoding
+    and disk or pipe I/O all happen on the encoder thread. When the bounded
+    queue is full the frame is dropped and counted, so a slow encoder throttles
+    the recording instead of the simulation.
+
+    Formats:
+
+    - ``png``: ``path`` is a directory that receives ``frame-000001.png`` ...
+    - ``gif``: ``path`` is a single animated GIF
+    - ``raw``: rgb24 frames written to ``path``, or piped into ``command``
+      (e.g. ``ffmpeg -f rawvideo -pix_fmt rgb24 -s {width}x{height} -r {fps} -i - out.mp4``)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        cols: int,
+        rows: int,
+        format: str = RecordFormat.GIF,
+        palette: Union[Sequence[Tuple[int, int, int]], None] = None,
+        scale: int = 1,
+        fps: int = 30,
+        maxQueue: int = 64,
+        command: Union[str, None] = None,
+    ) -> None:
+        if format not in (RecordFormat.PNG, RecordFormat.GIF, RecordFormat.RAW):
+            raise ValueError(f"unknown recording format '{format}'")
+        self._path = path
+        self._cols = cols
+        self._rows = rows
+        self._format = format
+        self._palette: List[Tuple[int, int, int]] = [tuple(c[:3]) for c in (palette or [(255, 255, 255), (0, 0, 0)])]
+        self._scale = max(1, scale)
+        self._fps = fps
+        self._command = command
+        self._width = cols * self._scale
+        self._height = rows * self._scale
+        self._queue: queue.Queue = queue.Queue(maxsize=maxQueue)
+        self._lock = threading.Lock()
+        self._frames = 0
+        self._dropped = 0
+        self._bytes = 0
+        self._error: Union[str, None] = None
+        self._encodeSeconds = 0.0
+        self._thread = threading.Thread(target=self._worker, name="recorder", daemon=True)
+        self._thread.start()
+
+    def getPath(self) -> str:
+        return self._path
+
+    def capture(self, cells: bytes) -> bool:
+        if self._error:
+            return False
+        try:
+            self._queue.put_nowait(bytes(cells))
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "frames": self._frames,
+                "dropped": self._dropped,
+                "queued": self._queue.qsize(),
+                "bytes": self._bytes,
+                "encodeSeconds": self._encodeSeconds,
+                "error": self._error,
+            }
+
+    def close(self, timeout: Union[float, None] = None) -> dict:
+        """Flush queued frames, finish the file and return the final stats."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+        return self.stats()
+
+    def _open(self):
+        fmt = self._format
+        if fmt == RecordFormat.PNG:
+            os.makedirs(self._path, exist_ok=True)
+            return None
+        if fmt == RecordFormat.RAW and self._command:
+            command = self._command.format(width=self._width, height=self._height, fps=self._fps)
+            return subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE)
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        file = open(self._path, "wb")
+        if fmt == RecordFormat.GIF:
+            return GifWriter(file, self._width, self._height, self._palette, self._fps)
+        return file
+
+    def _encode(self, sink, cells: bytes) -> int:
+        pixels = scaleCells(cells, self._cols, self._rows, self._scale)
+        if self._format == RecordFormat.PNG:
+            data = encodePng(pixels, self._width, self._height, self._palette)
+            path = os.path.join(self._path, f"frame-{self._frames + 1:06d}.png")
+            with open(path, "wb") as file:
+                file.write(data)
+            return len(data)
+        if self._format == RecordFormat.GIF:
+            return sink.write(pixels)
+
+        channels = bytearray(len(pixels) * 3)
+        for channel in range(3):
+            table = bytes(self._palette[i][channel] if i < len(self._palette) else 0 for i in range(256))
+            channels[channel::3] = pixels.translate(table)
+        stream = sink.stdin if isinstance(sink, subprocess.Popen) else sink
+        stream.write(channels)
+        return len(channels)
+
+    def _worker(self) -> None:
+        sink = None
+        try:
+            sink = self._open()
+            while True:
+                cells = self._queue.get()
+                if cells is None:
+                    break
+                start = time.perf_counter()
+                written = self._encode(sink, cells)
+                with self._lock:
+                    self._frames += 1
+                    self._bytes += written
+                    self._encodeSeconds += time.perf_counter() - start
+        except (OSError, ValueError) as e:
+            with self._lock:
+                self._error = str(e)
+            print(f'recording to "{self._path}" failed: {e}')
+            self._drain()
+        finally:
+            self._finish(sink)
+
+    def _drain(self) -> None:
+        while True:
+            cells = self._queue.get()
+            if cells is None:
+                return
+            with self._lock:
+                self._dropped += 1
+
+    def _finish(self, sink) -> None:
+        if sink is None:
+            return
+        try:
+            if isinstance(sink, subprocess.Popen):
+                sink.stdin.close()
+                sink.wait()
+            else:
+                sink.close()
+        except OSError:
+            pass
@@ -0,0 +1,163 @@
+import re
+
+from typing import Dict, FrozenSet, Iterable, Union
+
+from gameoflife.cell import CellState
+
+
+CONWAY = "B3/S23"
+
+MAX_STATES = 62
+
+NAMED_RULES = {
+    "life": CONWAY,
+    "highlife": "B36/S23",
+    "seeds": "B2/S",
+    "brian's brain": "B2/S/C3",
+    "star wars": "B2/S345/C4",
+}
+
+_BS_RULE = re.compile(r"^B([0-8]*)/?S([0-8]*)(?:/?[CG](\d+))?$", re.IGNORECASE)
+_SB_RULE = re.compile(r"^([0-8]*)/([0-8]*)(?:/(\d+))?$")
+
+# Offsets added to a cell's 3x3 count of live cells to index the kernel: a
+# dead cell lands on 0..8 and a live one, whose own state is part of the
+# count, on 9..17, i.e. state * 9 + neighbors. Dying cells ignore their
+# neighbors and land on 18..26, which the kernel maps to 0.
+_KERNEL_DEAD = 0
+_KERNEL_ALIVE = 8
+_KERNEL_DYING = 18
+
+
+class Rule:
+    """Outer-totalistic rule compiled into lookup tables.
+
+    ``getTable()[state * 9 + neighbors]`` is the next state of a cell, so an
+    engine steps any B/S rule with one indexed read per cell and no branching
+    on the rule itself. Use ``Rule.parse()`` to get a rule from its string
+    form; parsed rules are cached, so each rule is compiled only once.
+
+    Rules with more than two ``states`` are "Generations" rules: a live cell
+    that does not survive becomes dying (state 2) and then ages one state per
+    generation until it is dead again. Only live cells count as neighbors and
+    dying cells cannot be born into.
+    """
+
+    _cache: Dict[str, "Rule"] = {}
+
+    def __init__(self, birth: Iterable[int], survive: Iterable[int], states: int = 2) -> None:
+        self._birth: FrozenSet[int] = frozenset(birth)
+        self._survive: FrozenSet[int] = frozenset(survive)
+        self._states = states
+        if any(n < 0 or n > 8 for n in self._birth | self._survive):
+            raise ValueError("neighbor counts must be between 0 and 8")
+        if not 2 <= states <= MAX_STATES:
+            raise ValueError(f"number of states must be between 2 and {MAX_STATES}")
+
+        dying = 2 if states > 2 else CellState.DEAD
+        aging = bytearray(range(256))
+        for state in range(2, states):
+            aging[state] = state + 1 if state + 1 < states else CellState.DEAD
+        table = bytearray(states * 9)
+        kernel = bytearray(256)
+        for n in range(9):
+            born = CellState.ALIVE if n in self._birth else CellState.DEAD
+            survived = CellState.ALIVE if n in self._survive else dying
+            table[CellState.DEAD * 9 + n] = kernel[_KERNEL_DEAD + n] = born
+            table[CellState.ALIVE * 9 + n] = kernel[_KERNEL_ALIVE + 1 + n] = survived
+            for state in range(2, states):
+                table[state * 9 + n] = aging[state]
+
+        self._dyingState = dying
+        self._table = bytes(table)
+        self._kernel = bytes(kernel)
+        self._aging = bytes(aging)
+        self._decay = bytes(aging[i] if i >= 2 else 0 for i in range(256)) if states > 2 else None
+        self._offsets = bytes(
+            _KERNEL_DEAD if i == CellState.DEAD else _KERNEL_ALIVE if i == CellState.ALIVE else _KERNEL_DYING
+            for i in range(256)
+        )
+        self._aliveMask = bytes(1 if i == CellState.ALIVE else 0 for i in range(256))
+
+    def __str__(self) -> str:
+        birth = "".join(str(n) for n in sorted(self._birth))
+        survive = "".join(str(n) for n in sorted(self._survive))
+        if self._states > 2:
+            return f"B{birth}/S{survive}/C{self._states}"
+        return f"B{birth}/S{survive}"
+
+    def __repr__(self) -> str:
+        return f"Rule('{self}')"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Rule) and self._table == other._table
+
+    def __hash__(self) -> int:
+        return hash(self._table)
+
+    @staticmethod
+    def parse(rule: str) -> "Rule":
+        """Parse ``B36/S23`` or ``B2/S/C3`` style rules.
+
+        ``B3S23``, S/B(/C) notation such as ``23/3`` or ``345/2/4`` and the
+        names in ``NAMED_RULES`` are accepted too.
+        """
+        text = rule.strip()
+        text = NAMED_RULES.get(text.lower(), text).replace(" ", "")
+        cached = Rule._cache.get(text)
+        if cached:
+            return cached
+        match = _BS_RULE.match(text)
+        if match:
+            (birth, survive, states) = match.groups()
+        else:
+            match = _SB_RULE.match(text)
+            if not match:
+                raise ValueError(f"invalid rule '{rule}'")
+            (survive, birth, states) = match.groups()
+        compiled = Rule((int(n) for n in birth), (int(n) for n in survive), int(states or 2))
+        Rule._cache[text] = compiled
+        return compiled
+
+    def getBirth(self) -> FrozenSet[int]:
+        return self._birth
+
+    def getSurvive(self) -> FrozenSet[int]:
+        return self._survive
+
+    def getStates(self) -> int:
+        return self._states
+
+    def getDyingState(self) -> int:
+        """State a live cell turns into when it does not survive."""
+        return self._dyingState
+
+    def getTable(self) -> bytes:
+        return self._table
+
+    def getKernel(self) -> bytes:
+        """``bytes.translate`` table from ``count + offset`` to the next state.
+
+        ``count`` is the number of live cells in the 3x3 block around a cell,
+        including the cell itself, and ``offset`` comes from ``getOffsets()``.
+        Dying cells always map to 0 here; their next state is in ``getDecay()``.
+        """
+        return self._kernel
+
+    def getOffsets(self) -> bytes:
+        return self._offsets
+
+    def getAliveMask(self) -> bytes:
+        """``bytes.translate`` table mapping live cells to 1 and all others to 0."""
+        return self._aliveMask
+
+    def getAging(self) -> bytes:
+        """``bytes.translate`` table that ages dying cells and keeps 0 and 1."""
+        return self._aging
+
+    def getDecay(self) -> Union[bytes, None]:
+        """Like ``getAging()`` but maps 0 and 1 to 0; None for two-state rules."""
+        return self._decay
+
+    def next(self, state: int, neighbors: int) -> int:
+        return self._table[state * 9 + neighbors]
@@ -0,0 +1,130 @@
+import gzip
+import json
+import os
+import tempfile
+
+from gameoflife.cell import CellState
+from gameoflife.rule import CONWAY, MAX_STATES
+from gameoflife.topology import Topology
+
+
+SAVE_FORMAT_VERSION = 1
+
+# Cell states are written as characters so a decompressed save reads like the
+# "seed" block of a pattern file. Dead and alive are "0" and "1"; the states
+# of multi-state rules continue with the rest of the digits and letters.
+_STATE_CHARS = b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"[:MAX_STATES]
+_STATE_TO_CHAR = bytes.maketrans(bytes(range(len(_STATE_CHARS))), _STATE_CHARS)
+_CHAR_TO_STATE = bytes.maketrans(_STATE_CHARS, bytes(range(len(_STATE_CHARS))))
+
+
+class BoardSnapshot:
+    """Immutable copy of the board taken between two generations.
+
+    ``cells`` holds one byte per cell in row-major order, so taking a snapshot
+    is a single buffer copy and the original board can keep changing while the
+    snapshot is being written out.
+    """
+
+    def __init__(
+        self,
+        cols: int,
+        rows: int,
+        generation: int,
+        cells: bytes,
+        rule: str = CONWAY,
+        topology: str = Topology.DEAD,
+    ) -> None:
+        if len(cells) != cols * rows:
+            raise ValueError(f"snapshot size mismatch: {len(cells)} cells for {cols}x{rows} board")
+        self._cols = cols
+        self._rows = rows
+        self._generation = generation
+        self._cells = bytes(cells)
+        self._rule = rule
+        self._topology = topology
+
+    def getCells(self) -> bytes:
+        return self._cells
+
+    def getCols(self) -> int:
+        return self._cols
+
+    def getRows(self) -> int:
+        return self._rows
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def getRule(self) -> str:
+        return self._rule
+
+    def getTopology(self) -> str:
+        return self._topology
+
+    def toDict(self) -> dict:
+        chars = self._cells.translate(_STATE_TO_CHAR).decode("ascii")
+        cols = self._cols
+        return {
+            "version": SAVE_FORMAT_VERSION,
+            "cols": self._cols,
+            "rows": self._rows,
+            "generation": self._generation,
+            "rule": self._rule,
+            "topology": self._topology,
+            "seed": [chars[y * cols:(y + 1) * cols] for y in range(self._rows)],
+        }
+
+    @staticmethod
+    def fromDict(data: dict) -> "BoardSnapshot":
+        cols = data["cols"]
+        rows = data["rows"]
+        seed = "".join(line.ljust(cols, "0")[:cols] for line in data.get("seed", []))
+        seed = seed.ljust(cols * rows, "0")
+        cells = seed.encode("ascii").translate(_CHAR_TO_STATE)
+        return BoardSnapshot(
+            cols,
+            rows,
+            data.get("generation", 0),
+            cells,
+            data.get("rule", CONWAY),
+            data.get("topology", Topology.DEAD),
+        )
+
+
+def encodeSnapshot(snapshot: BoardSnapshot, compresslevel: int = 6) -> bytes:
+    payload = json.dumps(snapshot.toDict(), separators=(",", ":")).encode("utf-8")
+    return gzip.compress(payload, compresslevel=compresslevel)
+
+
+def decodeSnapshot(data: bytes) -> BoardSnapshot:
+    return BoardSnapshot.fromDict(json.loads(gzip.decompress(data)))
+
+
+def writeSnapshot(path: str, snapshot: BoardSnapshot, compresslevel: int = 6) -> int:
+    """Compress ``snapshot`` and atomically move it into place at ``path``.
+
+    The data is written to a temporary file in the destination directory and
+    renamed over ``path`` so readers never observe a partially written save.
+    Returns the number of bytes written.
+    """
+    data = encodeSnapshot(snapshot, compresslevel)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmpPath = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmpPath, path)
+    except BaseException:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        raise
+    return len(data)
+
+
+def readSnapshot(path: str) -> BoardSnapshot:
+    with open(path, "rb") as file:
+        return decodeSnapshot(file.read())
@@ -0,0 +1,311 @@
+import time
+
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.cycle import Cycle, CycleDetector
+from gameoflife.delta import GenerationDelta
+from gameoflife.engine import Engine, EngineName, createEngine
+from gameoflife.predicate import Predicate, RunResult
+from gameoflife.rule import CONWAY, Rule
+from gameoflife.save import BoardSnapshot
+from gameoflife.timeline import Timeline
+from gameoflife.topology import Topology, parseTopology
+
+
+class Simulation:
+    """Headless Game of Life board and stepping.
+
+    The board is a ``bytearray`` holding one byte per cell in row-major order
+    (``pos = y * cols + x``). What lies past the edges is decided by the
+    ``topology`` (see ``gameoflife.topology``), and how it is stepped by the
+    ``engine`` (see ``gameoflife.engine``); ``log`` receives the automatic
+    engine's switching decisions.
+    Nothing in here depends on pygame, so it can be driven from the game loop,
+    a script or a worker process alike.
+    """
+
+    def __init__(
+        self,
+        cols: int,
+        rows: int,
+        timeline: Union[Timeline, None] = None,
+        cycleDetector: Union[CycleDetector, None] = None,
+        rule: Union[Rule, None] = None,
+        topology: str = Topology.DEAD,
+        engine: str = EngineName.AUTO,
+        log: Union[Callable[[str], None], None] = None,
+    ) -> None:
+        self._cols = cols
+        self._rows = rows
+        self._cells = bytearray(cols * rows)
+        self._generation = 0
+        self._population = 0
+        self._births = 0
+        self._deaths = 0
+        self._edited = True
+        self._version = 0
+        self._timeline = timeline
+        self._cycleDetector = cycleDetector
+        self._rule = rule or Rule.parse(CONWAY)
+        self._topology = parseTopology(topology)
+        self._engine = createEngine(engine, log)
+        self._engineVersion = self._version
+
+    def getCols(self) -> int:
+        return self._cols
+
+    def getRows(self) -> int:
+        return self._rows
+
+    def getCells(self) -> bytearray:
+        return self._cells
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def getPopulation(self) -> int:
+        return self._population
+
+    def getBirths(self) -> int:
+        return self._births
+
+    def getDeaths(self) -> int:
+        return self._deaths
+
+    def getVersion(self) -> int:
+        """Counter that changes whenever any cell may have changed."""
+        return self._version
+
+    def getEngine(self) -> Engine:
+        return self._engine
+
+    def getRule(self) -> Rule:
+        return self._rule
+
+    def setRule(self, rule: Rule) -> None:
+        """Switch to ``rule``; dying cells past its last state are cleared."""
+        if rule != self._rule:
+            self._rule = rule
+            self._edited = True
+            self._engine.reset()
+            states = rule.getStates()
+            if max(self._cells, default=0) >= states:
+                clamp = bytes(state if state < states else CellState.DEAD for state in range(256))
+                self._cells[:] = self._cells.translate(clamp)
+                self._version += 1
+
+    def getTopology(self) -> str:
+        return self._topology
+
+    def setTopology(self, topology: str) -> None:
+        topology = parseTopology(topology)
+        if topology != self._topology:
+            self._topology = topology
+            self._edited = True
+            self._engine.reset()
+
+    def getTimeline(self) -> Union[Timeline, None]:
+        return self._timeline
+
+    def getCycleDetector(self) -> Union[CycleDetector, None]:
+        return self._cycleDetector
+
+    def cycle(self) -> Union[Cycle, None]:
+        if self._cycleDetector and not self._edited:
+            return self._cycleDetector.cycle()
+        return None
+
+    def inBounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self._cols and 0 <= y < self._rows
+
+    def getState(self, x: int, y: int) -> int:
+        if not self.inBounds(x, y):
+            return CellState.DEAD
+        return self._cells[y * self._cols + x]
+
+    def setState(self, x: int, y: int, state: int) -> bool:
+        if not self.inBounds(x, y):
+            return False
+        pos = y * self._cols + x
+        prev = self._cells[pos]
+        if prev == state:
+            return False
+        self._cells[pos] = state
+        self._population += (state == CellState.ALIVE) - (prev == CellState.ALIVE)
+        self._edited = True
+        self._version += 1
+        return True
+
+    def clear(self) -> None:
+        self._cells = bytearray(self._cols * self._rows)
+        self._generation = 0
+        self._population = 0
+        self._births = 0
+        self._deaths = 0
+        self._edited = True
+        self._version += 1
+        if self._timeline:
+            self._timeline.clear()
+
+    def snapshot(self) -> BoardSnapshot:
+        return BoardSnapshot(self._cols, self._rows, self._generation, self._cells, str(self._rule), self._topology)
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        if snapshot.getCols() != self._cols or snapshot.getRows() != self._rows:
+            raise ValueError(
+                f"snapshot is {snapshot.getCols()}x{snapshot.getRows()} but the board is {self._cols}x{self._rows}"
+            )
+        rule = Rule.parse(snapshot.getRule())
+        if max(snapshot.getCells(), default=0) >= rule.getStates():
+            raise ValueError(f"snapshot has cell states outside of {rule}")
+        self._rule = rule
+        self._topology = parseTopology(snapshot.getTopology())
+        self._cells = bytearray(snapshot.getCells())
+        self._generation = snapshot.getGeneration()
+        self._population = self._cells.count(CellState.ALIVE)
+        self._births = 0
+        self._deaths = 0
+        self._edited = True
+        self._version += 1
+
+    def seek(self, generation: int) -> bool:
+        """Restore ``generation`` from the timeline, keeping the history after it."""
+        if not self._timeline or not self._timeline.contains(generation):
+            return False
+        self._cells = bytearray(self._timeline.seek(generation))
+        self._generation = generation
+        self._population = self._cells.count(CellState.ALIVE)
+        self._births = 0
+        self._deaths = 0
+        self._edited = False
+        self._version += 1
+        if self._cycleDetector:
+            self._cycleDetector.reset(generation, self._cells, self._rule.getStates())
+        return True
+
+    def fastForward(self, target: int) -> bool:
+        """Jump to generation ``target`` once the board is known to repeat.
+
+        Only the remaining phase of the cycle is actually stepped.
+        """
+        if not self._cycleDetector or self._edited:
+            return False
+        steps = self._cycleDetector.skip(self._generation, target)
+        if steps is None:
+            return False
+        for _ in range(steps):
+            self.step()
+        self._generation = target
+        self._edited = True
+        return True
+
+    def run(self, generations: int) -> None:
+        for _ in range(generations):
+            self.step()
+
+    def runUntil(self, predicates: Iterable[Predicate], maxGenerations: Union[int, None] = None) -> RunResult:
+        """Step until one of ``predicates`` holds or ``maxGenerations`` have run.
+
+        The predicates are checked before the first step as well, so nothing
+        is stepped when one already holds. See ``gameoflife.predicate``.
+        """
+        predicates = list(predicates)
+        if not predicates and maxGenerations is None:
+            raise ValueError("runUntil() needs a predicate or a generation limit")
+        for predicate in predicates:
+            predicate.begin(self)
+
+        start = time.perf_counter()
+        peak = self._population
+        generations = 0
+        reason = RunResult.MAX_GENERATIONS
+        (births, deaths) = ((), ())
+        while True:
+            stopped = next((predicate for predicate in predicates if predicate.check(self, births, deaths)), None)
+            if stopped is not None:
+                reason = stopped.describe()
+                break
+            if maxGenerations is not None and generations >= maxGenerations:
+                break
+            (births, deaths) = self.step()
+            generations += 1
+            if self._population > peak:
+                peak = self._population
+
+        return RunResult(reason, self._generation, generations, time.perf_counter() - start, self._population, peak)
+
+    def iterGenerations(self, maxGenerations: Union[int, None] = None) -> Iterator[GenerationDelta]:
+        """Step and yield the change set of every generation, forever or ``maxGenerations`` times.
+
+        The deltas are what the engine reported while stepping, so nothing
+        looks at the whole board to build them.
+        """
+        version = self._version
+        generations = 0
+        while maxGenerations is None or generations < maxGenerations:
+            edited = self._version != version
+            (births, deaths) = self.step()
+            version = self._version
+            generations += 1
+            yield GenerationDelta(self._generation, self._cols, births, deaths, edited)
+
+    def runFor(self, seconds: float) -> int:
+        """Step for ``seconds`` of wall time and return the generations run."""
+        deadline = time.perf_counter() + seconds
+        generations = 0
+        while time.perf_counter() < deadline:
+            self.step()
+            generations += 1
+        return generations
+
+    def profile(
+        self,
+        generations: Union[int, None] = None,
+        seconds: Union[float, None] = None,
+        directory: str = "profiles",
+    ) -> str:
+        """Step under cProfile and tracemalloc and return the report directory."""
+        from gameoflife.profiler import ProfileCapture
+
+        capture = ProfileCapture(
+            directory,
+            seconds=seconds,
+            generations=generations,
+            focus=[Simulation.step],
+            label=lambda: f"engine: {self._engine.describe()}",
+        )
+        capture.start(self._generation)
+        while not capture.tick(self._generation):
+            self.step()
+        return capture.getPath()
+
+    def step(self) -> Tuple[List[int], List[int]]:
+        """Advance one generation and return the (births, deaths) positions."""
+        if self._edited:
+            if self._timeline:
+                self._timeline.keyframe(self._generation, bytes(self._cells), self._rule)
+            if self._cycleDetector:
+                self._cycleDetector.reset(self._generation, self._cells, self._rule.getStates())
+            self._edited = False
+        elif self._timeline and not self._timeline.contains(self._generation):
+            self._timeline.keyframe(self._generation, bytes(self._cells), self._rule)
+
+        if self._engineVersion != self._version:
+            # Cells were edited, restored or seeked outside of the engine.
+            self._engine.reset()
+        (births, deaths) = self._engine.step(self._cells, self._cols, self._rows, self._rule, self._topology)
+
+        self._generation += 1
+        self._version += 1
+        self._engineVersion = self._version
+        self._births = len(births)
+        self._deaths = len(deaths)
+        self._population += self._births - self._deaths
+
+        if self._timeline:
+            self._timeline.record(self._generation, births, deaths, lambda: bytes(self._cells), self._rule)
+        if self._cycleDetector:
+            self._cycleDetector.update(self._generation, births, deaths)
+
+        return (births, deaths)
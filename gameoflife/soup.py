@@ -0,0 +1,293 @@
+"""Random soup search.
+
+Runs many random soups headlessly across a process pool and streams one JSON
+line per soup to a results file::
+
+    python -m gameoflife.soup --soups 10000 --size 16 --density 0.5 --seed 1 --out soups.jsonl
+
+Each soup is generated from ``(seed, index)`` alone, so any soup can be
+reproduced and an interrupted search picks up where it left off when run
+again with the same output file.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from collections import Counter
+from typing import IO, Dict, Iterator, List, Set, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.census import census, loadIndex
+from gameoflife.cycle import CycleDetector, CycleType
+from gameoflife.predicate import RunResult, Stable
+from gameoflife.rule import CONWAY, Rule
+from gameoflife.simulation import Simulation
+from gameoflife.topology import Topology, parseTopology
+
+
+class SoupParams:
+    """Settings shared by every soup of a search.
+
+    They are written as the first line of the results file so a resumed
+    search can check it is continuing the same run.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        size: int = 16,
+        density: float = 0.5,
+        board: int = 128,
+        maxGenerations: int = 20000,
+        rule: str = CONWAY,
+        topology: str = Topology.DEAD,
+        keep: int = 1000,
+        census: bool = False,
+        patterns: str = "patterns",
+    ) -> None:
+        if size > board:
+            raise ValueError(f"soup size {size} does not fit on a {board}x{board} board")
+        if not 0.0 <= density <= 1.0:
+            raise ValueError("density must be between 0 and 1")
+        self.seed = seed
+        self.size = size
+        self.density = density
+        self.board = board
+        self.maxGenerations = maxGenerations
+        self.rule = str(Rule.parse(rule))
+        self.topology = parseTopology(topology)
+        self.keep = keep
+        self.census = census
+        self.patterns = patterns
+
+    def toDict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "size": self.size,
+            "density": self.density,
+            "board": self.board,
+            "maxGenerations": self.maxGenerations,
+            "rule": self.rule,
+            "topology": self.topology,
+            "keep": self.keep,
+            "census": self.census,
+            "patterns": self.patterns,
+        }
+
+    @staticmethod
+    def fromDict(data: dict) -> "SoupParams":
+        return SoupParams(**data)
+
+
+def soupSeed(params: SoupParams, index: int) -> List[str]:
+    """Return soup ``index`` as pattern-style rows of "0" and "1"."""
+    rng = random.Random(f"{params.seed}:{index}")
+    size = params.size
+    return ["".join("1" if rng.random() < params.density else "0" for _ in range(size)) for _ in range(size)]
+
+
+def runSoup(params: SoupParams, index: int) -> dict:
+    """Run one soup until it stabilizes or hits the generation cap."""
+    start = time.perf_counter()
+    board = params.board
+    seed = soupSeed(params, index)
+    sim = Simulation(
+        board,
+        board,
+        cycleDetector=CycleDetector(board, board),
+        rule=Rule.parse(params.rule),
+        topology=params.topology,
+    )
+    origin = (board - params.size) // 2
+    for (y, line) in enumerate(seed):
+        for (x, char) in enumerate(line):
+            if char == "1":
+                sim.setState(origin + x, origin + y, CellState.ALIVE)
+
+    initial = sim.getPopulation()
+    run = sim.runUntil([Stable()], params.maxGenerations)
+    peak = run.getPeakPopulation()
+    cycle = sim.cycle() if run.getReason() != RunResult.MAX_GENERATIONS else None
+
+    if cycle is None:
+        status = "capped"
+        lifespan = sim.getGeneration()
+        period = 0
+    elif cycle.getType() == CycleType.EXTINCT:
+        status = cycle.getType()
+        lifespan = cycle.getGeneration()
+        period = 0
+    else:
+        status = cycle.getType()
+        lifespan = cycle.getGeneration() - cycle.getPeriod()
+        period = cycle.getPeriod()
+
+    result = {
+        "soup": index,
+        "status": status,
+        "lifespan": lifespan,
+        "period": period,
+        "initialPopulation": initial,
+        "finalPopulation": sim.getPopulation(),
+        "peakPopulation": peak,
+        "seconds": round(time.perf_counter() - start, 4),
+        "engine": sim.getEngine().describe(),
+    }
+    if params.keep and lifespan >= params.keep:
+        result["seed"] = seed
+    if params.census:
+        index = loadIndex(params.patterns, params.rule)
+        result["census"] = census(sim.getCells(), board, board, index, params.topology).toDict()
+    return result
+
+
+def _runSoup(job) -> dict:
+    (params, index) = job
+    return runSoup(params, index)
+
+
+def readResults(path: str) -> Iterator[dict]:
+    """Yield the soup results in ``path``, skipping the header and torn lines."""
+    if not os.path.exists(path):
+        return
+    with open(path) as file:
+        for line in file:
+            try:
+                data = json.loads(line)
+            except ValueError:
+                continue
+            if "soup" in data:
+                yield data
+
+
+def _openResults(path: str, params: SoupParams) -> Tuple[IO, Set[int]]:
+    done: Set[int] = set()
+    if os.path.exists(path) and os.path.getsize(path):
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+        if header.get("params") != params.toDict():
+            raise ValueError(f'"{path}" was written with different parameters: {header.get("params")}')
+        done = {result["soup"] for result in readResults(path)}
+        file = open(path, "r+")
+        file.seek(0, os.SEEK_END)
+        # Terminate a line cut short by a killed run; readResults() skips it.
+        size = file.tell()
+        if size:
+            file.seek(size - 1)
+            if file.read(1) != "\n":
+                file.write("\n")
+        return (file, done)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    file = open(path, "w")
+    file.write(json.dumps({"params": params.toDict()}) + "\n")
+    file.flush()
+    return (file, done)
+
+
+def search(
+    params: SoupParams,
+    soups: int,
+    path: str,
+    processes: Union[int, None] = None,
+    chunksize: int = 8,
+    progress: bool = True,
+) -> Dict[str, int]:
+    """Run soups ``0..soups-1`` that are not already in ``path``.
+
+    Results are appended in completion order as workers finish them and each
+    line is flushed, so an interrupted search loses at most the soups that
+    were still running.
+    """
+    (file, done) = _openResults(path, params)
+    jobs = [(params, index) for index in range(soups) if index not in done]
+    counts = {"done": len(done), "ran": 0, "total": soups}
+    if not jobs:
+        file.close()
+        return counts
+
+    # Workers are spawned, not forked: the parent may already have started
+    # the array engine's thread pool, which a forked child inherits locked.
+    # Each worker builds its own census index once, up front.
+    (initializer, initargs) = (loadIndex, (params.patterns, params.rule)) if params.census else (None, ())
+    start = time.perf_counter()
+    best = None
+    processes = processes or os.cpu_count() or 1
+    try:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes, initializer=initializer, initargs=initargs) as pool:
+            for result in pool.imap_unordered(_runSoup, jobs, chunksize=chunksize):
+                file.write(json.dumps(result, separators=(",", ":")) + "\n")
+                file.flush()
+                counts["ran"] += 1
+                if best is None or result["lifespan"] > best["lifespan"]:
+                    best = result
+                if progress and counts["ran"] % 100 == 0:
+                    rate = counts["ran"] / (time.perf_counter() - start)
+                    print(
+                        f'{counts["done"] + counts["ran"]}/{soups} soups, {rate:.1f}/s, '
+                        f'longest soup {best["soup"]} ({best["lifespan"]} generations)'
+                    )
+    finally:
+        file.close()
+    return counts
+
+
+def main(argv: Union[List[str], None] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m gameoflife.soup", description="Random soup search")
+    parser.add_argument("--soups", type=int, default=1000, help="number of soups to run")
+    parser.add_argument("--size", type=int, default=16, help="soup width and height")
+    parser.add_argument("--density", type=float, default=0.5, help="chance a soup cell starts alive")
+    parser.add_argument("--seed", type=int, default=0, help="search seed")
+    parser.add_argument("--board", type=int, default=128, help="board width and height")
+    parser.add_argument("--max-generations", type=int, default=20000, help="generation cap per soup")
+    parser.add_argument("--rule", default=CONWAY)
+    parser.add_argument("--topology", default=Topology.DEAD, choices=Topology.ALL)
+    parser.add_argument("--keep", type=int, default=1000, help="store the seed of soups living at least this long")
+    parser.add_argument("--census", action="store_true", help="identify the objects each soup leaves behind")
+    parser.add_argument("--patterns", default="patterns", help="pattern library used by --census")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--out", default="soups.jsonl", help="results file, resumed if it exists")
+    args = parser.parse_args(argv)
+
+    try:
+        params = SoupParams(
+            seed=args.seed,
+            size=args.size,
+            density=args.density,
+            board=args.board,
+            maxGenerations=args.max_generations,
+            rule=args.rule,
+            topology=args.topology,
+            keep=args.keep,
+            census=args.census,
+            patterns=args.patterns,
+        )
+        counts = search(params, args.soups, args.out, processes=args.processes)
+    except (OSError, ValueError) as e:
+        print(f"soup search failed: {e}")
+        return 1
+
+    results = sorted(readResults(args.out), key=lambda result: result["lifespan"], reverse=True)
+    print(f'ran {counts["ran"]} soups ({counts["done"]} already done), results in "{args.out}"')
+    for result in results[:10]:
+        print(
+            f'soup {result["soup"]}: {result["status"]} after {result["lifespan"]} generations, '
+            f'population {result["finalPopulation"]} (peak {result["peakPopulation"]})'
+        )
+    if args.census:
+        total = Counter()
+        for result in results:
+            total.update(result.get("census", {}))
+        print(", ".join(f"{name} {count}" for (name, count) in total.most_common()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
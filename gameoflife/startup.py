@@ -0,0 +1,33 @@
+import time
+
+from typing import List, Tuple, Union
+
+
+class StartupProfile:
+    """Wall-clock time spent in each startup phase.
+
+    ``mark(name)`` closes the phase that began at the previous mark (or at
+    ``start``), so the phases add up to the time from launch to ``mark``.
+    """
+
+    def __init__(self, start: Union[float, None] = None) -> None:
+        self._start = time.perf_counter() if start is None else start
+        self._last = self._start
+        self._phases: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self._phases.append((name, now - self._last))
+        self._last = now
+
+    def getPhases(self) -> List[Tuple[str, float]]:
+        return self._phases
+
+    def total(self) -> float:
+        return self._last - self._start
+
+    def report(self) -> str:
+        width = max((len(name) for (name, _) in self._phases), default=0)
+        lines = [f"{name:<{width}} {seconds * 1000:7.1f} ms" for (name, seconds) in self._phases]
+        lines.append(f"{'total':<{width}} {self.total() * 1000:7.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,488 @@
+"""Boards too big for memory, split into tiles kept in a memory-mapped file.
+
+Only tiles holding a non-dead cell exist at all: they get a slot in the file
+the first time they are written back, and give it up again once they empty
+out. At most ``maxResident`` tiles are held in memory, least recently used
+first out, and only tiles that changed are ever written back.
+
+The game opens one in place of its ``Simulation`` when ``tiles.path`` is
+configured and draws it through ``TiledBoard.region()``, so only the tiles
+under the viewport and around the activity are ever paged in.
+"""
+
+import json
+import mmap
+import os
+
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.engine import RowEngine
+from gameoflife.rule import CONWAY, Rule
+from gameoflife.topology import Topology
+
+
+Tile = Tuple[int, int]
+
+
+class TileStore:
+    """Square ``tileSize`` x ``tileSize`` tiles of one byte per cell in slots of ``path``.
+
+    Where each tile lives is kept in ``path + ".json"``, written by
+    ``flush()`` along with whatever the owner hands it.
+    """
+
+    def __init__(self, path: str, tileSize: int = 256, maxResident: int = 256) -> None:
+        if tileSize < 1 or maxResident < 1:
+            raise ValueError("tile size and resident tiles must be at least 1")
+        self._path = path
+        self._tileSize = tileSize
+        self._tileBytes = tileSize * tileSize
+        self._empty = bytes(self._tileBytes)
+        self._maxResident = maxResident
+        self._slots: Dict[Tile, int] = {}
+        self._free: List[int] = []
+        self._used = 0
+        self._resident: "OrderedDict[Tile, bytearray]" = OrderedDict()
+        self._dirty: Set[Tile] = set()
+        self._meta: dict = {}
+        self._loads = 0
+        self._writes = 0
+        self._evictions = 0
+
+        if os.path.exists(self._indexPath()):
+            with open(self._indexPath()) as file:
+                index = json.load(file)
+            if index["tileSize"] != tileSize:
+                raise ValueError(f'"{path}" has {index["tileSize"]} cell tiles, not {tileSize}')
+            self._slots = {(tx, ty): slot for (tx, ty, slot) in index["slots"]}
+            self._used = index["used"]
+            self._free = sorted(set(range(self._used)) - set(self._slots.values()))
+            self._meta = index.get("meta", {})
+            self._file = open(path, "r+b")
+        else:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            self._file = open(path, "w+b")
+        self._capacity = 0
+        self._map: Union[mmap.mmap, None] = None
+        self._reserve(max(16, self._used))
+
+    def _indexPath(self) -> str:
+        return self._path + ".json"
+
+    def getPath(self) -> str:
+        return self._path
+
+    def getTileSize(self) -> int:
+        return self._tileSize
+
+    def getMeta(self) -> dict:
+        return self._meta
+
+    def stats(self) -> dict:
+        return {
+            "tiles": len(self.tiles()),
+            "slots": self._used,
+            "resident": len(self._resident),
+            "dirty": len(self._dirty),
+            "loads": self._loads,
+            "writes": self._writes,
+            "evictions": self._evictions,
+            "bytes": self._capacity * self._tileBytes,
+        }
+
+    def tiles(self) -> Set[Tile]:
+        """Every tile that is not known to be empty."""
+        tiles = set(self._slots)
+        tiles.update(self._resident)
+        return tiles
+
+    def get(self, tile: Tile) -> Union[bytearray, None]:
+        """The cells of ``tile``, paged in if needed, or None when it is empty."""
+        cells = self._resident.get(tile)
+        if cells is not None:
+            self._resident.move_to_end(tile)
+            return cells
+        slot = self._slots.get(tile)
+        if slot is None:
+            return None
+        offset = slot * self._tileBytes
+        cells = bytearray(self._map[offset:offset + self._tileBytes])
+        self._loads += 1
+        self._admit(tile, cells)
+        return cells
+
+    def clear(self) -> None:
+        """Forget every tile; their slots are reused by the next ones written."""
+        self._slots.clear()
+        self._free = list(range(self._used))
+        self._resident.clear()
+        self._dirty.clear()
+
+    def create(self, tile: Tile) -> bytearray:
+        """The cells of ``tile``, made resident as an empty tile if it had none."""
+        cells = self.get(tile)
+        if cells is None:
+            cells = bytearray(self._tileBytes)
+            self._admit(tile, cells)
+        return cells
+
+    def markDirty(self, tile: Tile) -> None:
+        self._dirty.add(tile)
+
+    def flush(self, meta: Union[dict, None] = None) -> None:
+        """Write back every changed tile and the index."""
+        for tile in list(self._dirty):
+            self._writeBack(tile, self._resident[tile])
+        for tile in [tile for (tile, cells) in self._resident.items() if cells == self._empty]:
+            del self._resident[tile]
+        self._map.flush()
+        if meta is not None:
+            self._meta = meta
+        index = {
+            "tileSize": self._tileSize,
+            "used": self._used,
+            "slots": [[tx, ty, slot] for ((tx, ty), slot) in self._slots.items()],
+            "meta": self._meta,
+        }
+        with open(self._indexPath(), "w") as file:
+            json.dump(index, file, separators=(",", ":"))
+
+    def close(self, meta: Union[dict, None] = None) -> None:
+        self.flush(meta)
+        self._map.close()
+        self._file.close()
+
+    def _admit(self, tile: Tile, cells: bytearray) -> None:
+        self._resident[tile] = cells
+        while len(self._resident) > self._maxResident:
+            (old, oldCells) = self._resident.popitem(last=False)
+            self._evictions += 1
+            if old in self._dirty:
+                self._writeBack(old, oldCells)
+
+    def _writeBack(self, tile: Tile, cells: bytearray) -> None:
+        self._dirty.discard(tile)
+        slot = self._slots.get(tile)
+        if cells == self._empty:
+            if slot is not None:
+                del self._slots[tile]
+                self._free.append(slot)
+            return
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = self._used
+                self._used += 1
+                if self._used > self._capacity:
+                    self._reserve(self._capacity * 2)
+            self._slots[tile] = slot
+        offset = slot * self._tileBytes
+        self._map[offset:offset + self._tileBytes] = cells
+        self._writes += 1
+
+    def _reserve(self, capacity: int) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        self._capacity = capacity
+        self._file.truncate(capacity * self._tileBytes)
+        self._map = mmap.mmap(self._file.fileno(), capacity * self._tileBytes)
+
+
+class TiledBoard:
+    """A ``cols`` x ``rows`` board with dead edges, stored in a ``TileStore``.
+
+    Stepping only visits the tiles around those that changed in the last
+    generation (or were edited), so the work and the tiles paged in follow
+    the activity rather than the board size. Each of them is stepped by the
+    row engine on a copy padded with the edges of its neighbors, taken before
+    any tile is rewritten. Rules that give birth on zero neighbors would wake
+    up every empty tile and are not supported.
+    """
+
+    def __init__(
+        self,
+        cols: int,
+        rows: int,
+        path: str,
+        tileSize: int = 256,
+        maxResident: int = 256,
+        rule: Union[Rule, None] = None,
+    ) -> None:
+        self._store = TileStore(path, tileSize, maxResident)
+        self._cols = cols
+        self._rows = rows
+        self._tileSize = tileSize
+        self._emptyTile = bytes(tileSize * tileSize)
+        self._tilesX = -(-cols // tileSize)
+        self._tilesY = -(-rows // tileSize)
+        self._rule = rule or Rule.parse(CONWAY)
+        self._generation = 0
+        self._population = 0
+        self._births = 0
+        self._deaths = 0
+        self._version = 0
+        self._active: Set[Tile] = set()
+        self._engine = RowEngine()
+        self._checkRule(self._rule)
+
+        meta = self._store.getMeta()
+        if meta:
+            if (meta["cols"], meta["rows"]) != (cols, rows):
+                raise ValueError(f'"{path}" holds a {meta["cols"]}x{meta["rows"]} board, not {cols}x{rows}')
+            self._rule = Rule.parse(meta["rule"])
+            self._generation = meta["generation"]
+            self._population = meta["population"]
+            self._active = {(tx, ty) for (tx, ty) in meta["active"]}
+
+    @staticmethod
+    def open(path: str, maxResident: int = 256) -> "TiledBoard":
+        """Reopen a board saved by ``flush()`` or ``close()``."""
+        with open(path + ".json") as file:
+            index = json.load(file)
+        meta = index["meta"]
+        return TiledBoard(meta["cols"], meta["rows"], path, index["tileSize"], maxResident)
+
+    @staticmethod
+    def _checkRule(rule: Rule) -> None:
+        if rule.next(CellState.DEAD, 0) != CellState.DEAD:
+            raise ValueError(f"tiled boards cannot step {rule}, it gives birth on zero neighbors")
+
+    def getCols(self) -> int:
+        return self._cols
+
+    def getRows(self) -> int:
+        return self._rows
+
+    def getGeneration(self) -> int:
+        return self._generation
+
+    def getPopulation(self) -> int:
+        return self._population
+
+    def getBirths(self) -> int:
+        return self._births
+
+    def getDeaths(self) -> int:
+        return self._deaths
+
+    def getVersion(self) -> int:
+        """Counter that changes whenever any cell may have changed."""
+        return self._version
+
+    def getRule(self) -> Rule:
+        return self._rule
+
+    def setRule(self, rule: Rule) -> None:
+        self._checkRule(rule)
+        if rule != self._rule:
+            self._rule = rule
+            self._active = set(self._store.tiles())
+            self._version += 1
+
+    def getTopology(self) -> str:
+        return Topology.DEAD
+
+    def getEngine(self) -> RowEngine:
+        return self._engine
+
+    def getStore(self) -> TileStore:
+        return self._store
+
+    def getPath(self) -> str:
+        return self._store.getPath()
+
+    def getActiveTiles(self) -> int:
+        return len(self._active)
+
+    def inBounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self._cols and 0 <= y < self._rows
+
+    def getState(self, x: int, y: int) -> int:
+        if not self.inBounds(x, y):
+            return CellState.DEAD
+        size = self._tileSize
+        cells = self._store.get((x // size, y // size))
+        if cells is None:
+            return CellState.DEAD
+        return cells[(y % size) * size + x % size]
+
+    def setState(self, x: int, y: int, state: int) -> bool:
+        if not self.inBounds(x, y):
+            return False
+        size = self._tileSize
+        tile = (x // size, y // size)
+        cells = self._store.get(tile) if state == CellState.DEAD else self._store.create(tile)
+        if cells is None:
+            return False
+        pos = (y % size) * size + x % size
+        prev = cells[pos]
+        if prev == state:
+            return False
+        cells[pos] = state
+        self._store.markDirty(tile)
+        self._population += (state == CellState.ALIVE) - (prev == CellState.ALIVE)
+        self._active.update(self._around(tile))
+        self._version += 1
+        return True
+
+    def clear(self) -> None:
+        self._store.clear()
+        self._generation = 0
+        self._population = 0
+        self._births = 0
+        self._deaths = 0
+        self._active = set()
+        self._version += 1
+
+    def region(self, x: int, y: int, width: int, height: int) -> bytearray:
+        """The ``width`` x ``height`` cells from ``(x, y)`` on, row by row, for drawing.
+
+        Only the tiles under the region are paged in; cells off the board
+        read as dead.
+        """
+        out = bytearray(width * height)
+        size = self._tileSize
+        left = max(x, 0)
+        right = min(x + width, self._cols)
+        top = max(y, 0)
+        bottom = min(y + height, self._rows)
+        for ty in range(top // size, -(-bottom // size)):
+            for tx in range(left // size, -(-right // size)):
+                cells = self._store.get((tx, ty))
+                if cells is None:
+                    continue
+                (x0, x1) = (max(left, tx * size), min(right, (tx + 1) * size))
+                for row in range(max(top, ty * size), min(bottom, (ty + 1) * size)):
+                    src = (row - ty * size) * size
+                    dst = (row - y) * width
+                    out[dst + x0 - x:dst + x1 - x] = cells[src + x0 - tx * size:src + x1 - tx * size]
+        return out
+
+    def step(self) -> None:
+        size = self._tileSize
+        padded = size + 2
+        # Edges of every tile next to an active one, read before any of them
+        # is rewritten: (top row, bottom row, left column, right column).
+        edges: Dict[Tile, Tuple[bytes, bytes, bytes, bytes]] = {}
+        for tile in self._neighborhood(self._active):
+            cells = self._store.get(tile)
+            if cells is not None:
+                edges[tile] = (
+                    bytes(cells[:size]),
+                    bytes(cells[-size:]),
+                    bytes(cells[::size]),
+                    bytes(cells[size - 1::size]),
+                )
+
+        (births, deaths) = (0, 0)
+        changed: Set[Tile] = set()
+        zero = bytes(size)
+        for tile in sorted(self._active):
+            (tx, ty) = tile
+            cells = self._store.get(tile)
+            around = [edges.get((tx + dx, ty + dy)) for (dx, dy) in _AROUND]
+            if cells is None and not any(around):
+                continue
+            (up, down, left, right, upLeft, upRight, downLeft, downRight) = around
+            buffer = bytearray(padded * padded)
+            buffer[0] = upLeft[1][-1] if upLeft else 0
+            buffer[1:size + 1] = up[1] if up else zero
+            buffer[size + 1] = upRight[1][0] if upRight else 0
+            for y in range(size):
+                offset = (y + 1) * padded
+                buffer[offset] = left[3][y] if left else 0
+                if cells is not None:
+                    buffer[offset + 1:offset + size + 1] = cells[y * size:(y + 1) * size]
+                buffer[offset + size + 1] = right[2][y] if right else 0
+            offset = (size + 1) * padded
+            buffer[offset] = downLeft[0][-1] if downLeft else 0
+            buffer[offset + 1:offset + size + 1] = down[0] if down else zero
+            buffer[offset + size + 1] = downRight[0][0] if downRight else 0
+
+            (born, died) = self._engine.step(buffer, padded, padded, self._rule, Topology.DEAD)
+            self._clip(buffer, tx, ty)
+            interior = bytearray(size * size)
+            for y in range(size):
+                offset = (y + 1) * padded + 1
+                interior[y * size:(y + 1) * size] = buffer[offset:offset + size]
+            if cells is None:
+                if interior == self._emptyTile:
+                    continue
+                cells = self._store.create(tile)
+            elif interior == cells:
+                continue
+            births += self._inside(born, tx, ty)
+            deaths += self._inside(died, tx, ty)
+            cells[:] = interior
+            self._store.markDirty(tile)
+            changed.add(tile)
+
+        self._generation += 1
+        self._births = births
+        self._deaths = deaths
+        self._population += births - deaths
+        self._active = set(self._neighborhood(changed))
+        self._version += 1
+
+    def flush(self) -> None:
+        self._store.flush(self._meta())
+
+    def close(self) -> None:
+        self._store.close(self._meta())
+
+    def _meta(self) -> dict:
+        return {
+            "cols": self._cols,
+            "rows": self._rows,
+            "rule": str(self._rule),
+            "generation": self._generation,
+            "population": self._population,
+            "active": [[tx, ty] for (tx, ty) in sorted(self._active)],
+        }
+
+    def _around(self, tile: Tile) -> Iterable[Tile]:
+        (tx, ty) = tile
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if 0 <= tx + dx < self._tilesX and 0 <= ty + dy < self._tilesY:
+                    yield (tx + dx, ty + dy)
+
+    def _neighborhood(self, tiles: Iterable[Tile]) -> Set[Tile]:
+        out: Set[Tile] = set()
+        for tile in tiles:
+            out.update(self._around(tile))
+        return out
+
+    def _clip(self, buffer: bytearray, tx: int, ty: int) -> None:
+        """Kill whatever a tile on the far edge grew past the end of the board."""
+        size = self._tileSize
+        padded = size + 2
+        width = min(size, self._cols - tx * size)
+        height = min(size, self._rows - ty * size)
+        if width < size:
+            for y in range(1, size + 1):
+                buffer[y * padded + width + 1:y * padded + size + 1] = bytes(size - width)
+        if height < size:
+            buffer[(height + 1) * padded:(size + 1) * padded] = bytes((size - height) * padded)
+
+    def _inside(self, positions: List[int], tx: int, ty: int) -> int:
+        """How many of the padded buffer ``positions`` lie on the board."""
+        size = self._tileSize
+        padded = size + 2
+        width = min(size, self._cols - tx * size)
+        height = min(size, self._rows - ty * size)
+        count = 0
+        for pos in positions:
+            (y, x) = divmod(pos, padded)
+            if 1 <= x <= width and 1 <= y <= height:
+                count += 1
+        return count
+
+
+# Order matches the unpacking in TiledBoard.step().
+_AROUND = ((0, -1), (0, 1), (-1, 0), (1, 0), (-1, -1), (1, -1), (-1, 1), (1, 1))
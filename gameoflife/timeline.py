@@ -0,0 +1,171 @@
+from array import array
+from collections import deque
+from typing import Callable, Iterable, List, Tuple, Union
+
+from gameoflife.cell import CellState
+from gameoflife.rule import Rule
+
+
+class TimelineSegment:
+    """A full keyframe followed by the per-generation deltas that come after it.
+
+    Delta ``i`` holds the births and deaths that turned generation
+    ``keyGeneration + i`` into ``keyGeneration + i + 1``. Under a multi-state
+    ``rule`` deaths are cells that stopped being alive, and dying cells are
+    aged by the rule while replaying.
+    """
+
+    def __init__(self, keyGeneration: int, keyCells: bytes, rule: Union[Rule, None] = None) -> None:
+        self.keyGeneration: int = keyGeneration
+        self.keyCells: bytes = bytes(keyCells)
+        self.rule: Union[Rule, None] = rule
+        self.births: List[array] = []
+        self.deaths: List[array] = []
+        self.nbytes: int = len(self.keyCells)
+
+    def lastGeneration(self) -> int:
+        return self.keyGeneration + len(self.births)
+
+    def append(self, births: Iterable[int], deaths: Iterable[int]) -> int:
+        b = array("I", births)
+        d = array("I", deaths)
+        self.births.append(b)
+        self.deaths.append(d)
+        size = (len(b) + len(d)) * b.itemsize
+        self.nbytes += size
+        return size
+
+    def truncate(self, generation: int) -> None:
+        """Drop every delta that produces a generation after ``generation``."""
+        keep = generation - self.keyGeneration
+        for i in range(keep, len(self.births)):
+            self.nbytes -= (len(self.births[i]) + len(self.deaths[i])) * self.births[i].itemsize
+        del self.births[keep:]
+        del self.deaths[keep:]
+
+    def cellsAt(self, generation: int) -> bytes:
+        cells = bytearray(self.keyCells)
+        multiState = self.rule is not None and self.rule.getStates() > 2
+        dying = self.rule.getDyingState() if self.rule else CellState.DEAD
+        for i in range(generation - self.keyGeneration):
+            if multiState:
+                cells = bytearray(cells.translate(self.rule.getAging()))
+            for pos in self.births[i]:
+                cells[pos] = CellState.ALIVE
+            for pos in self.deaths[i]:
+                cells[pos] = dying
+        return bytes(cells)
+
+
+class Timeline:
+    """Bounded generation history used for stepping backwards and seeking.
+
+    A full keyframe of the board is stored every ``keyframeInterval``
+    generations and only births/deaths are kept in between, so reconstructing
+    any retained generation replays at most ``keyframeInterval - 1`` deltas.
+    Once the history grows past ``maxBytes`` the oldest keyframe and its
+    deltas are evicted together; the newest segment is always kept.
+    """
+
+    def __init__(self, keyframeInterval: int = 32, maxBytes: int = 16 * 1024 * 1024) -> None:
+        if keyframeInterval < 1:
+            raise ValueError("keyframe interval must be at least 1")
+        self._keyframeInterval = keyframeInterval
+        self._maxBytes = maxBytes
+        self._segments: deque = deque()
+        self._nbytes = 0
+
+    def clear(self) -> None:
+        self._segments.clear()
+        self._nbytes = 0
+
+    def empty(self) -> bool:
+        return not self._segments
+
+    def firstGeneration(self) -> Union[int, None]:
+        if not self._segments:
+            return None
+        return self._segments[0].keyGeneration
+
+    def lastGeneration(self) -> Union[int, None]:
+        if not self._segments:
+            return None
+        return self._segments[-1].lastGeneration()
+
+    def contains(self, generation: int) -> bool:
+        if not self._segments:
+            return False
+        return self.firstGeneration() <= generation <= self.lastGeneration()
+
+    def getKeyframeInterval(self) -> int:
+        return self._keyframeInterval
+
+    def getMaxBytes(self) -> int:
+        return self._maxBytes
+
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def keyframe(self, generation: int, cells: bytes, rule: Union[Rule, None] = None) -> None:
+        """Start a new segment at ``generation``, discarding anything at or after it."""
+        self.truncate(generation - 1)
+        segment = TimelineSegment(generation, cells, rule)
+        self._segments.append(segment)
+        self._nbytes += segment.nbytes
+        self._evict()
+
+    def record(
+        self,
+        generation: int,
+        births: Iterable[int],
+        deaths: Iterable[int],
+        snapshot: Callable[[], bytes],
+        rule: Union[Rule, None] = None,
+    ) -> None:
+        """Record the change set that produced ``generation``.
+
+        ``snapshot`` is only called when a new keyframe is due, or when the
+        history has no entry for the previous generation to build upon.
+        """
+        if not self.contains(generation - 1):
+            self.clear()
+            self.keyframe(generation, snapshot(), rule)
+            return
+
+        self.truncate(generation - 1)
+        segment = self._segments[-1]
+        if generation - segment.keyGeneration >= self._keyframeInterval or segment.rule != rule:
+            self.keyframe(generation, snapshot(), rule)
+            return
+
+        self._nbytes += segment.append(births, deaths)
+        self._evict()
+
+    def seek(self, generation: int) -> bytes:
+        """Return the board cells at ``generation``."""
+        if not self.contains(generation):
+            raise KeyError(f"generation {generation} is not in the timeline")
+        for segment in reversed(self._segments):
+            if segment.keyGeneration <= generation:
+                return segment.cellsAt(generation)
+        raise KeyError(f"generation {generation} is not in the timeline")
+
+    def truncate(self, generation: int) -> None:
+        """Forget every generation after ``generation``."""
+        while self._segments and self._segments[-1].keyGeneration > generation:
+            self._nbytes -= self._segments.pop().nbytes
+        if self._segments:
+            segment = self._segments[-1]
+            before = segment.nbytes
+            segment.truncate(generation)
+            self._nbytes -= before - segment.nbytes
+
+    def stats(self) -> Tuple[int, int, int]:
+        """Return (segments, generations retained, bytes used)."""
+        if not self._segments:
+            return (0, 0, 0)
+        return (len(self._segments), self.lastGeneration() - self.firstGeneration() + 1, self._nbytes)
+
+    def _evict(self) -> None:
+        while self._nbytes > self._maxBytes and len(self._segments) > 1:
+            self._nbytes -= self._segments.popleft().nbytes
@@ -0,0 +1,54 @@
+from typing import Tuple, Union
+
+
+class Topology:
+    """How the edges of the board connect.
+
+    - ``dead``: everything past the edge is a dead cell
+    - ``torus``: left/right and top/bottom edges wrap around
+    - ``klein``: left/right wrap around, top/bottom wrap with x mirrored
+    """
+
+    DEAD: str = "dead"
+    TORUS: str = "torus"
+    KLEIN: str = "klein"
+
+    ALL = (DEAD, TORUS, KLEIN)
+
+
+def parseTopology(name: str) -> str:
+    topology = name.strip().lower()
+    if topology not in Topology.ALL:
+        raise ValueError(f"unknown topology '{name}', expected one of {', '.join(Topology.ALL)}")
+    return topology
+
+
+def wrap(topology: str, x: int, y: int, cols: int, rows: int) -> Union[Tuple[int, int], None]:
+    """Map ``(x, y)`` onto the board, or None if it falls off a dead edge."""
+    if topology == Topology.DEAD:
+        if 0 <= x < cols and 0 <= y < rows:
+            return (x, y)
+        return None
+    if topology == Topology.KLEIN and not 0 <= y < rows:
+        if (y // rows) % 2:
+            x = cols - 1 - x
+    return (x % cols, y % rows)
+
+
+def ghostRows(topology: str, first: bytes, last: bytes) -> Tuple[Union[bytes, None], Union[bytes, None]]:
+    """Return the ghost rows (above the first row, below the last row).
+
+    None means the ghost row is all dead.
+    """
+    if topology == Topology.TORUS:
+        return (last, first)
+    if topology == Topology.KLEIN:
+        return (last[::-1], first[::-1])
+    return (None, None)
+
+
+def padRow(topology: str, row: bytes) -> int:
+    """Return ``row`` with one ghost cell on each side as a big-endian integer."""
+    if topology == Topology.DEAD:
+        return int.from_bytes(row, "big") << 8
+    return int.from_bytes(row[-1:] + row + row[:1], "big")
@@ -0,0 +1,39 @@
+from gameoflife.cell import CellState
+from gameoflife.simulation import Simulation
+
+import pytest
+import random
+
+
+@pytest.fixture
+def aliveBoard():
+    """Factory for a ``Simulation(cols, rows, **kwargs)`` with the ``(x, y)`` ``points`` alive."""
+
+    def make(cols:int, rows:int, points, **kwargs) -> Simulation:
+        sim = Simulation(cols, rows, **kwargs)
+        for (x, y) in points:
+            sim.setState(x, y, CellState.ALIVE)
+        return sim
+
+    return make
+
+
+@pytest.fixture
+def soupBoard():
+    """Factory for a ``Simulation(cols, rows, **kwargs)`` holding a seeded random soup.
+
+    About ``density`` of the cells are set, each to a random non-dead state
+    of the ``rule`` passed on (just alive under the default rule).
+    """
+
+    def make(cols:int, rows:int, seed:int, density:float = 0.4, **kwargs) -> Simulation:
+        sim = Simulation(cols, rows, **kwargs)
+        states = sim.getRule().getStates()
+        rng = random.Random(seed)
+        for y in range(rows):
+            for x in range(cols):
+                if rng.random() < density:
+                    sim.setState(x, y, rng.randrange(1, states))
+        return sim
+
+    return make
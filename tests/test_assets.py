@@ -0,0 +1,7 @@
+from gameoflife.assets import getImage
+
+
+class TestAssets:
+    def testImageLoadedOnce(self):
+        image = getImage("images/gameoflife.png")
+        assert getImage("images/gameoflife.png") is image
@@ -86,11 +86,6 @@ class TestBaseButton:
         with pytest.raises(NotImplementedError):
             button.clicked(0, 0)
 
-    def test_unimplementedUpdateRaises(self):
-        button = self.getButton()
-        with pytest.raises(NotImplementedError):
-            button.update()
-
 
 class TestCircleButton:
     circleButtonText : str = "X"
@@ -0,0 +1,52 @@
+from gameoflife.census import CensusIndex, census, components, loadIndex, shapeKey
+from gameoflife.topology import Topology
+
+GLIDER = ["010", "001", "111"]
+BLINKER = ["111"]
+
+
+def _seeds(cols:int, rows:int, placements):
+    """The live cells of each ``(seed, x, y)`` placement, wrapped onto the board."""
+    return [
+        ((ox + x) % cols, (oy + y) % rows)
+        for (seed, ox, oy) in placements
+        for (y, line) in enumerate(seed)
+        for (x, char) in enumerate(line)
+        if char == "1"
+    ]
+
+
+class TestCensus:
+    def testShapeKeyIgnoresPosition(self):
+        assert shapeKey([(5, 5), (6, 5)]) == shapeKey([(0, 9), (1, 9)])
+        assert shapeKey([(0, 0), (1, 0)]) != shapeKey([(0, 0), (0, 1)])
+
+    def testIndexCoversRotationsAndPhases(self, aliveBoard):
+        index = CensusIndex()
+        index.add("glider", "spaceships", GLIDER, period=4)
+        index.add("blinker", "oscillators", BLINKER, period=2)
+        sim = aliveBoard(12, 12, _seeds(12, 12, [(GLIDER, 2, 2)]))
+        for _ in range(4):
+            points = [(pos % 12, pos // 12) for pos in range(144) if sim.getCells()[pos]]
+            assert index.lookup(points) == "glider"
+            assert index.lookup([(-x, y) for (x, y) in points]) == "glider"
+            assert index.lookup([(y, x) for (x, y) in points]) == "glider"
+            sim.step()
+        assert index.lookup([(0, 0), (0, 1), (0, 2)]) == "blinker"
+        assert index.getCategory("glider") == "spaceships"
+
+    def testComponentsWrapAroundTorus(self, aliveBoard):
+        sim = aliveBoard(10, 10, _seeds(10, 10, [(BLINKER, 9, 4)]), topology=Topology.TORUS)
+        groups = components(sim.getCells(), 10, 10, Topology.TORUS)
+        assert len(groups) == 1
+        assert shapeKey(groups[0]) == (3, 1, 0b111)
+
+    def testCensusOfLibrary(self, aliveBoard):
+        index = loadIndex()
+        assert loadIndex() is index
+        placements = [(BLINKER, 2, 2), (["11", "11"], 10, 10), (GLIDER, 20, 20), (["1"], 35, 35)]
+        sim = aliveBoard(40, 40, _seeds(40, 40, placements))
+        result = census(sim.getCells(), 40, 40, index)
+        assert result.getCounts() == {"blinker": 1, "block": 1, "glider": 1, "unknown": 1}
+        assert result.getUnknown() == [["1"]]
+        assert result.total() == 4
@@ -1,3 +1,4 @@
+import pytest
 
 from gameoflife.config import Config
 
@@ -10,4 +11,11 @@ def testConfig():
     assert conf.get('cell.height') == 10
     assert conf.get('fps') == 30
     assert conf.get('fps', default=60) == 30
-    assert conf.get('doesntexist', default=True) == True
\ No newline at end of file
+    assert conf.get('doesntexist', default=True) == True
+
+
+def testConfigMissingKey():
+    conf = Config()
+    assert conf.get('screen.width.px', default=5) == 5
+    with pytest.raises(KeyError):
+        conf.get('screen.depth')
@@ -0,0 +1,118 @@
+from gameoflife.cell import CellState
+from gameoflife.cycle import BoardHash, CycleDetector, CycleType
+from gameoflife.engine import EngineName
+from gameoflife.rule import Rule
+from gameoflife.simulation import Simulation
+
+
+def _step(cells:bytearray, cols:int, rows:int):
+    births, deaths = [], []
+    for y in range(rows):
+        for x in range(cols):
+            alive = 0
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    nx, ny = x + dx, y + dy
+                    if (dx or dy) and 0 <= nx < cols and 0 <= ny < rows:
+                        alive += cells[ny * cols + nx]
+            pos = y * cols + x
+            if cells[pos] and (alive < 2 or alive > 3):
+                deaths.append(pos)
+            elif not cells[pos] and alive == 3:
+                births.append(pos)
+    for pos in births:
+        cells[pos] = 1
+    for pos in deaths:
+        cells[pos] = 0
+    return births, deaths
+
+
+def _detect(cells:bytearray, cols:int, rows:int, generations:int):
+    detector = CycleDetector(cols, rows)
+    detector.reset(0, bytes(cells))
+    for generation in range(1, generations + 1):
+        births, deaths = _step(cells, cols, rows)
+        cycle = detector.update(generation, births, deaths)
+        if cycle:
+            return cycle
+    return None
+
+
+class TestCycle:
+    def testBlockIsStill(self, aliveBoard):
+        cycle = _detect(aliveBoard(6, 6, [(2, 2), (3, 2), (2, 3), (3, 3)]).getCells(), 6, 6, 5)
+        assert cycle.getType() == CycleType.STILL
+        assert cycle.getPeriod() == 1
+        assert cycle.getGeneration() == 1
+
+    def testBlinkerOscillates(self, aliveBoard):
+        cycle = _detect(aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)]).getCells(), 5, 5, 5)
+        assert cycle.getType() == CycleType.OSCILLATOR
+        assert cycle.getPeriod() == 2
+
+    def testGliderIsSpaceship(self, aliveBoard):
+        cycle = _detect(aliveBoard(12, 12, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]).getCells(), 12, 12, 8)
+        assert cycle.getType() == CycleType.SPACESHIP
+        assert cycle.getPeriod() == 4
+        assert cycle.getDisplacement() == (1, 1)
+
+    def testExtinct(self, aliveBoard):
+        cycle = _detect(aliveBoard(4, 4, [(1, 1)]).getCells(), 4, 4, 2)
+        assert cycle.getType() == CycleType.EXTINCT
+
+    def testSkipUsesPeriod(self, aliveBoard):
+        cells = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)]).getCells()
+        detector = CycleDetector(5, 5)
+        detector.reset(0, bytes(cells))
+        for generation in (1, 2):
+            detector.update(generation, *_step(cells, 5, 5))
+        assert detector.skip(2, 1001) == 1
+        assert detector.skip(2, 1000) == 0
+
+    def testIncrementalHashMatchesRebuild(self, aliveBoard):
+        cells = aliveBoard(10, 10, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]).getCells()
+        incremental = BoardHash(10, 10)
+        incremental.reset(bytes(cells))
+        for _ in range(6):
+            incremental.update(*_step(cells, 10, 10))
+        rebuilt = BoardHash(10, 10)
+        rebuilt.reset(bytes(cells))
+        assert incremental.value() == rebuilt.value()
+        assert incremental.normalized() == rebuilt.normalized()
+        assert incremental.origin() == rebuilt.origin()
+
+    def testDyingCellsChangeTheHash(self, aliveBoard):
+        cells = aliveBoard(6, 6, [(2, 2), (3, 2)]).getCells()
+        withDying = bytearray(cells)
+        withDying[4 * 6 + 4] = 2
+        older = bytearray(cells)
+        older[4 * 6 + 4] = 3
+        hashes = []
+        for board in (cells, withDying, older):
+            boardHash = BoardHash(6, 6)
+            boardHash.reset(bytes(board), states=4)
+            hashes.append((boardHash.value(), boardHash.normalized()))
+        assert len({value for (value, _) in hashes}) == 3
+        assert len({normalized for (_, normalized) in hashes}) == 3
+
+    def testIncrementalHashMatchesRebuildWithDyingCells(self):
+        sim = Simulation(12, 12, rule=Rule.parse("B2/S/C4"), engine=EngineName.ROWS)
+        for (x, y) in [(4, 5), (5, 5), (5, 6), (7, 4)]:
+            sim.setState(x, y, CellState.ALIVE)
+        incremental = BoardHash(12, 12)
+        incremental.reset(bytes(sim.getCells()), states=4)
+        for _ in range(6):
+            incremental.update(*sim.step())
+        rebuilt = BoardHash(12, 12)
+        rebuilt.reset(bytes(sim.getCells()), states=4)
+        assert incremental.dying() == rebuilt.dying() > 0
+        assert incremental.value() == rebuilt.value()
+        assert incremental.normalized() == rebuilt.normalized()
+
+    def testExtinctWaitsForDyingCells(self):
+        sim = Simulation(6, 6, cycleDetector=CycleDetector(6, 6), rule=Rule.parse("B/S/C4"))
+        sim.setState(2, 2, CellState.ALIVE)
+        sim.step()
+        assert sim.cycle() is None
+        sim.run(2)
+        assert sim.cycle().getType() == CycleType.EXTINCT
@@ -0,0 +1,106 @@
+import pygame
+
+from pygame.locals import KEYDOWN, MOUSEBUTTONDOWN
+from pygame.rect import Rect
+
+from gameoflife.dispatcher import InputDispatcher, SpatialIndex
+
+
+class _Widget:
+    def __init__(self, rect: Rect, enabled: bool = True) -> None:
+        self._rect = rect
+        self._enabled = enabled
+        self.hovers = []
+        self.events = []
+
+    def getRect(self) -> Rect:
+        return self._rect
+
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def hover(self, pos) -> None:
+        self.hovers.append(pos)
+
+    def getCursor(self) -> int:
+        return pygame.SYSTEM_CURSOR_HAND
+
+    def eventHandler(self, event) -> bool:
+        self.events.append(event)
+        return True
+
+
+class TestSpatialIndex:
+    def testQuery(self):
+        index = SpatialIndex(cellSize=16)
+        index.insert("low", Rect(0, 0, 100, 100), 1)
+        index.insert("high", Rect(40, 40, 10, 10), 2)
+        assert index.query((45, 45)) == ["high", "low"]
+        assert index.query((5, 5)) == ["low"]
+        assert index.query((150, 5)) == []
+
+
+class TestInputDispatcher:
+    def testDispatchHitsTopmostWidget(self):
+        dispatcher = InputDispatcher()
+        below = _Widget(Rect(0, 0, 100, 100))
+        above = _Widget(Rect(10, 10, 20, 20))
+        dispatcher.add(below)
+        dispatcher.add(above)
+        event = pygame.event.Event(MOUSEBUTTONDOWN, button=1, pos=(15, 15))
+        assert dispatcher.dispatch(event) == (above, True)
+        assert below.events == []
+        assert dispatcher.dispatch(pygame.event.Event(KEYDOWN, key=0)) == (None, None)
+        assert dispatcher.dispatch(pygame.event.Event(MOUSEBUTTONDOWN, button=1, pos=(200, 200))) == (None, None)
+
+    def testDisabledWidgetsAreSkipped(self):
+        dispatcher = InputDispatcher()
+        below = _Widget(Rect(0, 0, 100, 100))
+        menu = _Widget(Rect(0, 0, 50, 50), enabled=False)
+        dispatcher.add(below)
+        dispatcher.add(menu)
+        assert dispatcher.hit((10, 10)) is below
+        menu._enabled = True
+        assert dispatcher.hit((10, 10)) is menu
+
+    def testHoverAndCursorTransitions(self, monkeypatch):
+        cursors = []
+        monkeypatch.setattr(pygame.mouse, "set_cursor", lambda cursor: cursors.append(cursor))
+        dispatcher = InputDispatcher()
+        widget = _Widget(Rect(0, 0, 10, 10))
+        dispatcher.add(widget)
+        for pos in [(50, 50), (5, 5), (5, 5), (6, 5), (50, 50), (60, 60)]:
+            dispatcher._pos = pos
+            dispatcher.update()
+        assert widget.hovers == [(5, 5), (6, 5), None]
+        assert cursors == [pygame.SYSTEM_CURSOR_HAND, pygame.SYSTEM_CURSOR_ARROW]
+        assert dispatcher.getHovered() is None
+
+    def testRebuildAfterMove(self):
+        dispatcher = InputDispatcher()
+        widget = _Widget(Rect(0, 0, 10, 10))
+        dispatcher.add(widget)
+        widget._rect = Rect(100, 100, 10, 10)
+        dispatcher.rebuild()
+        assert dispatcher.hit((5, 5)) is None
+        assert dispatcher.hit((105, 105)) is widget
+
+    def testInputModeHoverGoesThroughDispatcher(self, monkeypatch):
+        from gameoflife.event import EVENT_INPUT_MODE_DRAW, EVENT_INPUT_MODE_PAN
+        from gameoflife.input import InputMode, InputModeManager
+
+        pygame.init()
+        # Any direct poll of the mouse would bypass the sampled position.
+        monkeypatch.setattr(pygame.mouse, "get_pos", lambda: (0, 0))
+        modes = InputModeManager(btnStartX=100, btnStartY=100)
+        modes.addMode(InputMode.DRAW, EVENT_INPUT_MODE_DRAW, imagePath="images/draw.png", active=True)
+        modes.addMode(InputMode.PAN, EVENT_INPUT_MODE_PAN, imagePath="images/pan.png")
+        dispatcher = InputDispatcher()
+        dispatcher.add(modes)
+        dispatcher._pos = (modes.getRect().x + 15, 115)
+        dispatcher.update()
+        assert dispatcher.getHovered() is modes
+        assert modes.getCursor() == pygame.SYSTEM_CURSOR_HAND
+        dispatcher._pos = (5, 5)
+        dispatcher.update()
+        assert modes.getCursor() == pygame.SYSTEM_CURSOR_ARROW
@@ -0,0 +1,205 @@
+from gameoflife.cell import CellState
+from gameoflife.engine import AutoEngine, CountEngine, EngineName, RowEngine, SparseEngine, createEngine
+from gameoflife.rule import Rule
+from gameoflife.simulation import Simulation
+from gameoflife.topology import Topology
+
+import pytest
+import random
+
+
+class TestSparseEngine:
+    def testMatchesRowEngine(self, soupBoard):
+        for name in ("B3/S23", "B36/S23", "B2/S/C3", "B2/S345/C4"):
+            rule = Rule.parse(name)
+            for topology in Topology.ALL:
+                cells = soupBoard(13, 9, 7, density=0.3, rule=rule).getCells()
+                expected = bytearray(cells)
+                (rows, sparse) = (RowEngine(), SparseEngine())
+                for _ in range(8):
+                    want = rows.step(expected, 13, 9, rule, topology)
+                    got = sparse.step(cells, 13, 9, rule, topology)
+                    assert cells == expected, (name, topology)
+                    assert got == want, (name, topology)
+
+    def testResetPicksUpEdits(self):
+        rule = Rule.parse("B3/S23")
+        cells = bytearray(25)
+        engine = SparseEngine()
+        engine.step(cells, 5, 5, rule, Topology.DEAD)
+        for pos in (11, 12, 13):
+            cells[pos] = CellState.ALIVE
+        engine.reset()
+        (births, deaths) = engine.step(cells, 5, 5, rule, Topology.DEAD)
+        assert (births, deaths) == ([7, 17], [11, 13])
+
+    def testRejectsBirthOnZero(self):
+        engine = SparseEngine()
+        rule = Rule.parse("B0/S8")
+        assert not engine.supports(rule)
+        with pytest.raises(ValueError):
+            engine.step(bytearray(9), 3, 3, rule, Topology.DEAD)
+
+
+class TestCountEngine:
+    def testMatchesRowEngine(self, soupBoard):
+        for name in ("B3/S23", "B36/S23", "B0/S8", "B2/S/C3", "B2/S345/C4"):
+            rule = Rule.parse(name)
+            for topology in Topology.ALL:
+                cells = soupBoard(13, 9, 3, density=0.3, rule=rule).getCells()
+                expected = bytearray(cells)
+                (rows, counts) = (RowEngine(), CountEngine())
+                for _ in range(10):
+                    want = rows.step(expected, 13, 9, rule, topology)
+                    got = counts.step(cells, 13, 9, rule, topology)
+                    assert cells == expected, (name, topology)
+                    assert got == want, (name, topology)
+
+    def testOnlyLooksAtChanges(self):
+        # A block never changes, so once it has been looked at only the
+        # blinker and the cells around it are candidates.
+        rule = Rule.parse("B3/S23")
+        cells = bytearray(400)
+        for pos in (22, 23, 42, 43, 250, 251, 252):
+            cells[pos] = CellState.ALIVE
+        engine = CountEngine()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        (births, deaths) = engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert (births, deaths) == ([250, 252], [231, 271])
+        assert not {21, 22, 23, 42, 43} & engine.getCandidates()
+
+    def testResetPicksUpEdits(self):
+        rule = Rule.parse("B3/S23")
+        cells = bytearray(25)
+        engine = CountEngine()
+        engine.step(cells, 5, 5, rule, Topology.DEAD)
+        for pos in (11, 12, 13):
+            cells[pos] = CellState.ALIVE
+        engine.reset()
+        assert engine.step(cells, 5, 5, rule, Topology.DEAD) == ([7, 17], [11, 13])
+
+
+class TestArrayEngine:
+    def testMatchesRowEngine(self, soupBoard):
+        pytest.importorskip("numpy")
+        from gameoflife.arrayengine import ArrayEngine
+
+        for useNumba in (False, True):
+            for name in ("B3/S23", "B0/S8", "B2/S/C3", "B2/S345/C4"):
+                rule = Rule.parse(name)
+                for topology in Topology.ALL:
+                    cells = soupBoard(13, 9, 5, density=0.4, rule=rule).getCells()
+                    expected = bytearray(cells)
+                    (rows, array) = (RowEngine(), ArrayEngine(useNumba))
+                    for _ in range(8):
+                        want = rows.step(expected, 13, 9, rule, topology)
+                        got = array.step(cells, 13, 9, rule, topology)
+                        assert cells == expected, (array.describe(), name, topology)
+                        assert got == want, (array.describe(), name, topology)
+
+    def testSwitchingTopologyOnOneEngine(self, soupBoard):
+        pytest.importorskip("numpy")
+        from gameoflife.arrayengine import ArrayEngine
+
+        rule = Rule.parse("B3/S23")
+        for useNumba in (False, True):
+            cells = soupBoard(13, 9, 5, density=0.4).getCells()
+            expected = bytearray(cells)
+            (rows, array) = (RowEngine(), ArrayEngine(useNumba))
+            for topology in (Topology.TORUS, Topology.DEAD, Topology.KLEIN, Topology.DEAD):
+                for _ in range(3):
+                    want = rows.step(expected, 13, 9, rule, topology)
+                    got = array.step(cells, 13, 9, rule, topology)
+                    assert cells == expected, (array.describe(), topology)
+                    assert got == want, (array.describe(), topology)
+
+
+class TestAutoEngine:
+    def testSwitchesWithHysteresis(self, soupBoard):
+        rule = Rule.parse("B3/S23")
+        lines = []
+        engine = AutoEngine(sparseBelow=0.05, denseAbove=0.2, interval=1, cooldown=1, log=lines.append)
+        cells = bytearray(400)
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.SPARSE
+
+        # A density between the two thresholds keeps the current engine.
+        cells[:] = soupBoard(20, 20, 1, density=0.1).getCells()
+        engine.reset()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.SPARSE
+
+        cells[:] = soupBoard(20, 20, 1, density=0.5).getCells()
+        engine.reset()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.ROWS
+
+        cells[:] = soupBoard(20, 20, 1, density=0.1).getCells()
+        engine.reset()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.ROWS
+
+        cells[:] = bytearray(400)
+        engine.reset()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.SPARSE
+
+        switches = engine.getSwitches()
+        assert [(s.getOld(), s.getNew()) for s in switches] == [("sparse", "rows"), ("rows", "sparse")]
+        assert switches[0].getDensity() > 0.2
+        assert len(lines) == 2 and "sparse -> rows" in lines[0]
+
+    def testCooldown(self, soupBoard):
+        rule = Rule.parse("B3/S23")
+        engine = AutoEngine(interval=1, cooldown=10)
+        cells = soupBoard(20, 20, 2, density=0.5).getCells()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.ROWS
+        cells[:] = bytearray(400)
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.SPARSE
+
+        cells[:] = soupBoard(20, 20, 2, density=0.5).getCells()
+        for _ in range(9):
+            engine.step(cells, 20, 20, rule, Topology.DEAD)
+            assert engine.getEngine().NAME == EngineName.SPARSE
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine().NAME == EngineName.ROWS
+
+    def testDenseEngineCreatedOnDemand(self, soupBoard):
+        created = []
+
+        def dense():
+            created.append(RowEngine())
+            return created[-1]
+
+        rule = Rule.parse("B3/S23")
+        engine = AutoEngine(interval=1, cooldown=1, dense=dense)
+        cells = bytearray(400)
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert created == []
+        cells[:] = soupBoard(20, 20, 3, density=0.5).getCells()
+        engine.step(cells, 20, 20, rule, Topology.DEAD)
+        assert engine.getEngine() is created[0]
+        assert engine.describe() == "auto/rows"
+
+    def testSimulationMatchesAcrossEngines(self):
+        rule = Rule.parse("B36/S23")
+        sims = [Simulation(30, 30, rule=rule, topology=Topology.TORUS, engine=name) for name in ("rows", "sparse", "counts", "auto")]
+        rng = random.Random(4)
+        points = [(rng.randrange(10), rng.randrange(10)) for _ in range(40)]
+        for sim in sims:
+            for (x, y) in points:
+                sim.setState(x, y, CellState.ALIVE)
+        for generation in range(60):
+            for sim in sims:
+                sim.step()
+            if generation == 30:
+                for sim in sims:
+                    sim.setState(20, 20, CellState.ALIVE)
+            assert all(sim.getCells() == sims[0].getCells() for sim in sims)
+            assert all(sim.getPopulation() == sims[0].getPopulation() for sim in sims)
+
+    def testUnknownEngine(self):
+        with pytest.raises(ValueError):
+            createEngine("gpu")
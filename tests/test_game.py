@@ -1,3 +1,8 @@
+import os
+
+from gameoflife.cell import CellState
+
+
 # TODO
 class TestGame:
     def test_initCells():
@@ -10,4 +15,57 @@ class TestGame:
         pass
 
     def test_initPatterns():
-        pass
\ No newline at end of file
+        pass
+
+class TestRender:
+    def testRuleChangeWithCameraMidCell(self):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        from gameoflife.game import Game
+
+        game = Game()
+        (cellW, cellH) = (game._cellW, game._cellH)
+        game._cameraPx = [10.5 * cellW, 10.5 * cellH]
+        game.draw()
+        game.setRule("B2/S345/C5")
+        for y in range(10, 30):
+            for x in range(10, 30):
+                game._sim.setState(x, y, (x + y) % 5)
+        game.draw()
+        _assertView(game, 20 * cellW, 20 * cellH)
+
+    def testTiledBoardDrawsTheViewport(self, tmp_path):
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        from gameoflife.game import Game
+
+        game = Game()
+        assert game.initTiles(str(tmp_path / "board"))
+        assert game.tiled()
+        (cellW, cellH) = (game._cellW, game._cellH)
+        (cols, rows) = (game._sim.getCols(), game._sim.getRows())
+        game._cameraPx = [(cols // 2 + 0.5) * cellW, (rows // 2 + 0.5) * cellH]
+        (left, top) = (cols // 2, rows // 2)
+        for (x, y) in ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2), (30, 20), (31, 20), (32, 20)):
+            game._sim.setState(left + x, top + y, CellState.ALIVE)
+        game.draw()
+        _assertView(game, 40 * cellW, 30 * cellH)
+
+        game.step()
+        game.moveCamera(3 * cellW + 2, cellH)
+        game.draw()
+        assert game._sim.getGeneration() == 1
+        _assertView(game, 40 * cellW, 30 * cellH)
+        # Panning a still board scrolls the last frame.
+        game.moveCamera(-cellW - 3, -2 * cellH)
+        game.draw()
+        _assertView(game, 40 * cellW, 30 * cellH)
+        game._sim.close()
+
+
+def _assertView(game, width:int, height:int) -> None:
+    view = game._viewSurf
+    (cellW, cellH) = (game._cellW, game._cellH)
+    (cameraX, cameraY) = (int(game._cameraPx[0]), int(game._cameraPx[1]))
+    for py in range(0, height, 3):
+        for px in range(0, width, 3):
+            state = game._sim.getState((px + cameraX) // cellW, (py + cameraY) // cellH)
+            assert view.get_at_mapped((px, py)) == state, (px, py)
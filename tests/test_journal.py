@@ -0,0 +1,99 @@
+from gameoflife.cell import CellState
+from gameoflife.journal import JournalReader, JournalWriter
+from gameoflife.rule import Rule
+from gameoflife.simulation import Simulation
+
+import os
+import pytest
+
+
+def _journal(path:str, sim:Simulation, generations:int, **kwargs) -> dict:
+    """Journal ``generations`` of ``sim`` and return the boards it went through."""
+    boards = {}
+    journal = JournalWriter(path, sim.getCols(), sim.getRows(), **kwargs)
+    for delta in sim.iterGenerations(generations):
+        journal.record(delta, sim)
+        boards[sim.getGeneration()] = bytes(sim.getCells())
+    stats = journal.close()
+    assert stats["error"] is None
+    return boards
+
+
+class TestJournal:
+    def testRandomAccess(self, tmp_path, soupBoard):
+        path = str(tmp_path / "run.golj")
+        boards = _journal(path, soupBoard(20, 20, 1, density=0.35), 100, keyframeInterval=16, chunkGenerations=5)
+        with JournalReader(path) as reader:
+            assert (reader.firstGeneration(), reader.lastGeneration()) == (1, 100)
+            for generation in (1, 2, 16, 17, 50, 99, 100):
+                snapshot = reader.snapshotAt(generation)
+                assert snapshot.getGeneration() == generation
+                assert snapshot.getCells() == boards[generation]
+            with pytest.raises(ValueError):
+                reader.snapshotAt(101)
+
+    def testIterDeltasReplays(self, tmp_path, soupBoard):
+        path = str(tmp_path / "run.golj")
+        boards = _journal(path, soupBoard(16, 16, 2, density=0.35), 40, keyframeInterval=8, chunkGenerations=3)
+        with JournalReader(path) as reader:
+            cells = None
+            for delta in reader.iterDeltas():
+                if delta.isEdited():
+                    cells = bytearray(reader.snapshotAt(delta.getGeneration()).getCells())
+                    continue
+                for pos in delta.getBirths():
+                    cells[pos] = CellState.ALIVE
+                for pos in delta.getDeaths():
+                    cells[pos] = CellState.DEAD
+                assert cells == boards[delta.getGeneration()]
+
+    def testEditsAndMultiStateRule(self, tmp_path, soupBoard):
+        path = str(tmp_path / "run.golj")
+        sim = soupBoard(16, 16, 3, density=0.35, rule=Rule.parse("B2/S345/C4"))
+        journal = JournalWriter(path, 16, 16, keyframeInterval=10, chunkGenerations=4)
+        boards = {}
+        for delta in sim.iterGenerations(30):
+            journal.record(delta, sim)
+            boards[sim.getGeneration()] = bytes(sim.getCells())
+            if sim.getGeneration() == 12:
+                sim.setState(0, 0, CellState.ALIVE)
+        journal.close()
+        with JournalReader(path) as reader:
+            for generation in range(1, 31):
+                assert reader.snapshotAt(generation).getCells() == boards[generation], generation
+
+    def testReadsUnclosedJournal(self, tmp_path, soupBoard):
+        path = str(tmp_path / "run.golj")
+        boards = _journal(path, soupBoard(20, 20, 4, density=0.35), 30, keyframeInterval=10, chunkGenerations=4)
+        with JournalReader(path) as reader:
+            index = reader.getIndex()
+            end = reader.getDataEnd()
+        # Drop the index and tear the last chunk, as a killed writer would.
+        (lastOffset, size) = (index[-1][3], end - index[-1][3])
+        with open(path, "r+b") as file:
+            file.truncate(lastOffset + size // 2)
+        with JournalReader(path) as reader:
+            assert reader.getIndex() == index[:-1]
+            last = reader.lastGeneration()
+            assert last < 30
+            assert reader.snapshotAt(last).getCells() == boards[last]
+
+    def testAppendResumes(self, tmp_path, soupBoard):
+        path = str(tmp_path / "run.golj")
+        boards = _journal(path, soupBoard(20, 20, 5, density=0.35), 25, keyframeInterval=8, chunkGenerations=4)
+        with JournalReader(path) as reader:
+            snapshot = reader.snapshotAt(reader.lastGeneration())
+        sim = Simulation(20, 20)
+        sim.restore(snapshot)
+        boards.update(_journal(path, sim, 25, keyframeInterval=8, chunkGenerations=4, append=True))
+        with JournalReader(path) as reader:
+            assert reader.lastGeneration() == 50
+            for generation in (3, 25, 26, 40, 50):
+                assert reader.snapshotAt(generation).getCells() == boards[generation]
+
+    def testRejectsOtherFiles(self, tmp_path):
+        path = str(tmp_path / "run.golj")
+        with open(path, "wb") as file:
+            file.write(os.urandom(64))
+        with pytest.raises(ValueError):
+            JournalReader(path)
@@ -0,0 +1,47 @@
+from gameoflife.cell import CellState
+from gameoflife.jump import Jump
+from gameoflife.save import BoardSnapshot
+
+import pytest
+
+
+class TestJump:
+    def testReachesTarget(self, soupBoard):
+        sim = soupBoard(24, 24, 1)
+        jump = Jump(sim.snapshot(), 40)
+        jump.start()
+        assert jump.join(10)
+        sim.run(40)
+        result = jump.result()
+        assert result.getGeneration() == 40
+        assert result.getCells() == bytes(sim.getCells())
+        assert jump.getGeneration() == 40
+        assert jump.fraction() == 1.0
+        assert jump.getRate() > 0
+
+    def testSkipsSettledBoard(self):
+        # A blinker repeats every other generation, so the jump only has to
+        # find the cycle and then lands on the right phase.
+        cells = bytearray(25)
+        for pos in (11, 12, 13):
+            cells[pos] = CellState.ALIVE
+        jump = Jump(BoardSnapshot(5, 5, 0, bytes(cells)), 10 ** 9 + 1)
+        jump.start()
+        assert jump.join(10)
+        result = jump.result()
+        assert result.getGeneration() == 10 ** 9 + 1
+        assert [pos for pos in range(25) if result.getCells()[pos]] == [7, 12, 17]
+
+    def testCancel(self, soupBoard):
+        sim = soupBoard(64, 64, 2)
+        jump = Jump(sim.snapshot(), 10 ** 9, sampleInterval=0.01)
+        jump.start()
+        jump.cancel()
+        assert jump.join(10)
+        assert jump.cancelled()
+        assert jump.result() is None
+        assert jump.getGeneration() < 10 ** 9
+
+    def testRejectsEarlierTarget(self):
+        with pytest.raises(ValueError):
+            Jump(BoardSnapshot(3, 3, 5, bytes(9)), 4)
@@ -0,0 +1,56 @@
+import io
+import json
+
+from gameoflife.metrics import Metrics, percentile
+
+
+class TestMetrics:
+    def testDisabledTimerRecordsNothing(self):
+        metrics = Metrics(enabled=False)
+        with metrics.timer("step"):
+            pass
+        metrics.endFrame()
+        assert metrics.names() == []
+
+    def testTimerRecordsSamples(self):
+        metrics = Metrics(enabled=True, window=3)
+        for _ in range(5):
+            with metrics.timer("step"):
+                pass
+            metrics.endFrame()
+        summary = metrics.summary("step")
+        assert summary["count"] == 3
+        assert summary["p50"] <= summary["p99"] <= summary["max"]
+
+    def testPercentile(self):
+        samples = [float(i) for i in range(101)]
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def testPhasesAreOrdered(self):
+        metrics = Metrics(enabled=True)
+        for name in ("flip", "custom", "events", "step"):
+            metrics.record(name, 0.001)
+        assert metrics.names() == ["events", "step", "flip", "custom"]
+
+    def testExportJsonLines(self):
+        metrics = Metrics(enabled=True)
+        metrics.record("render", 0.002)
+        metrics.record("render", 0.004)
+        out = io.StringIO()
+        metrics.exportJsonLines(out)
+        line = json.loads(out.getvalue().splitlines()[0])
+        assert line["phase"] == "render"
+        assert line["count"] == 2
+        assert line["max"] == 4.0
+
+    def testFrameLog(self, tmp_path):
+        path = tmp_path / "frames.jsonl"
+        metrics = Metrics(enabled=True, log=str(path))
+        metrics.record("step", 0.001)
+        metrics.endFrame()
+        metrics.close()
+        line = json.loads(path.read_text().splitlines()[0])
+        assert line["frame"] == 1
+        assert line["step"] == 1.0
@@ -1,3 +1,42 @@
-#TODO
+import json
+
+from gameoflife.cell import CellState
+from gameoflife.pattern import Pattern, PatternType
+
+
+def _pattern(tmp_path, seed, **data) -> Pattern:
+    path = tmp_path / "pattern.json"
+    path.write_text(json.dumps(dict(name="test", seed=seed, **data)))
+    return Pattern("test", str(path), PatternType.Oscillator)
+
+
 class TestPattern:
-    pass
\ No newline at end of file
+    def testBitmap(self, tmp_path):
+        pattern = _pattern(tmp_path, ["010", "001", "111"])
+        assert (pattern.getCols(), pattern.getRows()) == (3, 3)
+        assert pattern.getPoints() == [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+        assert pattern.getState(2, 1) == CellState.ALIVE
+        assert pattern.getState(0, 0) == CellState.DEAD
+        assert pattern.getState(5, 0) == CellState.DEAD
+
+    def testRaggedRows(self, tmp_path):
+        pattern = _pattern(tmp_path, ["1", "011"], rule="B36/S23")
+        assert pattern.getCols() == 3
+        assert pattern.getPoints() == [(0, 0), (1, 1), (2, 1)]
+        assert pattern.getRule() == "B36/S23"
+
+    def testSurfaceCached(self, tmp_path):
+        pattern = _pattern(tmp_path, ["11", "11"])
+        surface = pattern.getSurface()
+        assert surface.get_size() == (20, 20)
+        assert pattern.getSurface() is surface
+        pattern.setCellWidth(4)
+        pattern.setCellHeight(3)
+        assert pattern.getSurface().get_size() == (8, 6)
+        assert pattern.getHeight() == 6
+        assert pattern.getWidth() == 8
+
+    def testMissingFile(self, tmp_path):
+        pattern = Pattern("missing", str(tmp_path / "missing.json"), PatternType.StillLife)
+        assert pattern.getRows() == 0
+        assert pattern.getPoints() == []
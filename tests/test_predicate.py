@@ -0,0 +1,71 @@
+from gameoflife.cycle import CycleDetector
+from gameoflife.predicate import BoundsExceed, GenerationReached, PopulationAbove, PopulationBelow, RunResult, Stable
+from gameoflife.simulation import Simulation
+
+import pytest
+
+
+BLINKER = ((1, 2), (2, 2), (3, 2))
+GLIDER = ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2))
+
+
+class TestRunUntil:
+    def testPopulationBelow(self, aliveBoard):
+        # A lone pair dies of underpopulation on the first step.
+        sim = aliveBoard(5, 5, ((1, 1), (2, 1)))
+        result = sim.runUntil([PopulationBelow(1)], 10)
+        assert result.getReason() == "population below 1"
+        assert result.getGenerations() == 1
+        assert result.getPeakPopulation() == 2
+        assert result.getPopulation() == 0
+
+    def testPopulationAbove(self, aliveBoard):
+        sim = aliveBoard(5, 5, ((1, 1), (2, 1), (1, 2)))
+        result = sim.runUntil([PopulationAbove(3)], 10)
+        assert result.getReason() == "population above 3"
+        assert result.getPopulation() == 4
+
+    def testGenerationReached(self, aliveBoard):
+        sim = aliveBoard(10, 10, GLIDER)
+        result = sim.runUntil([GenerationReached(7)])
+        assert (result.getGeneration(), result.getGenerations()) == (7, 7)
+        assert sim.getGeneration() == 7
+
+    def testAlreadyTrueStepsNothing(self, aliveBoard):
+        sim = aliveBoard(5, 5, BLINKER)
+        result = sim.runUntil([PopulationAbove(2)])
+        assert result.getGenerations() == 0
+        assert sim.getGeneration() == 0
+
+    def testMaxGenerations(self, aliveBoard):
+        sim = aliveBoard(5, 5, BLINKER)
+        result = sim.runUntil([PopulationBelow(1)], 5)
+        assert result.getReason() == RunResult.MAX_GENERATIONS
+        assert result.getGenerations() == 5
+        assert result.toDict()["generation"] == 5
+
+    def testStable(self, aliveBoard):
+        sim = aliveBoard(5, 5, BLINKER, cycleDetector=CycleDetector(5, 5))
+        result = sim.runUntil([Stable()], 100)
+        assert result.getReason() == "stable"
+        assert sim.cycle().getPeriod() == 2
+        assert result.getGenerations() < 100
+
+    def testStableNeedsCycleDetector(self):
+        with pytest.raises(ValueError):
+            Simulation(5, 5).runUntil([Stable()])
+
+    def testBoundsExceed(self, aliveBoard):
+        # A glider always fits in a 3x3 box, however far it travels.
+        sim = aliveBoard(40, 40, GLIDER)
+        result = sim.runUntil([BoundsExceed(3)], 60)
+        assert result.getReason() == RunResult.MAX_GENERATIONS
+        # With a block left behind the box grows as the glider moves off.
+        sim = aliveBoard(40, 40, GLIDER + ((0, 30), (1, 30), (0, 31), (1, 31)))
+        result = sim.runUntil([BoundsExceed(10, 40)], 100)
+        assert result.getReason() == "bounding box over 10x40"
+        assert 20 < result.getGeneration() < 40
+
+    def testNeedsPredicateOrLimit(self):
+        with pytest.raises(ValueError):
+            Simulation(5, 5).runUntil([])
@@ -0,0 +1,32 @@
+import os
+
+from gameoflife.cell import CellState
+from gameoflife.profiler import ProfileCapture
+from gameoflife.simulation import Simulation
+
+
+class TestProfiler:
+    def testSimulationProfileByGenerations(self, tmp_path):
+        sim = Simulation(20, 20)
+        for (x, y) in [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]:
+            sim.setState(x, y, CellState.ALIVE)
+        path = sim.profile(generations=5, directory=str(tmp_path))
+
+        assert sim.getGeneration() == 5
+        for name in ("profile.prof", "summary.txt", "memory.txt"):
+            assert os.path.exists(os.path.join(path, name))
+        with open(os.path.join(path, "summary.txt")) as file:
+            summary = file.read()
+        assert "5 generations" in summary
+        assert "Simulation.step" in summary
+        assert "engine: auto/" in summary
+
+    def testCaptureStopsEarly(self, tmp_path):
+        capture = ProfileCapture(str(tmp_path), seconds=60)
+        capture.start()
+        assert capture.active()
+        assert not capture.tick()
+        path = capture.stop()
+        assert not capture.active()
+        assert capture.tick()
+        assert os.path.isdir(path)
@@ -0,0 +1,94 @@
+import struct
+import threading
+import zlib
+
+from gameoflife.recorder import Recorder, RecordFormat, _lzwEncode, encodePng, scaleCells
+
+
+def _lzwDecode(data: bytes, minCodeSize: int) -> bytes:
+    clearCode = 1 << minCodeSize
+    endCode = clearCode + 1
+    bits = int.from_bytes(data, "little")
+    pos = 0
+    codeSize = minCodeSize + 1
+    table = []
+    prev = None
+    out = bytearray()
+    while True:
+        code = (bits >> pos) & ((1 << codeSize) - 1)
+        pos += codeSize
+        if code == clearCode:
+            table = [bytes([i]) for i in range(clearCode)] + [b"", b""]
+            codeSize = minCodeSize + 1
+            prev = None
+            continue
+        if code == endCode:
+            return bytes(out)
+        if code < len(table):
+            entry = table[code]
+            if prev is not None:
+                table.append(prev + entry[:1])
+        else:
+            entry = prev + prev[:1]
+            table.append(entry)
+        out += entry
+        prev = entry
+        if len(table) == (1 << codeSize) and codeSize < 12:
+            codeSize += 1
+
+
+class TestRecorder:
+    def testScaleCells(self):
+        assert scaleCells(b"\x00\x01\x01\x00", 2, 2, 2) == (
+            b"\x00\x00\x01\x01" * 2 + b"\x01\x01\x00\x00" * 2
+        )
+
+    def testLzwRoundTrip(self):
+        pixels = bytes((i * 7 // 3) % 2 for i in range(20000))
+        assert _lzwDecode(_lzwEncode(pixels, 2), 2) == pixels
+
+    def testPngChunks(self):
+        data = encodePng(b"\x00\x01\x01\x00", 2, 2, [(255, 255, 255), (0, 0, 0)])
+        assert data.startswith(b"\x89PNG\r\n\x1a\n")
+        (width, height) = struct.unpack(">II", data[16:24])
+        assert (width, height) == (2, 2)
+        idat = data.index(b"IDAT")
+        size = struct.unpack(">I", data[idat - 4:idat])[0]
+        assert zlib.decompress(data[idat + 4:idat + 4 + size]) == b"\x00\x00\x01\x00\x01\x00"
+
+    def testGifFrames(self, tmp_path):
+        path = tmp_path / "run.gif"
+        recorder = Recorder(str(path), 4, 3, format=RecordFormat.GIF)
+        for _ in range(3):
+            assert recorder.capture(bytes(12))
+        stats = recorder.close()
+        data = path.read_bytes()
+        assert stats["frames"] == 3
+        assert data.startswith(b"GIF89a") and data.endswith(b"\x3B")
+        assert data.count(b"\x2C\x00\x00\x00\x00\x04\x00\x03\x00") == 3
+
+    def testRawFrames(self, tmp_path):
+        path = tmp_path / "run.rgb"
+        recorder = Recorder(str(path), 2, 1, format=RecordFormat.RAW, palette=[(1, 2, 3), (4, 5, 6)])
+        recorder.capture(b"\x00\x01")
+        recorder.close()
+        assert path.read_bytes() == bytes([1, 2, 3, 4, 5, 6])
+
+    def testPngSequence(self, tmp_path):
+        recorder = Recorder(str(tmp_path / "frames"), 2, 2, format=RecordFormat.PNG)
+        recorder.capture(bytes(4))
+        recorder.capture(bytes(4))
+        recorder.close()
+        assert sorted(p.name for p in (tmp_path / "frames").iterdir()) == ["frame-000001.png", "frame-000002.png"]
+
+    def testDropsWhenQueueIsFull(self, tmp_path, monkeypatch):
+        release = threading.Event()
+        recorder = Recorder(str(tmp_path / "run.rgb"), 2, 2, format=RecordFormat.RAW, maxQueue=2)
+        encode = recorder._encode
+        monkeypatch.setattr(recorder, "_encode", lambda sink, cells: release.wait() and encode(sink, cells))
+        accepted = sum(recorder.capture(bytes(4)) for _ in range(10))
+        release.set()
+        stats = recorder.close()
+        assert stats["dropped"] == 10 - accepted
+        assert stats["frames"] == accepted
+        assert stats["dropped"] >= 7
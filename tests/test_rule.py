@@ -0,0 +1,46 @@
+from gameoflife.cell import CellState
+from gameoflife.rule import CONWAY, Rule
+
+import pytest
+
+
+class TestRule:
+    def testParseConway(self):
+        rule = Rule.parse(CONWAY)
+        assert rule.getBirth() == {3}
+        assert rule.getSurvive() == {2, 3}
+        assert str(rule) == "B3/S23"
+
+    def testParseNotations(self):
+        assert Rule.parse("b36/s23") == Rule.parse("B36S23") == Rule.parse("23/36")
+        assert str(Rule.parse("B2/S")) == "B2/S"
+
+    def testParseIsCached(self):
+        assert Rule.parse("B36/S23") is Rule.parse("B36/S23")
+
+    def testInvalidRule(self):
+        with pytest.raises(ValueError):
+            Rule.parse("B9/S23")
+        with pytest.raises(ValueError):
+            Rule.parse("B3/S23/C1")
+
+    def testTable(self):
+        rule = Rule.parse("B36/S23")
+        table = rule.getTable()
+        assert len(table) == 18
+        assert [n for n in range(9) if table[CellState.DEAD * 9 + n]] == [3, 6]
+        assert [n for n in range(9) if table[CellState.ALIVE * 9 + n]] == [2, 3]
+        assert rule.next(CellState.ALIVE, 4) == CellState.DEAD
+
+    def testGenerationsRule(self):
+        rule = Rule.parse("Star Wars")
+        assert rule == Rule.parse("345/2/4") == Rule.parse("B2/S345/C4")
+        assert rule.getStates() == 4
+        assert str(rule) == "B2/S345/C4"
+        assert rule.next(CellState.ALIVE, 1) == 2
+        assert rule.next(CellState.ALIVE, 4) == CellState.ALIVE
+        assert rule.next(2, 2) == 3
+        assert rule.next(3, 2) == CellState.DEAD
+        assert rule.getDecay()[CellState.ALIVE] == 0
+        assert rule.getAging()[CellState.ALIVE] == CellState.ALIVE
+        assert Rule.parse("B3/S23").getDecay() is None
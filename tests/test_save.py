@@ -0,0 +1,103 @@
+import glob
+import os
+import time
+
+from gameoflife.autosave import Autosave
+from gameoflife.cell import CellState
+from gameoflife.save import BoardSnapshot, readSnapshot, writeSnapshot
+
+import pytest
+
+
+def _snapshot(generation:int = 0) -> BoardSnapshot:
+    cells = bytearray(4 * 3)
+    cells[1] = CellState.ALIVE
+    cells[4 + 2] = CellState.ALIVE
+    cells[8 + 3] = CellState.ALIVE
+    return BoardSnapshot(4, 3, generation, bytes(cells))
+
+
+class TestSave:
+    def testSnapshotSizeMismatchRaises(self):
+        with pytest.raises(ValueError):
+            BoardSnapshot(4, 3, 0, bytes(11))
+
+    def testSnapshotToDict(self):
+        data = _snapshot(7).toDict()
+        assert data["generation"] == 7
+        assert data["seed"] == ["0100", "0010", "0001"]
+        assert data["rule"] == "B3/S23"
+        assert BoardSnapshot.fromDict(dict(data, rule="B2/S")).getRule() == "B2/S"
+
+    def testMultiStateRoundTrip(self):
+        snapshot = BoardSnapshot(3, 1, 0, bytes([0, 2, 11]), "B2/S/C12")
+        data = snapshot.toDict()
+        assert data["seed"] == ["02b"]
+        assert BoardSnapshot.fromDict(data).getCells() == snapshot.getCells()
+
+    def testWriteReadRoundTrip(self, tmp_path):
+        path = str(tmp_path / "board.json.gz")
+        snapshot = _snapshot(12)
+        written = writeSnapshot(path, snapshot)
+        assert written == os.path.getsize(path)
+
+        loaded = readSnapshot(path)
+        assert loaded.getCols() == 4
+        assert loaded.getRows() == 3
+        assert loaded.getGeneration() == 12
+        assert loaded.getCells() == snapshot.getCells()
+        assert not glob.glob(str(tmp_path / ".tmp-*"))
+
+
+class TestAutosave:
+    def testSubmitWritesAndPrunes(self, tmp_path):
+        autosave = Autosave(str(tmp_path), interval=0, retention=2)
+        for generation in range(4):
+            cells = bytearray(12)
+            cells[generation] = CellState.ALIVE
+            snapshot = BoardSnapshot(4, 3, generation, bytes(cells))
+            while not autosave.submit(snapshot):
+                pass
+        autosave.close()
+
+        stats = autosave.stats()
+        assert stats["saves"] == 4
+        assert stats["lastBytes"] > 0
+        assert stats["totalBytes"] >= stats["lastBytes"]
+        assert len(glob.glob(str(tmp_path / "autosave-*.json.gz"))) == 2
+
+    def testUnchangedBoardIsNotResubmitted(self, tmp_path):
+        autosave = Autosave(str(tmp_path), interval=0)
+        assert autosave.submit(_snapshot())
+        assert not autosave.submit(_snapshot())
+        autosave.close()
+        assert autosave.stats()["saves"] == 1
+
+    def testWriterSurvivesAnyError(self, tmp_path, monkeypatch):
+        import gameoflife.autosave
+
+        calls = []
+
+        def write(path, snapshot, compresslevel):
+            calls.append(path)
+            if len(calls) == 1:
+                raise TypeError("cannot encode")
+            return writeSnapshot(path, snapshot, compresslevel)
+
+        monkeypatch.setattr(gameoflife.autosave, "writeSnapshot", write)
+        autosave = Autosave(str(tmp_path), interval=0)
+        for generation in (1, 2):
+            cells = bytearray(12)
+            cells[generation] = CellState.ALIVE
+            while not autosave.submit(BoardSnapshot(4, 3, generation, bytes(cells))):
+                pass
+        deadline = time.monotonic() + 5
+        while autosave.stats()["saves"] + autosave.stats()["errors"] < 2:
+            assert time.monotonic() < deadline, "the writer stopped taking snapshots"
+            time.sleep(0.01)
+        autosave.close()
+
+        stats = autosave.stats()
+        assert stats["errors"] == 1
+        assert stats["lastError"] == "TypeError: cannot encode"
+        assert stats["saves"] == 1
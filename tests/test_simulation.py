@@ -0,0 +1,213 @@
+from gameoflife.cell import CellState
+from gameoflife.cycle import CycleDetector, CycleType
+from gameoflife.rule import Rule
+from gameoflife.save import BoardSnapshot
+from gameoflife.simulation import Simulation
+from gameoflife.timeline import Timeline
+from gameoflife.topology import Topology, wrap
+
+import pytest
+
+
+def _reference(cells:bytes, cols:int, rows:int, rule:Rule, topology:str = Topology.DEAD) -> bytes:
+    out = bytearray(len(cells))
+    for y in range(rows):
+        for x in range(cols):
+            n = 0
+            for (dx, dy) in ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+                point = wrap(topology, x + dx, y + dy, cols, rows)
+                if point and cells[point[1] * cols + point[0]] == CellState.ALIVE:
+                    n += 1
+            out[y * cols + x] = rule.next(cells[y * cols + x], n)
+    return bytes(out)
+
+
+def _alive(sim:Simulation):
+    return sorted((x, y) for y in range(sim.getRows()) for x in range(sim.getCols()) if sim.getState(x, y))
+
+
+class TestSimulation:
+    def testBlinker(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)])
+        births, deaths = sim.step()
+        assert _alive(sim) == [(2, 1), (2, 2), (2, 3)]
+        assert sorted(births) == [1 * 5 + 2, 3 * 5 + 2]
+        assert sorted(deaths) == [2 * 5 + 1, 2 * 5 + 3]
+        assert sim.getGeneration() == 1
+        assert sim.getPopulation() == 3
+        assert sim.getBirths() == 2
+        assert sim.getDeaths() == 2
+
+    def testGliderMoves(self, aliveBoard):
+        sim = aliveBoard(10, 10, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)])
+        sim.run(4)
+        assert _alive(sim) == [(1, 3), (2, 1), (2, 3), (3, 2), (3, 3)]
+
+    def testEdgesAreDead(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(0, 0), (4, 0), (0, 4)])
+        sim.step()
+        assert sim.getPopulation() == 0
+
+    def testAlternateRule(self, aliveBoard):
+        # Under B2/S every live cell dies and a lone pair seeds new cells.
+        sim = aliveBoard(5, 5, [(1, 2), (3, 2)], rule=Rule.parse("B2/S"))
+        sim.step()
+        assert _alive(sim) == [(2, 1), (2, 2), (2, 3)]
+
+    def testMatchesReference(self, soupBoard):
+        for name in ("B3/S23", "B36/S23", "B2/S/C3", "B2/S345/C4"):
+            rule = Rule.parse(name)
+            sim = soupBoard(17, 11, 3, rule=rule)
+            for _ in range(6):
+                expected = _reference(bytes(sim.getCells()), 17, 11, rule)
+                sim.step()
+                assert bytes(sim.getCells()) == expected, name
+                assert sim.getPopulation() == expected.count(CellState.ALIVE)
+
+    def testTopologiesMatchReference(self, soupBoard):
+        rule = Rule.parse("B3/S23")
+        for (seed, topology) in enumerate(Topology.ALL):
+            sim = soupBoard(9, 7, seed, rule=rule, topology=topology)
+            for _ in range(6):
+                expected = _reference(bytes(sim.getCells()), 9, 7, rule, topology)
+                sim.step()
+                assert bytes(sim.getCells()) == expected, topology
+
+    def testGliderWrapsOnTorus(self, aliveBoard):
+        glider = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
+        sim = aliveBoard(6, 6, glider, topology=Topology.TORUS)
+        sim.run(24)
+        assert _alive(sim) == sorted(glider)
+        assert sim.getPopulation() == 5
+        assert sim.snapshot().getTopology() == Topology.TORUS
+
+    def testUnknownTopology(self):
+        with pytest.raises(ValueError):
+            Simulation(3, 3, topology="sphere")
+
+    def testGenerationsSeek(self, aliveBoard):
+        rule = Rule.parse("B2/S345/C4")
+        sim = aliveBoard(12, 12, [(5, 5), (6, 5), (5, 6), (7, 7)], rule=rule, timeline=Timeline(keyframeInterval=4))
+        history = []
+        for _ in range(9):
+            history.append(bytes(sim.getCells()))
+            sim.step()
+        for generation in (1, 3, 6, 8):
+            assert sim.seek(generation)
+            assert bytes(sim.getCells()) == history[generation]
+
+    def testSnapshotKeepsRule(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2)], rule=Rule.parse("B36/S23"))
+        snapshot = sim.snapshot()
+        assert snapshot.getRule() == "B36/S23"
+        other = Simulation(5, 5)
+        other.restore(snapshot)
+        assert str(other.getRule()) == "B36/S23"
+
+    def testSetStateOutOfBounds(self):
+        sim = Simulation(3, 3)
+        assert not sim.setState(3, 0, CellState.ALIVE)
+        assert not sim.setState(-1, 0, CellState.ALIVE)
+        assert sim.getState(-1, 0) == CellState.DEAD
+
+    def testSnapshotRestore(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)])
+        sim.step()
+        snapshot = sim.snapshot()
+        sim.step()
+        sim.restore(snapshot)
+        assert sim.getGeneration() == 1
+        assert _alive(sim) == [(2, 1), (2, 2), (2, 3)]
+
+        with pytest.raises(ValueError):
+            Simulation(4, 4).restore(snapshot)
+
+    def testSetRuleClearsStatesPastTheRule(self, aliveBoard):
+        # A lone cell dies into the last state of B2/S/C4 and is left over
+        # when the board switches to a rule with fewer states.
+        sim = aliveBoard(5, 5, [(2, 2)], rule=Rule.parse("B2/S/C4"))
+        sim.step()
+        assert sim.getState(2, 2) == 2
+        sim.setRule(Rule.parse("B3/S23"))
+        assert list(sim.getCells()) == [CellState.DEAD] * 25
+        for engine in ("rows", "sparse", "counts", "auto"):
+            sim = aliveBoard(5, 5, [(2, 2)], rule=Rule.parse("B2/S/C4"), engine=engine)
+            sim.step()
+            sim.setRule(Rule.parse("B2/S/C3"))
+            assert sim.getState(2, 2) == 2
+            sim.setRule(Rule.parse("B3/S23"))
+            sim.step()
+            assert set(sim.getCells()) == {CellState.DEAD}, engine
+
+    def testRestoreRejectsStatesPastTheRule(self):
+        cells = bytearray(9)
+        cells[4] = 2
+        with pytest.raises(ValueError):
+            Simulation(3, 3).restore(BoardSnapshot(3, 3, 0, bytes(cells), "B3/S23"))
+        sim = Simulation(3, 3)
+        sim.restore(BoardSnapshot(3, 3, 0, bytes(cells), "B2/S/C3"))
+        assert sim.getState(1, 1) == 2
+
+    def testSeek(self, aliveBoard):
+        sim = aliveBoard(10, 10, [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)], timeline=Timeline(keyframeInterval=3))
+        sim.run(8)
+        expected = sim.snapshot().getCells()
+        assert sim.seek(2)
+        sim.run(6)
+        assert sim.snapshot().getCells() == expected
+        assert not sim.seek(100)
+
+    def testCycleAndFastForward(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)], cycleDetector=CycleDetector(5, 5))
+        sim.run(2)
+        assert sim.cycle().getType() == CycleType.OSCILLATOR
+        assert sim.fastForward(1001)
+        assert sim.getGeneration() == 1001
+        assert _alive(sim) == [(2, 1), (2, 2), (2, 3)]
+
+    def testVersionTracksCellChanges(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)])
+        version = sim.getVersion()
+        assert not sim.setState(1, 2, CellState.ALIVE)
+        assert sim.getVersion() == version
+        sim.step()
+        assert sim.getVersion() != version
+        version = sim.getVersion()
+        sim.clear()
+        assert sim.getVersion() != version
+
+    def testClear(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)])
+        sim.step()
+        sim.clear()
+        assert sim.getGeneration() == 0
+        assert sim.getPopulation() == 0
+        assert _alive(sim) == []
+
+    def testIterGenerations(self, aliveBoard):
+        sim = aliveBoard(5, 5, [(1, 2), (2, 2), (3, 2)])
+        deltas = sim.iterGenerations()
+        delta = next(deltas)
+        assert delta.getGeneration() == 1
+        assert list(delta.getBirths()) == [7, 17]
+        assert list(delta.getDeaths()) == [11, 13]
+        assert [list(a) for a in delta.birthCoordinates()] == [[2, 2], [1, 3]]
+        assert [list(a) for a in delta.deathCoordinates()] == [[1, 3], [2, 2]]
+        assert not delta.isEdited()
+        assert not next(deltas).isEdited()
+
+        sim.setState(0, 0, CellState.ALIVE)
+        delta = next(deltas)
+        assert delta.isEdited()
+        assert delta.getGeneration() == 3 == sim.getGeneration()
+        assert list(sim.iterGenerations(2)) and sim.getGeneration() == 5
+
+    def testIterGenerationsReplays(self, soupBoard):
+        sim = soupBoard(16, 16, 9, density=0.35)
+        cells = bytearray(sim.getCells())
+        for delta in sim.iterGenerations(20):
+            for pos in delta.getBirths():
+                cells[pos] = CellState.ALIVE
+            for pos in delta.getDeaths():
+                cells[pos] = CellState.DEAD
+            assert cells == sim.getCells()
@@ -0,0 +1,57 @@
+import json
+
+from gameoflife.soup import SoupParams, readResults, runSoup, search, soupSeed
+
+import pytest
+
+
+def _params(**kwargs) -> SoupParams:
+    values = dict(seed=7, size=8, density=0.4, board=32, maxGenerations=500, keep=0)
+    values.update(kwargs)
+    return SoupParams(**values)
+
+
+class TestSoup:
+    def testSoupsAreReproducible(self):
+        params = _params()
+        assert soupSeed(params, 3) == soupSeed(params, 3)
+        assert soupSeed(params, 3) != soupSeed(params, 4)
+        assert runSoup(params, 3)["lifespan"] == runSoup(params, 3)["lifespan"]
+
+    def testRunSoup(self):
+        result = runSoup(_params(keep=1), 0)
+        assert result["status"] in ("still", "oscillator", "extinct", "spaceship", "capped")
+        assert result["peakPopulation"] >= result["initialPopulation"]
+        assert result["peakPopulation"] >= result["finalPopulation"]
+        assert len(result["seed"]) == 8
+
+    def testSearchAndResume(self, tmp_path):
+        path = str(tmp_path / "soups.jsonl")
+        params = _params()
+        counts = search(params, 6, path, processes=2, progress=False)
+        assert counts["ran"] == 6
+
+        with open(path, "a") as file:
+            file.write('{"soup": 9, "sta')
+        counts = search(params, 10, path, processes=2, progress=False)
+        assert counts["done"] == 6
+        assert counts["ran"] == 4
+        assert sorted(result["soup"] for result in readResults(path)) == list(range(10))
+        with open(path) as file:
+            assert json.loads(file.readline())["params"] == params.toDict()
+
+    def testResumeRejectsOtherParams(self, tmp_path):
+        path = str(tmp_path / "soups.jsonl")
+        search(_params(), 2, path, processes=1, progress=False)
+        with pytest.raises(ValueError):
+            search(_params(density=0.3), 2, path, processes=1, progress=False)
+
+    def testSearchWithCensusAfterRunningInProcess(self, tmp_path):
+        # The auto engine may have started a thread pool in this process;
+        # workers must still come up and run.
+        params = _params(census=True)
+        runSoup(params, 0)
+        path = str(tmp_path / "soups.jsonl")
+        counts = search(params, 4, path, processes=2, progress=False)
+        assert counts["ran"] == 4
+        assert all("census" in result for result in readResults(path))
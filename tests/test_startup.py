@@ -0,0 +1,14 @@
+from gameoflife.startup import StartupProfile
+
+
+class TestStartupProfile:
+    def testPhases(self):
+        profile = StartupProfile()
+        profile.mark("imports")
+        profile.mark("display")
+        names = [name for (name, _) in profile.getPhases()]
+        assert names == ["imports", "display"]
+        assert profile.total() == sum(seconds for (_, seconds) in profile.getPhases())
+        report = profile.report().splitlines()
+        assert report[0].startswith("imports")
+        assert report[-1].startswith("total")
@@ -0,0 +1,94 @@
+from gameoflife.cell import CellState
+from gameoflife.rule import Rule
+from gameoflife.simulation import Simulation
+from gameoflife.tiles import TiledBoard
+
+import os
+import pytest
+import random
+
+
+GLIDER = ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2))
+
+
+class TestTiledBoard:
+    def testMatchesSimulation(self, tmp_path):
+        # The board is not a whole number of tiles and only a few tiles fit
+        # in memory, so tiles are paged in and out all the time.
+        for name in ("B3/S23", "B2/S345/C4"):
+            rule = Rule.parse(name)
+            sim = Simulation(30, 21, rule=rule)
+            board = TiledBoard(30, 21, str(tmp_path / name.replace("/", "")), tileSize=8, maxResident=3, rule=rule)
+            rng = random.Random(1)
+            for _ in range(250):
+                (x, y) = (rng.randrange(30), rng.randrange(21))
+                sim.setState(x, y, CellState.ALIVE)
+                board.setState(x, y, CellState.ALIVE)
+            for _ in range(30):
+                sim.step()
+                board.step()
+                assert board.region(0, 0, 30, 21) == sim.getCells(), name
+                assert board.getPopulation() == sim.getPopulation()
+            assert board.getStore().stats()["evictions"] > 0
+
+    def testEmptyTilesElided(self, tmp_path):
+        board = TiledBoard(64, 64, str(tmp_path / "board"), tileSize=8)
+        for (x, y) in GLIDER:
+            board.setState(x, y, CellState.ALIVE)
+        for _ in range(120):
+            board.step()
+        board.flush()
+        # The glider has left the corner behind; only the tiles it is in now
+        # are kept, and quiet tiles are not stepped.
+        assert board.getPopulation() == 5
+        assert len(board.getStore().tiles()) <= 4
+        assert board.getActiveTiles() <= 16
+        assert [(x, y) for (x, y) in GLIDER if board.getState(x + 30, y + 30)] == list(GLIDER)
+
+    def testReopen(self, tmp_path):
+        path = str(tmp_path / "board")
+        board = TiledBoard(40, 40, path, tileSize=16)
+        for (x, y) in GLIDER:
+            board.setState(x + 10, y + 10, CellState.ALIVE)
+        board.step()
+        cells = board.region(0, 0, 40, 40)
+        board.close()
+        board = TiledBoard.open(path)
+        assert board.getGeneration() == 1
+        assert board.getPopulation() == 5
+        assert board.region(0, 0, 40, 40) == cells
+        board.step()
+        assert board.getPopulation() == 5
+
+    def testHugeBoard(self, tmp_path):
+        path = str(tmp_path / "huge")
+        board = TiledBoard(200000, 200000, path, maxResident=16)
+        for (x, y) in GLIDER:
+            board.setState(100000 + x, 100000 + y, CellState.ALIVE)
+        for _ in range(8):
+            board.step()
+        board.close()
+        assert board.getPopulation() == 5
+        assert os.path.getsize(path) < 4 * 1024 * 1024
+
+    def testRejectsBirthOnZero(self, tmp_path):
+        with pytest.raises(ValueError):
+            TiledBoard(10, 10, str(tmp_path / "board"), rule=Rule.parse("B0/S8"))
+
+    def testClear(self, tmp_path):
+        path = str(tmp_path / "board")
+        board = TiledBoard(40, 40, path, tileSize=8)
+        for (x, y) in GLIDER:
+            board.setState(x + 20, y + 20, CellState.ALIVE)
+        board.step()
+        board.flush()
+        version = board.getVersion()
+        board.clear()
+        assert board.getVersion() != version
+        assert board.getPopulation() == 0
+        assert board.getGeneration() == 0
+        assert not board.getStore().tiles()
+        assert board.region(0, 0, 40, 40) == bytes(40 * 40)
+        board.setState(1, 1, CellState.ALIVE)
+        board.close()
+        assert TiledBoard.open(path).region(0, 0, 3, 3) == bytes([0, 0, 0, 0, 1, 0, 0, 0, 0])
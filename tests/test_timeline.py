@@ -0,0 +1,51 @@
+from gameoflife.timeline import Timeline
+
+import pytest
+
+
+def _blinker(generation:int) -> bytes:
+    # 3x3 blinker flattened row by row, vertical on even generations.
+    cells = bytearray(9)
+    for pos in ([1, 4, 7] if generation % 2 == 0 else [3, 4, 5]):
+        cells[pos] = 1
+    return bytes(cells)
+
+
+def _run(timeline:Timeline, generations:int) -> None:
+    timeline.keyframe(0, _blinker(0))
+    for generation in range(1, generations + 1):
+        prev, curr = _blinker(generation - 1), _blinker(generation)
+        births = [pos for pos in range(9) if curr[pos] and not prev[pos]]
+        deaths = [pos for pos in range(9) if prev[pos] and not curr[pos]]
+        timeline.record(generation, births, deaths, lambda: _blinker(generation))
+
+
+class TestTimeline:
+    def testSeekEveryGeneration(self):
+        timeline = Timeline(keyframeInterval=4)
+        _run(timeline, 10)
+        assert timeline.firstGeneration() == 0
+        assert timeline.lastGeneration() == 10
+        for generation in range(11):
+            assert timeline.seek(generation) == _blinker(generation)
+
+    def testSeekOutsideHistoryRaises(self):
+        timeline = Timeline()
+        _run(timeline, 3)
+        with pytest.raises(KeyError):
+            timeline.seek(4)
+
+    def testRecordAfterRewindTruncates(self):
+        timeline = Timeline(keyframeInterval=4)
+        _run(timeline, 10)
+        timeline.record(6, [], [], lambda: _blinker(0))
+        assert timeline.lastGeneration() == 6
+        assert timeline.seek(6) == _blinker(5)
+
+    def testEvictsOldestSegments(self):
+        timeline = Timeline(keyframeInterval=2, maxBytes=40)
+        _run(timeline, 20)
+        assert timeline.nbytes() <= 40
+        assert timeline.firstGeneration() > 0
+        assert timeline.lastGeneration() == 20
+        assert timeline.seek(20) == _blinker(20)